@@ -1,11 +1,14 @@
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 import asyncio
 import time
+from datetime import datetime
 from typing import Optional, Dict, Any
 import logging
+import numpy as np
+import orjson
 from data_fetcher import data_fetcher
 from strategy import strategy
 from config import Config
@@ -14,10 +17,31 @@ from config import Config
 logging.basicConfig(level=getattr(logging, Config.LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
+def _orjson_default(obj):
+    """Serialize datetime subclasses (e.g. pandas Timestamp) orjson rejects"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError
+
+def _dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson"""
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+    )
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (numpy scalars and datetimes included)"""
+    
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
 app = FastAPI(
     title="Trading Signals API",
     description="Real-time trading signals based on technical analysis",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -29,13 +53,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Cache for signals
+# Cache for signals (serialized response body, monotonic timestamp)
+SIGNAL_CACHE_TTL = Config.CACHE_DURATION
 signal_cache = {
     'data': None,
-    'timestamp': 0,
-    'ttl': Config.CACHE_DURATION
+    'timestamp': 0.0
 }
 
+# Single-flight guard so concurrent cache misses compute the signal once
+_signal_lock = asyncio.Lock()
+
+def _signal_cache_fresh() -> bool:
+    """Check whether the cached signal body is still within its TTL"""
+    return (signal_cache['data'] is not None and
+            time.monotonic() - signal_cache['timestamp'] < SIGNAL_CACHE_TTL)
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Wrap an already-serialized JSON body without re-encoding it"""
+    return Response(content=body, media_type="application/json")
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize data fetcher and start background tasks"""
@@ -45,23 +81,44 @@ async def startup_event():
         
         # Initial data fetch
         await data_fetcher.fetch_candles()
+        
+        # Start background data update task
+        app.state.bg_task = asyncio.create_task(update_data_background())
         logger.info("API startup completed successfully")
         
     except Exception as e:
-        logger.error(f"Error during startup: {e}")
+        logger.error("Error during startup: %s", e)
         raise
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks"""
+    bg_task = getattr(app.state, 'bg_task', None)
+    if bg_task is not None:
+        bg_task.cancel()
+        try:
+            await bg_task
+        except asyncio.CancelledError:
+            pass
+    
+    await data_fetcher.aclose()
+
 async def update_data_background():
     """Background task to update market data"""
+    interval = Config.DATA_FETCH_INTERVAL
+    delay = 1
     while True:
         try:
             await data_fetcher.fetch_candles()
             # Clear cache when new data arrives
-            signal_cache['timestamp'] = 0
-            await asyncio.sleep(Config.DATA_FETCH_INTERVAL)
+            signal_cache['data'] = None
+            delay = 1
+            await asyncio.sleep(interval)
         except Exception as e:
-            logger.error(f"Error in background data update: {e}")
-            await asyncio.sleep(60)
+            # Back off exponentially (capped at 5 minutes) on repeated failures
+            delay = min(delay * 2, 300)
+            logger.error("Error in background data update: %s (retrying in %ss)", e, delay)
+            await asyncio.sleep(delay)
 
 @app.get("/")
 async def root():
@@ -87,53 +144,59 @@ async def get_signal():
     """
     try:
         # Check cache first
-        current_time = time.time()
-        if (signal_cache['data'] and 
-            current_time - signal_cache['timestamp'] < signal_cache['ttl']):
-            return signal_cache['data']
+        if _signal_cache_fresh():
+            return _json_bytes_response(signal_cache['data'])
         
-        # Get current market data
-        df = data_fetcher.get_current_data()
-        if df is None or df.empty:
-            raise HTTPException(status_code=503, detail="No market data available")
-        
-        # Generate signal
-        signal_data = strategy.get_latest_signal(df)
-        
-        if signal_data is None:
-            response = {
-                "pair": Config.CURRENCY_PAIR,
-                "timeframe": Config.TIMEFRAME,
-                "signal": None,
-                "message": "No signal generated",
-                "timestamp": current_time
-            }
-        else:
-            response = {
-                "pair": signal_data['pair'],
-                "timeframe": signal_data['timeframe'],
-                "signal": signal_data['signal'],
-                "strength": round(signal_data['strength'], 3),
-                "reason": signal_data['reason'],
-                "price": round(signal_data['price'], 5),
-                "indicators": {
-                    "rsi": round(signal_data['rsi'], 2),
-                    "macd": round(signal_data['macd'], 6),
-                    "macd_signal": round(signal_data['macd_signal'], 6),
-                    "macd_hist": round(signal_data['macd_hist'], 6)
-                },
-                "timestamp": signal_data['timestamp'].isoformat(),
-                "generated_at": current_time
-            }
-        
-        # Update cache
-        signal_cache['data'] = response
-        signal_cache['timestamp'] = current_time
+        async with _signal_lock:
+            # Another request may have refreshed the cache while we waited
+            if _signal_cache_fresh():
+                return _json_bytes_response(signal_cache['data'])
+            
+            current_time = time.time()
+            
+            # Get current market data
+            df = data_fetcher.get_current_data()
+            if df is None or df.empty:
+                raise HTTPException(status_code=503, detail="No market data available")
+            
+            # Generate signal
+            signal_data = strategy.get_latest_signal(df)
+            
+            if signal_data is None:
+                response = {
+                    "pair": Config.CURRENCY_PAIR,
+                    "timeframe": Config.TIMEFRAME,
+                    "signal": None,
+                    "message": "No signal generated",
+                    "timestamp": current_time
+                }
+            else:
+                response = {
+                    "pair": signal_data['pair'],
+                    "timeframe": signal_data['timeframe'],
+                    "signal": signal_data['signal'],
+                    "strength": signal_data['strength'],
+                    "reason": signal_data['reason'],
+                    "price": signal_data['price'],
+                    "indicators": {
+                        "rsi": signal_data['rsi'],
+                        "macd": signal_data['macd'],
+                        "macd_signal": signal_data['macd_signal'],
+                        "macd_hist": signal_data['macd_hist']
+                    },
+                    "timestamp": signal_data['timestamp'],
+                    "generated_at": current_time
+                }
+            
+            # Update cache
+            payload = _dumps(response)
+            signal_cache['data'] = payload
+            signal_cache['timestamp'] = time.monotonic()
         
-        return response
+        return _json_bytes_response(payload)
         
     except Exception as e:
-        logger.error(f"Error generating signal: {e}")
+        logger.error("Error generating signal: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/health")
@@ -147,8 +210,9 @@ async def health_check():
         # Check latest data age
         latest_data_age = None
         if data_available:
-            latest_time = df.index[-1]
-            latest_data_age = (time.time() - latest_time.timestamp()) / 60  # minutes
+            # Epoch seconds straight from the datetime64 index (no Timestamp box)
+            latest_epoch = int(df.index.values[-1].astype('datetime64[s]').astype(np.int64))
+            latest_data_age = (time.time() - latest_epoch) / 60  # minutes
         
         return {
             "status": "healthy" if data_available else "degraded",
@@ -158,7 +222,7 @@ async def health_check():
         }
         
     except Exception as e:
-        logger.error(f"Health check error: {e}")
+        logger.error("Health check error: %s", e)
         return {
             "status": "unhealthy",
             "error": str(e),
@@ -178,130 +242,136 @@ async def get_status():
             }
         
         # Calculate basic statistics
-        latest_price = df['close'].iloc[-1]
-        price_change_24h = ((latest_price - df['close'].iloc[0]) / df['close'].iloc[0]) * 100
+        closes = df['close'].to_numpy()
+        latest_price = float(closes[-1])
+        first_price = float(closes[0])
+        price_change_24h = ((latest_price - first_price) / first_price) * 100
         
         return {
             "status": "active",
             "pair": Config.CURRENCY_PAIR,
             "timeframe": Config.TIMEFRAME,
             "data_points": len(df),
-            "latest_price": round(latest_price, 5),
-            "price_change_24h_pct": round(price_change_24h, 3),
+            "latest_price": latest_price,
+            "price_change_24h_pct": price_change_24h,
             "data_range": {
-                "start": df.index[0].isoformat(),
-                "end": df.index[-1].isoformat()
+                "start": df.index[0],
+                "end": df.index[-1]
             },
             "last_update": time.time()
         }
         
     except Exception as e:
-        logger.error(f"Status error: {e}")
+        logger.error("Status error: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/dashboard", response_class=HTMLResponse)
-async def dashboard():
-    """Simple web dashboard"""
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Trading Signals Dashboard</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 40px; }
-            .container { max-width: 800px; margin: 0 auto; }
-            .signal-box { 
-                padding: 20px; 
-                border: 2px solid #ddd; 
-                border-radius: 8px; 
-                margin: 20px 0;
-                background-color: #f9f9f9;
-            }
-            .signal-call { border-color: #4CAF50; background-color: #e8f5e8; }
-            .signal-put { border-color: #f44336; background-color: #fde8e8; }
-            .signal-none { border-color: #999; background-color: #f0f0f0; }
-            .refresh-btn {
-                background-color: #2196F3;
-                color: white;
-                padding: 10px 20px;
-                border: none;
-                border-radius: 4px;
-                cursor: pointer;
-                margin: 10px 0;
-            }
-            .refresh-btn:hover { background-color: #1976D2; }
-        </style>
-        <script>
-            async function refreshSignal() {
-                try {
-                    const response = await fetch('/signal');
-                    const data = await response.json();
-                    updateSignalDisplay(data);
-                } catch (error) {
-                    console.error('Error fetching signal:', error);
-                }
-            }
-            
-            function updateSignalDisplay(data) {
-                const signalBox = document.getElementById('signal-box');
-                const signalType = data.signal || 'none';
-                
-                signalBox.className = `signal-box signal-${signalType.toLowerCase()}`;
-                
-                document.getElementById('signal-content').innerHTML = `
-                    <h2>Latest Signal: ${data.signal || 'No Signal'}</h2>
-                    <p><strong>Pair:</strong> ${data.pair}</p>
-                    <p><strong>Timeframe:</strong> ${data.timeframe}</p>
-                    <p><strong>Price:</strong> ${data.price || 'N/A'}</p>
-                    <p><strong>Strength:</strong> ${data.strength || 'N/A'}</p>
-                    <p><strong>Reason:</strong> ${data.reason || 'N/A'}</p>
-                    <p><strong>Timestamp:</strong> ${data.timestamp || new Date().toISOString()}</p>
-                `;
+# Dashboard page, encoded once at import
+_DASHBOARD_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Trading Signals Dashboard</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .container { max-width: 800px; margin: 0 auto; }
+        .signal-box { 
+            padding: 20px; 
+            border: 2px solid #ddd; 
+            border-radius: 8px; 
+            margin: 20px 0;
+            background-color: #f9f9f9;
+        }
+        .signal-call { border-color: #4CAF50; background-color: #e8f5e8; }
+        .signal-put { border-color: #f44336; background-color: #fde8e8; }
+        .signal-none { border-color: #999; background-color: #f0f0f0; }
+        .refresh-btn {
+            background-color: #2196F3;
+            color: white;
+            padding: 10px 20px;
+            border: none;
+            border-radius: 4px;
+            cursor: pointer;
+            margin: 10px 0;
+        }
+        .refresh-btn:hover { background-color: #1976D2; }
+    </style>
+    <script>
+        async function refreshSignal() {
+            try {
+                const response = await fetch('/signal');
+                const data = await response.json();
+                updateSignalDisplay(data);
+            } catch (error) {
+                console.error('Error fetching signal:', error);
             }
+        }
+        
+        function updateSignalDisplay(data) {
+            const signalBox = document.getElementById('signal-box');
+            const signalType = data.signal || 'none';
             
-            // Auto-refresh every 30 seconds
-            setInterval(refreshSignal, 30000);
-            
-            // Initial load
-            window.onload = refreshSignal;
-        </script>
-    </head>
-    <body>
-        <div class="container">
-            <h1>Trading Signals Dashboard</h1>
-            <button class="refresh-btn" onclick="refreshSignal()">Refresh Signal</button>
-            
-            <div id="signal-box" class="signal-box">
-                <div id="signal-content">
-                    <p>Loading...</p>
-                </div>
-            </div>
+            signalBox.className = `signal-box signal-${signalType.toLowerCase()}`;
             
-            <div>
-                <h3>API Endpoints:</h3>
-                <ul>
-                    <li><a href="/signal" target="_blank">/signal</a> - Get latest signal (JSON)</li>
-                    <li><a href="/health" target="_blank">/health</a> - Health check</li>
-                    <li><a href="/status" target="_blank">/status</a> - System status</li>
-                    <li><a href="/docs" target="_blank">/docs</a> - API documentation</li>
-                </ul>
+            document.getElementById('signal-content').innerHTML = `
+                <h2>Latest Signal: ${data.signal || 'No Signal'}</h2>
+                <p><strong>Pair:</strong> ${data.pair}</p>
+                <p><strong>Timeframe:</strong> ${data.timeframe}</p>
+                <p><strong>Price:</strong> ${data.price || 'N/A'}</p>
+                <p><strong>Strength:</strong> ${data.strength || 'N/A'}</p>
+                <p><strong>Reason:</strong> ${data.reason || 'N/A'}</p>
+                <p><strong>Timestamp:</strong> ${data.timestamp || new Date().toISOString()}</p>
+            `;
+        }
+        
+        // Auto-refresh every 30 seconds
+        setInterval(refreshSignal, 30000);
+        
+        // Initial load
+        window.onload = refreshSignal;
+    </script>
+</head>
+<body>
+    <div class="container">
+        <h1>Trading Signals Dashboard</h1>
+        <button class="refresh-btn" onclick="refreshSignal()">Refresh Signal</button>
+        
+        <div id="signal-box" class="signal-box">
+            <div id="signal-content">
+                <p>Loading...</p>
             </div>
         </div>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=html_content)
+        
+        <div>
+            <h3>API Endpoints:</h3>
+            <ul>
+                <li><a href="/signal" target="_blank">/signal</a> - Get latest signal (JSON)</li>
+                <li><a href="/health" target="_blank">/health</a> - Health check</li>
+                <li><a href="/status" target="_blank">/status</a> - System status</li>
+                <li><a href="/docs" target="_blank">/docs</a> - API documentation</li>
+            </ul>
+        </div>
+    </div>
+</body>
+</html>
+""".encode()
+
+@app.get("/dashboard", response_class=HTMLResponse)
+async def dashboard():
+    """Simple web dashboard"""
+    return HTMLResponse(
+        content=_DASHBOARD_HTML,
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 if __name__ == "__main__":
     import uvicorn
     
-    # Start background data update task
-    asyncio.create_task(update_data_background())
-    
     uvicorn.run(
         "api:app",
         host=Config.API_HOST,
         port=Config.API_PORT,
         reload=True,
-        log_level=Config.LOG_LEVEL.lower()
+        log_level=Config.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools"
     )
@@ -3,23 +3,32 @@ import asyncio
 import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
+import numpy as np
 import pandas as pd
-import oandapyV20
-import oandapyV20.endpoints.instruments as instruments
+import httpx
+import orjson
 from config import Config
 
-logging.basicConfig(level=getattr(logging, Config.LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
+# Oanda v20 REST hosts per environment
+OANDA_REST_URLS = {
+    'practice': 'https://api-fxpractice.oanda.com',
+    'live': 'https://api-fxtrade.oanda.com'
+}
+
 class OandaDataFetcher:
     """
     Fetches real-time market data from Oanda API
     """
     
     def __init__(self):
-        self.api = oandapyV20.API(
-            access_token=Config.OANDA_API_KEY,
-            environment=Config.OANDA_ENVIRONMENT
+        # Pooled async client for all Oanda REST calls (no executor hop per request)
+        self._client = httpx.AsyncClient(
+            base_url=OANDA_REST_URLS.get(Config.OANDA_ENVIRONMENT, OANDA_REST_URLS['practice']),
+            headers={"Authorization": f"Bearer {Config.OANDA_API_KEY}"},
+            http2=True,
+            timeout=10
         )
         self.current_data: Optional[pd.DataFrame] = None
         
@@ -42,42 +51,39 @@ class OandaDataFetcher:
                 "price": "M"  # Mid prices
             }
             
-            request = instruments.InstrumentsCandles(
-                instrument=Config.CURRENCY_PAIR,
+            r = await self._client.get(
+                f"/v3/instruments/{Config.CURRENCY_PAIR}/candles",
                 params=params
             )
+            r.raise_for_status()
+            response = orjson.loads(r.content)
             
-            # Execute request in thread to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, 
-                lambda: self.api.request(request)
-            )
-            
-            # Process candles data
-            candles_data = []
-            for candle in response['candles']:
-                if candle['complete']:
-                    candles_data.append({
-                        'time': pd.to_datetime(candle['time']),
-                        'open': float(candle['mid']['o']),
-                        'high': float(candle['mid']['h']),
-                        'low': float(candle['mid']['l']),
-                        'close': float(candle['mid']['c']),
-                        'volume': int(candle['volume'])
-                    })
+            # Process candles data into columns (completed candles only)
+            cs = [c for c in response['candles'] if c['complete']]
+            n = len(cs)
+            times = pd.to_datetime([c['time'] for c in cs], utc=True)
             
-            df = pd.DataFrame(candles_data)
-            df.set_index('time', inplace=True)
-            df.sort_index(inplace=True)
+            df = pd.DataFrame(
+                {
+                    'open': np.fromiter((c['mid']['o'] for c in cs), dtype=np.float64, count=n),
+                    'high': np.fromiter((c['mid']['h'] for c in cs), dtype=np.float64, count=n),
+                    'low': np.fromiter((c['mid']['l'] for c in cs), dtype=np.float64, count=n),
+                    'close': np.fromiter((c['mid']['c'] for c in cs), dtype=np.float64, count=n),
+                    'volume': np.fromiter((c['volume'] for c in cs), dtype=np.int64, count=n)
+                },
+                index=times.rename('time')
+            )
+            # Candles normally arrive ordered; only sort when they don't
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
             
             self.current_data = df
-            logger.info(f"Fetched {len(df)} candles for {Config.CURRENCY_PAIR}")
+            logger.info("Fetched %d candles for %s", len(df), Config.CURRENCY_PAIR)
             
             return df
             
         except Exception as e:
-            logger.error(f"Error fetching candles: {e}")
+            logger.error("Error fetching candles: %s", e)
             raise
     
     async def get_latest_price(self) -> Dict[str, float]:
@@ -88,16 +94,12 @@ class OandaDataFetcher:
             Dictionary with current prices
         """
         try:
-            request = instruments.InstrumentsPricing(
-                accountID=Config.OANDA_ACCOUNT_ID,
+            r = await self._client.get(
+                f"/v3/accounts/{Config.OANDA_ACCOUNT_ID}/pricing",
                 params={"instruments": Config.CURRENCY_PAIR}
             )
-            
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.api.request(request)
-            )
+            r.raise_for_status()
+            response = orjson.loads(r.content)
             
             price_data = response['prices'][0]
             
@@ -110,9 +112,13 @@ class OandaDataFetcher:
             }
             
         except Exception as e:
-            logger.error(f"Error fetching latest price: {e}")
+            logger.error("Error fetching latest price: %s", e)
             raise
     
+    async def aclose(self):
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
+    
     def get_current_data(self) -> Optional[pd.DataFrame]:
         """Get current stored data"""
         return self.current_data
@@ -124,7 +130,10 @@ class OandaDataFetcher:
         Args:
             callback: Function to call when new data is available
         """
-        logger.info(f"Starting data stream for {Config.CURRENCY_PAIR} every {Config.DATA_FETCH_INTERVAL} seconds")
+        logger.info(
+            "Starting data stream for %s every %s seconds",
+            Config.CURRENCY_PAIR, Config.DATA_FETCH_INTERVAL
+        )
         
         while True:
             try:
@@ -136,7 +145,7 @@ class OandaDataFetcher:
                 await asyncio.sleep(Config.DATA_FETCH_INTERVAL)
                 
             except Exception as e:
-                logger.error(f"Error in data stream: {e}")
+                logger.error("Error in data stream: %s", e)
                 await asyncio.sleep(30)  # Wait 30 seconds before retry
 
 # Singleton instance
@@ -0,0 +1,251 @@
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True, fastmath=True, nogil=True)
+def quality_score_kernel(strength, mtf_pct, rr3, tf_weight):
+    """
+    Score signals (0-100) from parallel arrays of their components
+    
+    Weights: strength 30%, multi-timeframe confirmation 40%,
+    risk-reward (capped at 1:3) 20%, timeframe weight (capped at 3.0) 10%
+    """
+    out = (
+        strength * 30.0
+        + mtf_pct * 0.4
+        + np.minimum(rr3 / 3.0, 1.0) * 20.0
+        + np.minimum(tf_weight / 3.0, 1.0) * 10.0
+    )
+    return np.minimum(out, 100.0)
+
+@njit(cache=True, nogil=True)
+def _first_valid(x):
+    """Index of the first non-NaN element (len(x) when there is none)"""
+    for i in range(x.shape[0]):
+        if not np.isnan(x[i]):
+            return i
+    return x.shape[0]
+
+@njit(cache=True, nogil=True)
+def rolling_mean(x, n):
+    """Simple moving average; NaN wherever the trailing window of n holds a NaN"""
+    out = np.full_like(x, np.nan)
+    # Sum of the window's valid values and how many NaNs it holds
+    acc = 0.0
+    nans = 0
+    for i in range(x.shape[0]):
+        if np.isnan(x[i]):
+            nans += 1
+        else:
+            acc += x[i]
+        if i >= n:
+            if np.isnan(x[i - n]):
+                nans -= 1
+            else:
+                acc -= x[i - n]
+        if i >= n - 1 and nans == 0:
+            out[i] = acc / n
+    return out
+
+@njit(cache=True, nogil=True)
+def rolling_std(x, n):
+    """Population standard deviation over a trailing window of n"""
+    out = np.full_like(x, np.nan)
+    for i in range(n - 1, x.shape[0]):
+        mean = 0.0
+        for j in range(i - n + 1, i + 1):
+            mean += x[j]
+        mean /= n
+        var = 0.0
+        for j in range(i - n + 1, i + 1):
+            var += (x[j] - mean) * (x[j] - mean)
+        out[i] = np.sqrt(var / n)
+    return out
+
+@njit(cache=True, nogil=True)
+def _rolling_extreme(x, n, is_max):
+    """Rolling max (or min) over a trailing window of n using a monotonic index deque"""
+    size = x.shape[0]
+    out = np.full_like(x, np.nan)
+    dq = np.empty(size, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(size):
+        # Drop candidates the new value dominates
+        while tail > head and (x[dq[tail - 1]] <= x[i] if is_max else x[dq[tail - 1]] >= x[i]):
+            tail -= 1
+        dq[tail] = i
+        tail += 1
+        if dq[head] <= i - n:
+            head += 1
+        if i >= n - 1:
+            out[i] = x[dq[head]]
+    return out
+
+@njit(cache=True, nogil=True)
+def rolling_max(x, n):
+    """Highest value over a trailing window of n"""
+    return _rolling_extreme(x, n, True)
+
+@njit(cache=True, nogil=True)
+def rolling_min(x, n):
+    """Lowest value over a trailing window of n"""
+    return _rolling_extreme(x, n, False)
+
+@njit(cache=True, nogil=True)
+def _smoothed(x, n, alpha):
+    """Exponential recurrence seeded with the SMA of the first n valid values"""
+    out = np.full_like(x, np.nan)
+    start = _first_valid(x)
+    if x.shape[0] - start < n:
+        return out
+    acc = 0.0
+    for i in range(start, start + n):
+        acc += x[i]
+    prev = acc / n
+    out[start + n - 1] = prev
+    for i in range(start + n, x.shape[0]):
+        prev = prev + alpha * (x[i] - prev)
+        out[i] = prev
+    return out
+
+@njit(cache=True, nogil=True)
+def ema(x, n):
+    """Exponential moving average (alpha = 2 / (n + 1))"""
+    return _smoothed(x, n, 2.0 / (n + 1.0))
+
+@njit(cache=True, nogil=True)
+def rma(x, n):
+    """Wilder's moving average (alpha = 1 / n)"""
+    return _smoothed(x, n, 1.0 / n)
+
+@njit(cache=True, nogil=True)
+def rsi_wilder(close, n):
+    """RSI with Wilder smoothing of gains / losses, seeded with their first-n mean"""
+    size = close.shape[0]
+    out = np.full_like(close, np.nan)
+    start = _first_valid(close)
+    if size - start <= n:
+        return out
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(start + 1, start + n + 1):
+        change = close[i] - close[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= n
+    avg_loss /= n
+    total = avg_gain + avg_loss
+    out[start + n] = 100.0 * avg_gain / total if total > 0 else np.nan
+    for i in range(start + n + 1, size):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain += (gain - avg_gain) / n
+        avg_loss += (loss - avg_loss) / n
+        total = avg_gain + avg_loss
+        out[i] = 100.0 * avg_gain / total if total > 0 else np.nan
+    return out
+
+@njit(cache=True, nogil=True)
+def atr_wilder(high, low, close, n):
+    """ATR with Wilder smoothing of the true range, seeded with its first-n mean"""
+    size = close.shape[0]
+    out = np.full_like(close, np.nan)
+    start = _first_valid(close)
+    if size - start <= n:
+        return out
+    atr = 0.0
+    for i in range(start + 1, start + n + 1):
+        atr += max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+    atr /= n
+    out[start + n] = atr
+    for i in range(start + n + 1, size):
+        true_range = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        atr += (true_range - atr) / n
+        out[i] = atr
+    return out
+
+def warm_up():
+    """Compile (or load cached) kernels so the first real call doesn't pay for it"""
+    for dtype in (np.float32, np.float64):
+        x = np.ones(2, dtype=dtype)
+        for fn in (rolling_mean, rolling_std, rolling_max, rolling_min, ema, rma):
+            fn(x, 1)
+        rsi_wilder(x, 1)
+        atr_wilder(x, x, x, 1)
+        rows = np.ones((1, 9), dtype=dtype)
+        signal_score_kernel(rows, rows, 30.0, 70.0)
+
+@njit(cache=True, nogil=True)
+def signal_score_kernel(cur, prev, rsi_oversold, rsi_overbought):
+    """
+    Score bullish / bearish conditions for rows of (current, previous) bars
+    
+    cur and prev are (m, 9) arrays with columns in technical_analysis.SCORE_COLUMNS
+    order: rsi, macd_hist, close, sma_fast, sma_slow, bb_lower, bb_upper,
+    stoch_k, stoch_d. Returns int8 bullish and bearish scores plus a bitfield
+    of fired conditions (bit i -> technical_analysis.SIGNAL_REASONS[i]).
+    """
+    rsi, hist, close = cur[:, 0], cur[:, 1], cur[:, 2]
+    sma_fast, sma_slow = cur[:, 3], cur[:, 4]
+    bb_lower, bb_upper = cur[:, 5], cur[:, 6]
+    stoch_k, stoch_d = cur[:, 7], cur[:, 8]
+    p_rsi, p_hist, p_close = prev[:, 0], prev[:, 1], prev[:, 2]
+    p_sma_fast, p_sma_slow = prev[:, 3], prev[:, 4]
+    
+    conditions = (
+        (rsi < rsi_oversold) & (rsi > p_rsi),
+        (rsi > rsi_overbought) & (rsi < p_rsi),
+        (hist > 0) & (p_hist <= 0),
+        (hist < 0) & (p_hist >= 0),
+        (close > sma_fast) & (sma_fast > sma_slow) & (p_sma_fast <= p_sma_slow),
+        (close < sma_fast) & (sma_fast < sma_slow) & (p_sma_fast >= p_sma_slow),
+        (close <= bb_lower) & (close > p_close),
+        (close >= bb_upper) & (close < p_close),
+        (stoch_k < 20) & (stoch_k > stoch_d),
+        (stoch_k > 80) & (stoch_k < stoch_d)
+    )
+    
+    m = cur.shape[0]
+    bullish = np.zeros(m, dtype=np.int8)
+    bearish = np.zeros(m, dtype=np.int8)
+    bits = np.zeros(m, dtype=np.int16)
+    # Even bits are bullish conditions, odd bits the mirrored bearish ones
+    weights = (2, 2, 2, 2, 3, 3, 1, 1, 1, 1)
+    for bit in range(10):
+        fired = conditions[bit].astype(np.int8)
+        if bit % 2 == 0:
+            bullish += fired * weights[bit]
+        else:
+            bearish += fired * weights[bit]
+        bits |= fired.astype(np.int16) << bit
+    return bullish, bearish, bits
+
+@njit(cache=True, nogil=True)
+def candlestick_kernel(o, h, l, c):
+    """
+    Detect candlestick patterns in one pass over OHLC arrays
+    
+    Returns an (N, 4) boolean matrix with columns doji, hammer,
+    bullish_engulfing, bearish_engulfing (technical_analysis.PATTERN_NAMES).
+    """
+    size = c.shape[0]
+    out = np.zeros((size, 4), dtype=np.bool_)
+    for i in range(size):
+        body = abs(c[i] - o[i])
+        lower_shadow = min(o[i], c[i]) - l[i]
+        upper_shadow = h[i] - max(o[i], c[i])
+        out[i, 0] = body <= (h[i] - l[i]) * 0.1
+        out[i, 1] = lower_shadow >= 2 * body and upper_shadow <= body
+        if i > 0:
+            larger = body > abs(c[i - 1] - o[i - 1])
+            # Previous red, current green opening below its close and closing above its open
+            out[i, 2] = (c[i - 1] < o[i - 1] and c[i] > o[i] and o[i] < c[i - 1]
+                         and c[i] > o[i - 1] and larger)
+            # Previous green, current red opening above its close and closing below its open
+            out[i, 3] = (c[i - 1] > o[i - 1] and c[i] < o[i] and o[i] > c[i - 1]
+                         and c[i] < o[i - 1] and larger)
+    return out
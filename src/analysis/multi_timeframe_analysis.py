@@ -1,4 +1,5 @@
 
+import heapq
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
@@ -6,9 +7,13 @@ import logging
 from datetime import datetime, timedelta
 from src.config.trading_config import TradingConfig
 from src.analysis.technical_analysis import technical_analysis
+from src.analysis._kernels import quality_score_kernel
 
 logger = logging.getLogger(__name__)
 
+# Columns read from the latest higher-timeframe candle for trend confirmation
+TREND_COLUMNS = ['close', 'sma_fast', 'sma_slow', 'macd_hist']
+
 class MultiTimeframeAnalysis:
     """Enhanced multi-timeframe analysis with confirmation logic"""
     
@@ -22,6 +27,14 @@ class MultiTimeframeAnalysis:
             'D1': ['W1'],
             'W1': []
         }
+        # {timeframe: (higher_timeframes, confirmation_weights)} resolved once
+        self._confirm_table = {
+            tf: (
+                tuple(higher),
+                tuple(TradingConfig.TIMEFRAMES[h].confirmation_weight for h in higher)
+            )
+            for tf, higher in self.confirmation_rules.items()
+        }
     
     def analyze_multiple_timeframes(
         self, 
@@ -39,11 +52,13 @@ class MultiTimeframeAnalysis:
             Dictionary with analysis results for each timeframe
         """
         results = {}
+        # Indicators computed during this call, keyed by id() of the source frame
+        indicator_cache: Dict[int, pd.DataFrame] = {}
         
         for timeframe, df in pair_data.items():
             if df is not None and len(df) > 0:
                 # Calculate indicators for this timeframe
-                df_with_indicators = technical_analysis.calculate_indicators(df)
+                df_with_indicators = self._with_indicators(df, indicator_cache)
                 
                 # Generate signal for this timeframe
                 signal_data = technical_analysis.generate_signal(
@@ -53,7 +68,8 @@ class MultiTimeframeAnalysis:
                 if signal_data:
                     # Add multi-timeframe confirmation
                     confirmation_data = self._get_timeframe_confirmation(
-                        signal_data, pair_data, timeframe, signal_data['direction']
+                        signal_data, pair_data, timeframe, signal_data['direction'],
+                        indicator_cache
                     )
                     
                     signal_data.update(confirmation_data)
@@ -61,12 +77,20 @@ class MultiTimeframeAnalysis:
         
         return results
     
+    def _with_indicators(self, df: pd.DataFrame, indicator_cache: Dict[int, pd.DataFrame]) -> pd.DataFrame:
+        """Calculate indicators for a frame at most once per analysis call"""
+        key = id(df)
+        if key not in indicator_cache:
+            indicator_cache[key] = technical_analysis.calculate_indicators(df)
+        return indicator_cache[key]
+    
     def _get_timeframe_confirmation(
         self,
         signal_data: Dict,
         pair_data: Dict[str, pd.DataFrame],
         current_timeframe: str,
-        signal_direction: str
+        signal_direction: str,
+        indicator_cache: Optional[Dict[int, pd.DataFrame]] = None
     ) -> Dict:
         """
         Get confirmation from higher timeframes
@@ -76,40 +100,39 @@ class MultiTimeframeAnalysis:
             pair_data: All timeframe data for the pair
             current_timeframe: Current timeframe being analyzed
             signal_direction: Direction of the signal (BUY/SELL)
+            indicator_cache: Indicator frames already computed in this analysis
             
         Returns:
             Dictionary with confirmation data
         """
         confirmation_score = 0.0
         confirmation_details = []
-        higher_timeframes = self.confirmation_rules.get(current_timeframe, [])
+        if indicator_cache is None:
+            indicator_cache = {}
+        higher_timeframes, weights = self._confirm_table.get(current_timeframe, ((), ()))
+        max_possible_score = 0.0
         
-        for higher_tf in higher_timeframes:
-            if higher_tf in pair_data and pair_data[higher_tf] is not None:
-                df_higher = technical_analysis.calculate_indicators(pair_data[higher_tf])
+        for higher_tf, weight in zip(higher_timeframes, weights):
+            df_higher = pair_data.get(higher_tf)
+            if df_higher is not None:
+                max_possible_score += weight
+                df_higher = self._with_indicators(df_higher, indicator_cache)
                 
-                if len(df_higher) > 0:
-                    latest = df_higher.iloc[-1]
+                if len(df_higher) > 0 and 'sma_slow' in df_higher.columns:
+                    price, sma_fast, sma_slow, macd_hist = df_higher[TREND_COLUMNS].to_numpy()[-1]
                     
                     # Check trend confirmation
                     trend_confirmation = self._check_trend_confirmation(
-                        latest, signal_direction
+                        price, sma_fast, sma_slow, macd_hist, signal_direction
                     )
                     
                     if trend_confirmation['confirmed']:
-                        weight = TradingConfig.TIMEFRAMES[higher_tf].confirmation_weight
                         confirmation_score += weight
                         confirmation_details.append(
                             f"{higher_tf}: {trend_confirmation['reason']}"
                         )
         
         # Calculate final confirmation percentage
-        max_possible_score = sum(
-            TradingConfig.TIMEFRAMES[tf].confirmation_weight 
-            for tf in higher_timeframes 
-            if tf in pair_data and pair_data[tf] is not None
-        )
-        
         confirmation_percentage = (
             (confirmation_score / max_possible_score * 100) 
             if max_possible_score > 0 else 0
@@ -122,22 +145,27 @@ class MultiTimeframeAnalysis:
             'mtf_confirmed': confirmation_percentage >= 60  # 60% threshold
         }
     
-    def _check_trend_confirmation(self, latest_data: pd.Series, signal_direction: str) -> Dict:
+    def _check_trend_confirmation(
+        self,
+        price: float,
+        sma_fast: float,
+        sma_slow: float,
+        macd_hist: float,
+        signal_direction: str
+    ) -> Dict:
         """
         Check if higher timeframe confirms the signal direction
         
         Args:
-            latest_data: Latest candle data from higher timeframe
+            price: Latest close on the higher timeframe
+            sma_fast: Latest fast SMA on the higher timeframe
+            sma_slow: Latest slow SMA on the higher timeframe
+            macd_hist: Latest MACD histogram on the higher timeframe
             signal_direction: Signal direction to confirm
             
         Returns:
             Dictionary with confirmation result and reason
         """
-        price = latest_data['close']
-        sma_fast = latest_data.get('sma_fast')
-        sma_slow = latest_data.get('sma_slow')
-        macd_hist = latest_data.get('macd_hist')
-        
         if signal_direction == 'BUY':
             # For BUY signals, check bullish conditions on higher timeframe
             if (price > sma_fast > sma_slow and macd_hist > 0):
@@ -190,6 +218,7 @@ class MultiTimeframeAnalysis:
             Filtered signals that meet confirmation criteria
         """
         filtered_signals = {}
+        log_confirmed = logger.isEnabledFor(logging.INFO)
         
         for pair, timeframe_signals in all_signals.items():
             filtered_pair_signals = {}
@@ -199,10 +228,12 @@ class MultiTimeframeAnalysis:
                     # Only include signals with sufficient confirmation
                     if signal_data.get('mtf_confirmed', False):
                         filtered_pair_signals[timeframe] = signal_data
-                        logger.info(
-                            f"Signal confirmed: {pair} {timeframe} {signal_data['direction']} "
-                            f"(MTF: {signal_data['mtf_confirmation_percentage']:.1f}%)"
-                        )
+                        if log_confirmed:
+                            logger.info(
+                                "Signal confirmed: %s %s %s (MTF: %.1f%%)",
+                                pair, timeframe, signal_data['direction'],
+                                signal_data['mtf_confirmation_percentage']
+                            )
                 else:
                     # Include all signals if MTF confirmation is disabled
                     filtered_pair_signals[timeframe] = signal_data
@@ -231,48 +262,39 @@ class MultiTimeframeAnalysis:
         
         for pair, timeframe_signals in all_signals.items():
             for timeframe, signal_data in timeframe_signals.items():
-                # Calculate quality score
-                quality_score = self._calculate_signal_quality_score(signal_data)
-                signal_data['quality_score'] = quality_score
                 signal_data['pair'] = pair
                 signal_data['timeframe'] = timeframe
                 signal_list.append(signal_data)
         
-        # Sort by quality score and return top signals
-        signal_list.sort(key=lambda x: x['quality_score'], reverse=True)
-        return signal_list[:max_signals]
-    
-    def _calculate_signal_quality_score(self, signal_data: Dict) -> float:
-        """
-        Calculate a quality score for a signal based on multiple factors
-        
-        Args:
-            signal_data: Signal data dictionary
-            
-        Returns:
-            Quality score (0-100)
-        """
-        score = 0.0
+        if not signal_list:
+            return []
         
-        # Base signal strength (30% weight)
-        score += signal_data.get('strength', 0) * 30
-        
-        # Multi-timeframe confirmation (40% weight)
-        mtf_percentage = signal_data.get('mtf_confirmation_percentage', 0)
-        score += (mtf_percentage / 100) * 40
+        # Stage score components into parallel arrays and score them in one pass
+        n = len(signal_list)
+        strength = np.fromiter((s.get('strength', 0) for s in signal_list), dtype=np.float64, count=n)
+        mtf_pct = np.fromiter(
+            (s.get('mtf_confirmation_percentage', 0) for s in signal_list), dtype=np.float64, count=n
+        )
+        rr3 = np.fromiter((s.get('risk_reward_3', 0) for s in signal_list), dtype=np.float64, count=n)
+        tf_weight = np.fromiter(
+            (self._timeframe_weight(s['timeframe']) for s in signal_list), dtype=np.float64, count=n
+        )
+        scores = quality_score_kernel(strength, mtf_pct, rr3, tf_weight)
         
-        # Risk-reward ratio (20% weight)
-        rr_score = min(signal_data.get('risk_reward_3', 0) / 3.0, 1.0) * 20
-        score += rr_score
+        for signal_data, quality_score in zip(signal_list, scores.tolist()):
+            signal_data['quality_score'] = quality_score
         
-        # Timeframe weight (10% weight)
-        timeframe = signal_data.get('timeframe', 'H1')
+        # Select the top signals without sorting the whole list; like a stable
+        # descending sort, equal scores keep insertion order (also at the cut-off)
+        if max_signals <= 0:
+            return []
+        top = heapq.nlargest(max_signals, range(n), key=scores.__getitem__)
+        return [signal_list[i] for i in top]
+    
+    def _timeframe_weight(self, timeframe: str) -> float:
+        """Confirmation weight of a timeframe (0 when unknown)"""
         tf_config = TradingConfig.get_timeframe_config(timeframe)
-        if tf_config:
-            tf_weight = min(tf_config.confirmation_weight / 3.0, 1.0) * 10
-            score += tf_weight
-        
-        return min(score, 100.0)
+        return tf_config.confirmation_weight if tf_config else 0.0
 
 # Global instance
 multi_timeframe_analysis = MultiTimeframeAnalysis()
@@ -1,24 +1,119 @@
 
 import pandas as pd
 import numpy as np
-import pandas_ta as ta
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 import logging
 from src.config.trading_config import TradingConfig
+from src.analysis import _kernels
+
+try:
+    import talib
+except ImportError:  # Fall back to the Numba kernels
+    talib = None
 
 logger = logging.getLogger(__name__)
 
+# Indicator parameters resolved once from TradingConfig
+_RSI_N = TradingConfig.RSI_PERIOD
+_RSI_OS = float(TradingConfig.RSI_OVERSOLD)
+_RSI_OB = float(TradingConfig.RSI_OVERBOUGHT)
+_MACD_F = TradingConfig.MACD_FAST
+_MACD_S = TradingConfig.MACD_SLOW
+_MACD_SIG = TradingConfig.MACD_SIGNAL
+_SMA_F = TradingConfig.SMA_FAST
+_SMA_S = TradingConfig.SMA_SLOW
+_ATR_N = TradingConfig.ATR_PERIOD
+_ATR_MULT = TradingConfig.ATR_MULTIPLIER
+# (pip_position, pip_value) per pair; unknown pairs round to 4 places and report raw risk
+_PAIR_PIP_POS_VAL = {
+    symbol: (pair.pip_position, pair.pip_value) for symbol, pair in TradingConfig.PAIRS.items()
+}
+_DEFAULT_PIP_POS_VAL = (4, 1.0)
+# Reported indicators: oscillators to 2 places, price-scale values 2 places past the pip
+# (enough for float32 input without exposing its representation noise)
+_OSCILLATOR_DECIMALS = 2
+_SUB_PIP_DECIMALS = 2
+# Entry, stop loss and 1:1 / 1:2 / 1:3 take profits as multiples of the signed risk
+_ENTRY_RISK_MULTIPLES = np.array([0.0, -1.0, 1.0, 2.0, 3.0])
+# EMA smoothing factors for the incremental MACD update
+_ALPHA_F = 2.0 / (_MACD_F + 1)
+_ALPHA_S = 2.0 / (_MACD_S + 1)
+_ALPHA_SIG = 2.0 / (_MACD_SIG + 1)
+
+# Bollinger Band and Stochastic settings
+BB_PERIOD = 20
+BB_STD = 2.0
+STOCH_K = 14
+STOCH_SMOOTH_K = 3
+STOCH_D = 3
+# Columns fed to the signal scoring kernel, in kernel order
+SCORE_COLUMNS = [
+    'rsi', 'macd_hist', 'close', 'sma_fast', 'sma_slow',
+    'bb_lower', 'bb_upper', 'stoch_k', 'stoch_d'
+]
+# Columns read by generate_signal (scoring columns first), and their positions
+SIGNAL_COLUMNS = SCORE_COLUMNS + ['macd', 'macd_signal', 'atr']
+_COL = {column: i for i, column in enumerate(SIGNAL_COLUMNS)}
+# Reason for each bit of the scoring kernel's condition bitfield
+SIGNAL_REASONS = (
+    "RSI oversold recovery",
+    "RSI overbought decline",
+    "MACD bullish crossover",
+    "MACD bearish crossover",
+    "Golden Cross + price above MAs",
+    "Death Cross + price below MAs",
+    "Bounce from lower Bollinger Band",
+    "Rejection from upper Bollinger Band",
+    "Stochastic bullish crossover in oversold",
+    "Stochastic bearish crossover in overbought"
+)
+# Candlestick pattern columns produced by the pattern kernel
+PATTERN_NAMES = ('doji', 'hammer', 'bullish_engulfing', 'bearish_engulfing')
+# Rolling window for support / resistance levels
+SR_WINDOW = 20
+
+@dataclass
+class IndicatorState:
+    """Running indicator state for one pair/timeframe, advanced one bar at a time"""
+    last_time: pd.Timestamp
+    bar_index: int
+    prev_close: float
+    sma_fast_sum: float
+    sma_slow_sum: float
+    rsi_avg_gain: float
+    rsi_avg_loss: float
+    macd_ema_fast: float
+    macd_ema_slow: float
+    macd_signal_ema: float
+    bb_sum: float
+    bb_sqsum: float
+    atr_value: float
+    closes: deque = field(default_factory=deque)
+    highs: deque = field(default_factory=deque)
+    lows: deque = field(default_factory=deque)
+    fast_k: deque = field(default_factory=deque)
+    slow_k: deque = field(default_factory=deque)
+    # Monotonic (bar_index, price) windows for rolling max / min
+    resistance_window: deque = field(default_factory=deque)
+    support_window: deque = field(default_factory=deque)
+
 class TechnicalAnalysis:
     """Advanced technical analysis for signal generation"""
     
     def __init__(self):
         self.required_periods = max(
-            TradingConfig.RSI_PERIOD,
-            TradingConfig.MACD_SLOW,
-            TradingConfig.SMA_SLOW,
-            TradingConfig.ATR_PERIOD
+            _RSI_N,
+            _MACD_S,
+            _SMA_S,
+            _ATR_N
         ) + 50  # Extra buffer for calculations
     
+    def warm_up(self):
+        """Compile (or load cached) the Numba kernels ahead of the first analysis pass"""
+        _kernels.warm_up()
+    
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate all technical indicators
@@ -34,76 +129,277 @@ class TechnicalAnalysis:
                 logger.warning(f"Insufficient data: {len(df)} candles, need at least {self.required_periods}")
                 return df
             
-            data = df.copy()
-            
-            # RSI - Relative Strength Index
-            data['rsi'] = ta.rsi(data['close'], length=TradingConfig.RSI_PERIOD)
-            
-            # MACD - Moving Average Convergence Divergence
-            macd_data = ta.macd(
-                data['close'],
-                fast=TradingConfig.MACD_FAST,
-                slow=TradingConfig.MACD_SLOW,
-                signal=TradingConfig.MACD_SIGNAL
-            )
-            data['macd'] = macd_data[f'MACD_{TradingConfig.MACD_FAST}_{TradingConfig.MACD_SLOW}_{TradingConfig.MACD_SIGNAL}']
-            data['macd_signal'] = macd_data[f'MACDs_{TradingConfig.MACD_FAST}_{TradingConfig.MACD_SLOW}_{TradingConfig.MACD_SIGNAL}']
-            data['macd_hist'] = macd_data[f'MACDh_{TradingConfig.MACD_FAST}_{TradingConfig.MACD_SLOW}_{TradingConfig.MACD_SIGNAL}']
-            
-            # Simple Moving Averages
-            data['sma_fast'] = ta.sma(data['close'], length=TradingConfig.SMA_FAST)
-            data['sma_slow'] = ta.sma(data['close'], length=TradingConfig.SMA_SLOW)
-            
-            # Bollinger Bands
-            bb_data = ta.bbands(data['close'], length=20, std=2)
-            data['bb_upper'] = bb_data['BBU_20_2.0']
-            data['bb_middle'] = bb_data['BBM_20_2.0']
-            data['bb_lower'] = bb_data['BBL_20_2.0']
+            # Prices keep the fetcher's dtype (float32), so indicators come out in it too
+            high = df['high'].to_numpy()
+            low = df['low'].to_numpy()
+            close = df['close'].to_numpy()
             
-            # Average True Range (for volatility and stop loss)
-            data['atr'] = ta.atr(data['high'], data['low'], data['close'], length=TradingConfig.ATR_PERIOD)
-            
-            # Stochastic Oscillator
-            stoch_data = ta.stoch(data['high'], data['low'], data['close'])
-            data['stoch_k'] = stoch_data['STOCHk_14_3_3']
-            data['stoch_d'] = stoch_data['STOCHd_14_3_3']
+            indicators = self._indicator_arrays(high, low, close)
             
             # Support and Resistance levels
-            data = self._calculate_support_resistance(data)
+            indicators['resistance'], indicators['support'] = self._calculate_support_resistance(high, low)
             
             # Trend detection
-            data['trend'] = self._detect_trend(data)
+            indicators['trend'] = self._detect_trend(close, indicators['sma_fast'], indicators['sma_slow'])
             
-            return data
+            # Assign every new column in one shot (no intermediate copies)
+            return df.assign(**indicators)
             
         except Exception as e:
             logger.error(f"Error calculating indicators: {e}")
             return df
     
-    def _calculate_support_resistance(self, df: pd.DataFrame, window: int = 20) -> pd.DataFrame:
-        """Calculate dynamic support and resistance levels"""
-        data = df.copy()
+    def _indicator_arrays(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute indicator columns on raw price arrays
+        
+        Uses TA-Lib when installed, otherwise the Numba kernels in _kernels
+        (which run in the input dtype, accumulating in float64).
+        
+        Returns:
+            Dictionary with column name as key and indicator array as value
+        """
+        if talib is not None:
+            # TA-Lib only accepts float64 input
+            high, low, close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+            rsi = talib.RSI(close, timeperiod=_RSI_N)
+            macd, macd_signal, macd_hist = talib.MACD(
+                close,
+                fastperiod=_MACD_F,
+                slowperiod=_MACD_S,
+                signalperiod=_MACD_SIG
+            )
+            sma_fast = talib.SMA(close, timeperiod=_SMA_F)
+            sma_slow = talib.SMA(close, timeperiod=_SMA_S)
+            bb_upper, bb_middle, bb_lower = talib.BBANDS(
+                close, timeperiod=BB_PERIOD, nbdevup=BB_STD, nbdevdn=BB_STD, matype=0
+            )
+            atr = talib.ATR(high, low, close, timeperiod=_ATR_N)
+            stoch_k, stoch_d = talib.STOCH(
+                high, low, close,
+                fastk_period=STOCH_K,
+                slowk_period=STOCH_SMOOTH_K, slowk_matype=0,
+                slowd_period=STOCH_D, slowd_matype=0
+            )
+        else:
+            rsi = _kernels.rsi_wilder(close, _RSI_N)
+            
+            # MACD - difference of EMAs and its EMA signal line
+            macd = _kernels.ema(close, _MACD_F) - _kernels.ema(close, _MACD_S)
+            macd_signal = _kernels.ema(macd, _MACD_SIG)
+            macd_hist = macd - macd_signal
+            
+            sma_fast = _kernels.rolling_mean(close, _SMA_F)
+            sma_slow = _kernels.rolling_mean(close, _SMA_S)
+            
+            bb_middle = _kernels.rolling_mean(close, BB_PERIOD)
+            bb_width = BB_STD * _kernels.rolling_std(close, BB_PERIOD)
+            bb_upper = bb_middle + bb_width
+            bb_lower = bb_middle - bb_width
+            
+            atr = _kernels.atr_wilder(high, low, close, _ATR_N)
+            
+            # Stochastic - smoothed %K and its %D
+            highest = _kernels.rolling_max(high, STOCH_K)
+            lowest = _kernels.rolling_min(low, STOCH_K)
+            # Undefined (NaN) over a flat window; the smoothing recovers once it passes
+            with np.errstate(divide='ignore', invalid='ignore'):
+                fast_k = np.where(
+                    highest > lowest, 100.0 * (close - lowest) / (highest - lowest), np.nan
+                ).astype(close.dtype, copy=False)
+            stoch_k = _kernels.rolling_mean(fast_k, STOCH_SMOOTH_K)
+            stoch_d = _kernels.rolling_mean(stoch_k, STOCH_D)
+        
+        return {
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_hist': macd_hist,
+            'sma_fast': sma_fast,
+            'sma_slow': sma_slow,
+            'bb_upper': bb_upper,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_lower,
+            'atr': atr,
+            'stoch_k': stoch_k,
+            'stoch_d': stoch_d
+        }
+    
+    def init_state(self, data: pd.DataFrame) -> IndicatorState:
+        """
+        Build incremental indicator state from a fully calculated frame
+        
+        Args:
+            data: Output of calculate_indicators (must contain indicator columns)
+            
+        Returns:
+            IndicatorState positioned at the last bar of data
+        """
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64)
+        n_fast, n_slow = _SMA_F, _SMA_S
+        window = max(n_fast, n_slow, BB_PERIOD)
+        
+        change = np.diff(close)
+        macd_line = (
+            _kernels.ema(close, _MACD_F) - _kernels.ema(close, _MACD_S)
+        )
+        lowest = _kernels.rolling_min(low, STOCH_K)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fast_k = 100.0 * (close - lowest) / (_kernels.rolling_max(high, STOCH_K) - lowest)
+        bb_closes = close[-BB_PERIOD:]
+        
+        state = IndicatorState(
+            last_time=data.index[-1],
+            bar_index=len(data) - 1,
+            prev_close=float(close[-1]),
+            sma_fast_sum=float(close[-n_fast:].sum()),
+            sma_slow_sum=float(close[-n_slow:].sum()),
+            rsi_avg_gain=float(_kernels.rma(np.maximum(change, 0.0), _RSI_N)[-1]),
+            rsi_avg_loss=float(_kernels.rma(np.maximum(-change, 0.0), _RSI_N)[-1]),
+            macd_ema_fast=float(_kernels.ema(close, _MACD_F)[-1]),
+            macd_ema_slow=float(_kernels.ema(close, _MACD_S)[-1]),
+            macd_signal_ema=float(_kernels.ema(macd_line, _MACD_SIG)[-1]),
+            bb_sum=float(bb_closes.sum()),
+            bb_sqsum=float((bb_closes * bb_closes).sum()),
+            atr_value=float(data['atr'].iloc[-1]),
+            closes=deque(close[-window:].tolist(), maxlen=window),
+            highs=deque(high[-STOCH_K:].tolist(), maxlen=STOCH_K),
+            lows=deque(low[-STOCH_K:].tolist(), maxlen=STOCH_K),
+            fast_k=deque(fast_k[-STOCH_SMOOTH_K:].tolist(), maxlen=STOCH_SMOOTH_K),
+            slow_k=deque(data['stoch_k'].to_numpy()[-STOCH_D:].tolist(), maxlen=STOCH_D)
+        )
         
-        # Rolling highs and lows
-        data['resistance'] = data['high'].rolling(window=window).max()
-        data['support'] = data['low'].rolling(window=window).min()
+        start = len(data) - SR_WINDOW
+        for offset, (h, l) in enumerate(zip(high[-SR_WINDOW:], low[-SR_WINDOW:])):
+            self._push_extreme(state.resistance_window, start + offset, h, is_max=True)
+            self._push_extreme(state.support_window, start + offset, l, is_max=False)
         
-        return data
+        return state
     
-    def _detect_trend(self, df: pd.DataFrame) -> pd.Series:
+    def update(self, state: IndicatorState, new_bar: pd.Series) -> Dict[str, float]:
+        """
+        Advance indicator state by one bar in O(1)
+        
+        Args:
+            state: State returned by init_state (mutated in place)
+            new_bar: OHLCV row for the next bar, indexed by its timestamp
+            
+        Returns:
+            Dictionary with the indicator values for new_bar
+        """
+        high = float(new_bar['high'])
+        low = float(new_bar['low'])
+        close = float(new_bar['close'])
+        closes = state.closes
+        
+        # SMAs and Bollinger sums swap the close leaving each window for the new one
+        state.sma_fast_sum += close - closes[-_SMA_F]
+        state.sma_slow_sum += close - closes[-_SMA_S]
+        outgoing = closes[-BB_PERIOD]
+        state.bb_sum += close - outgoing
+        state.bb_sqsum += close * close - outgoing * outgoing
+        closes.append(close)
+        sma_fast = state.sma_fast_sum / _SMA_F
+        sma_slow = state.sma_slow_sum / _SMA_S
+        bb_middle = state.bb_sum / BB_PERIOD
+        bb_width = BB_STD * np.sqrt(max(state.bb_sqsum / BB_PERIOD - bb_middle * bb_middle, 0.0))
+        
+        # RSI - Wilder smoothing of gains / losses
+        change = close - state.prev_close
+        state.rsi_avg_gain += (max(change, 0.0) - state.rsi_avg_gain) / _RSI_N
+        state.rsi_avg_loss += (max(-change, 0.0) - state.rsi_avg_loss) / _RSI_N
+        total = state.rsi_avg_gain + state.rsi_avg_loss
+        rsi = 100.0 * state.rsi_avg_gain / total if total > 0 else np.nan
+        
+        # MACD
+        state.macd_ema_fast += (close - state.macd_ema_fast) * _ALPHA_F
+        state.macd_ema_slow += (close - state.macd_ema_slow) * _ALPHA_S
+        macd = state.macd_ema_fast - state.macd_ema_slow
+        state.macd_signal_ema += (macd - state.macd_signal_ema) * _ALPHA_SIG
+        
+        # ATR - Wilder smoothing of the true range
+        true_range = max(high - low, abs(high - state.prev_close), abs(low - state.prev_close))
+        state.atr_value += (true_range - state.atr_value) / _ATR_N
+        
+        # Stochastic
+        state.highs.append(high)
+        state.lows.append(low)
+        highest, lowest = max(state.highs), min(state.lows)
+        state.fast_k.append(100.0 * (close - lowest) / (highest - lowest) if highest > lowest else np.nan)
+        stoch_k = sum(state.fast_k) / STOCH_SMOOTH_K
+        state.slow_k.append(stoch_k)
+        stoch_d = sum(state.slow_k) / STOCH_D
+        
+        # Support and resistance
+        state.bar_index += 1
+        self._push_extreme(state.resistance_window, state.bar_index, high, is_max=True)
+        self._push_extreme(state.support_window, state.bar_index, low, is_max=False)
+        
+        state.prev_close = close
+        state.last_time = new_bar.name
+        
+        if sma_fast > sma_slow and close > sma_fast:
+            trend = 1
+        elif sma_fast < sma_slow and close < sma_fast:
+            trend = -1
+        else:
+            trend = 0
+        
+        return {
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': state.macd_signal_ema,
+            'macd_hist': macd - state.macd_signal_ema,
+            'sma_fast': sma_fast,
+            'sma_slow': sma_slow,
+            'bb_upper': bb_middle + bb_width,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_middle - bb_width,
+            'atr': state.atr_value,
+            'stoch_k': stoch_k,
+            'stoch_d': stoch_d,
+            'resistance': state.resistance_window[0][1],
+            'support': state.support_window[0][1],
+            'trend': trend
+        }
+    
+    @staticmethod
+    def _push_extreme(window: deque, index: int, value: float, is_max: bool):
+        """Push onto a monotonic deque tracking the rolling max (or min) over SR_WINDOW bars"""
+        while window and (window[-1][1] <= value if is_max else window[-1][1] >= value):
+            window.pop()
+        window.append((index, value))
+        while window[0][0] <= index - SR_WINDOW:
+            window.popleft()
+    
+    def _calculate_support_resistance(
+        self,
+        high: np.ndarray,
+        low: np.ndarray,
+        window: int = SR_WINDOW
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate dynamic resistance and support levels (rolling high / low)"""
+        return _kernels.rolling_max(high, window), _kernels.rolling_min(low, window)
+    
+    def _detect_trend(self, close: np.ndarray, sma_fast: np.ndarray, sma_slow: np.ndarray) -> np.ndarray:
         """
         Detect trend based on moving averages
         
         Returns:
-            Series with trend values: 1 (bullish), -1 (bearish), 0 (sideways)
+            Array with trend values: 1 (bullish), -1 (bearish), 0 (sideways)
         """
-        conditions = [
-            (df['sma_fast'] > df['sma_slow']) & (df['close'] > df['sma_fast']),
-            (df['sma_fast'] < df['sma_slow']) & (df['close'] < df['sma_fast'])
-        ]
-        choices = [1, -1]
+        bullish = (sma_fast > sma_slow) & (close > sma_fast)
+        bearish = (sma_fast < sma_slow) & (close < sma_fast)
         
-        return pd.Series(np.select(conditions, choices, default=0), index=df.index)
+        # Booleans viewed as int8 0/1, so the difference is the trend code
+        return bullish.view(np.int8) - bearish.view(np.int8)
     
     def detect_candlestick_patterns(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
         """
@@ -112,42 +408,16 @@ class TechnicalAnalysis:
         Returns:
             Dictionary with pattern names and boolean series
         """
-        patterns = {}
-        
-        # Doji
-        body_size = abs(df['close'] - df['open'])
-        candle_range = df['high'] - df['low']
-        patterns['doji'] = body_size <= (candle_range * 0.1)
-        
-        # Hammer and Hanging Man
-        lower_shadow = df[['open', 'close']].min(axis=1) - df['low']
-        upper_shadow = df['high'] - df[['open', 'close']].max(axis=1)
-        patterns['hammer'] = (lower_shadow >= 2 * body_size) & (upper_shadow <= body_size)
-        
-        # Engulfing patterns
-        prev_body = abs(df['close'].shift(1) - df['open'].shift(1))
-        curr_body = abs(df['close'] - df['open'])
-        
-        bullish_engulfing = (
-            (df['close'].shift(1) < df['open'].shift(1)) &  # Previous red candle
-            (df['close'] > df['open']) &  # Current green candle
-            (df['open'] < df['close'].shift(1)) &  # Current open below previous close
-            (df['close'] > df['open'].shift(1)) &  # Current close above previous open
-            (curr_body > prev_body)  # Current body larger than previous
+        o, h, l, c = df[['open', 'high', 'low', 'close']].to_numpy(dtype=np.float64).T
+        matrix = _kernels.candlestick_kernel(
+            np.ascontiguousarray(o), np.ascontiguousarray(h),
+            np.ascontiguousarray(l), np.ascontiguousarray(c)
         )
         
-        bearish_engulfing = (
-            (df['close'].shift(1) > df['open'].shift(1)) &  # Previous green candle
-            (df['close'] < df['open']) &  # Current red candle
-            (df['open'] > df['close'].shift(1)) &  # Current open above previous close
-            (df['close'] < df['open'].shift(1)) &  # Current close below previous open
-            (curr_body > prev_body)  # Current body larger than previous
-        )
-        
-        patterns['bullish_engulfing'] = bullish_engulfing
-        patterns['bearish_engulfing'] = bearish_engulfing
-        
-        return patterns
+        return {
+            name: pd.Series(matrix[:, i], index=df.index)
+            for i, name in enumerate(PATTERN_NAMES)
+        }
     
     def generate_signal(self, df: pd.DataFrame, pair: str, timeframe: str) -> Optional[Dict]:
         """
@@ -165,18 +435,25 @@ class TechnicalAnalysis:
             if len(df) < self.required_periods:
                 return None
             
-            # Get latest data point
-            latest = df.iloc[-1]
-            previous = df.iloc[-2]
+            # Last two bars as a positional array (previous, latest)
+            window = df[SIGNAL_COLUMNS].to_numpy()[-2:]
             
             # Calculate signal strength and direction
-            signal_data = self._evaluate_signal_conditions(latest, previous, df)
+            signal_data = self._evaluate_signal_conditions(window[:, :len(SCORE_COLUMNS)])
             
             if signal_data['direction'] == 'NONE':
                 return None
             
+            # float64 Python floats for the output (indicators are computed in float32)
+            latest = window[-1].astype(np.float64).tolist()
+            
             # Calculate entry, stop loss, and take profits
-            entry_data = self._calculate_entry_points(latest, signal_data['direction'], pair)
+            entry_data = self._calculate_entry_points(
+                latest[_COL['close']], latest[_COL['atr']], signal_data['direction'], pair
+            )
+            
+            pip_position = _PAIR_PIP_POS_VAL.get(pair, _DEFAULT_PIP_POS_VAL)[0]
+            price_decimals = pip_position + _SUB_PIP_DECIMALS
             
             return {
                 'pair': pair,
@@ -192,16 +469,16 @@ class TechnicalAnalysis:
                 'risk_reward_1': entry_data['rr1'],
                 'risk_reward_2': entry_data['rr2'],
                 'risk_reward_3': entry_data['rr3'],
-                'timestamp': latest.name,
-                'current_price': latest['close'],
+                'timestamp': df.index[-1],
+                'current_price': round(latest[_COL['close']], pip_position),
                 'indicators': {
-                    'rsi': latest['rsi'],
-                    'macd': latest['macd'],
-                    'macd_signal': latest['macd_signal'],
-                    'macd_hist': latest['macd_hist'],
-                    'sma_fast': latest['sma_fast'],
-                    'sma_slow': latest['sma_slow'],
-                    'atr': latest['atr']
+                    'rsi': round(latest[_COL['rsi']], _OSCILLATOR_DECIMALS),
+                    'macd': round(latest[_COL['macd']], price_decimals),
+                    'macd_signal': round(latest[_COL['macd_signal']], price_decimals),
+                    'macd_hist': round(latest[_COL['macd_hist']], price_decimals),
+                    'sma_fast': round(latest[_COL['sma_fast']], price_decimals),
+                    'sma_slow': round(latest[_COL['sma_slow']], price_decimals),
+                    'atr': round(latest[_COL['atr']], price_decimals)
                 }
             }
             
@@ -209,60 +486,23 @@ class TechnicalAnalysis:
             logger.error(f"Error generating signal for {pair} {timeframe}: {e}")
             return None
     
-    def _evaluate_signal_conditions(self, current: pd.Series, previous: pd.Series, df: pd.DataFrame) -> Dict:
+    def _evaluate_signal_conditions(self, window: np.ndarray) -> Dict:
         """
         Evaluate all signal conditions and calculate strength
         
+        Args:
+            window: Last two bars as a (2, len(SCORE_COLUMNS)) array, oldest first
+            
         Returns:
             Dictionary with direction, strength, and reasons
         """
-        bullish_score = 0
-        bearish_score = 0
-        reasons = []
-        
-        # RSI conditions
-        if current['rsi'] < TradingConfig.RSI_OVERSOLD and current['rsi'] > previous['rsi']:
-            bullish_score += 2
-            reasons.append("RSI oversold recovery")
-        elif current['rsi'] > TradingConfig.RSI_OVERBOUGHT and current['rsi'] < previous['rsi']:
-            bearish_score += 2
-            reasons.append("RSI overbought decline")
-        
-        # MACD conditions
-        if current['macd_hist'] > 0 and previous['macd_hist'] <= 0:
-            bullish_score += 2
-            reasons.append("MACD bullish crossover")
-        elif current['macd_hist'] < 0 and previous['macd_hist'] >= 0:
-            bearish_score += 2
-            reasons.append("MACD bearish crossover")
-        
-        # Moving average conditions
-        if (current['close'] > current['sma_fast'] and 
-            current['sma_fast'] > current['sma_slow'] and
-            previous['sma_fast'] <= previous['sma_slow']):
-            bullish_score += 3
-            reasons.append("Golden Cross + price above MAs")
-        elif (current['close'] < current['sma_fast'] and 
-              current['sma_fast'] < current['sma_slow'] and
-              previous['sma_fast'] >= previous['sma_slow']):
-            bearish_score += 3
-            reasons.append("Death Cross + price below MAs")
-        
-        # Bollinger Bands conditions
-        if current['close'] <= current['bb_lower'] and current['close'] > previous['close']:
-            bullish_score += 1
-            reasons.append("Bounce from lower Bollinger Band")
-        elif current['close'] >= current['bb_upper'] and current['close'] < previous['close']:
-            bearish_score += 1
-            reasons.append("Rejection from upper Bollinger Band")
-        
-        # Stochastic conditions
-        if current['stoch_k'] < 20 and current['stoch_k'] > current['stoch_d']:
-            bullish_score += 1
-            reasons.append("Stochastic bullish crossover in oversold")
-        elif current['stoch_k'] > 80 and current['stoch_k'] < current['stoch_d']:
-            bearish_score += 1
-            reasons.append("Stochastic bearish crossover in overbought")
+        # Frame rows are strided views; a C-contiguous copy matches the warmed-up signature
+        window = np.ascontiguousarray(window)
+        bullish, bearish, bits = _kernels.signal_score_kernel(
+            window[1:], window[:1],
+            _RSI_OS, _RSI_OB
+        )
+        bullish_score, bearish_score, bits = int(bullish[0]), int(bearish[0]), int(bits[0])
         
         # Determine direction and strength
         if bullish_score >= 3 and bullish_score > bearish_score:
@@ -272,8 +512,10 @@ class TechnicalAnalysis:
             direction = 'SELL'
             strength = min(bearish_score / 8.0, 1.0)  # Normalize to 0-1
         else:
-            direction = 'NONE'
-            strength = 0.0
+            return {'direction': 'NONE', 'strength': 0.0, 'reasons': []}
+        
+        # Only fired signals need their reason strings
+        reasons = [reason for bit, reason in enumerate(SIGNAL_REASONS) if bits >> bit & 1]
         
         return {
             'direction': direction,
@@ -281,59 +523,40 @@ class TechnicalAnalysis:
             'reasons': reasons
         }
     
-    def _calculate_entry_points(self, latest: pd.Series, direction: str, pair: str) -> Dict:
+    def _calculate_entry_points(self, current_price: float, atr: float, direction: str, pair: str) -> Dict:
         """
         Calculate entry, stop loss, and take profit levels
         
         Args:
-            latest: Latest candle data
+            current_price: Latest close
+            atr: Latest ATR
             direction: Signal direction ('BUY' or 'SELL')
             pair: Trading pair symbol
             
         Returns:
             Dictionary with entry points and risk-reward ratios
         """
-        pair_config = TradingConfig.get_pair_config(pair)
-        atr = latest['atr']
-        current_price = latest['close']
+        pip_position, pip_value = _PAIR_PIP_POS_VAL.get(pair, _DEFAULT_PIP_POS_VAL)
         
-        if direction == 'BUY':
-            entry = current_price
-            stop_loss = current_price - (atr * TradingConfig.ATR_MULTIPLIER)
-            
-            # Calculate risk (distance to stop loss)
-            risk = entry - stop_loss
-            
-            # Calculate take profits
-            tp1 = entry + (risk * 1.0)  # 1:1 R:R
-            tp2 = entry + (risk * 2.0)  # 1:2 R:R
-            tp3 = entry + (risk * 3.0)  # 1:3 R:R
-            
-        else:  # SELL
-            entry = current_price
-            stop_loss = current_price + (atr * TradingConfig.ATR_MULTIPLIER)
-            
-            # Calculate risk (distance to stop loss)
-            risk = stop_loss - entry
-            
-            # Calculate take profits
-            tp1 = entry - (risk * 1.0)  # 1:1 R:R
-            tp2 = entry - (risk * 2.0)  # 1:2 R:R
-            tp3 = entry - (risk * 3.0)  # 1:3 R:R
+        # Risk is the ATR-based distance to the stop loss; levels are multiples of it
+        sign = 1.0 if direction == 'BUY' else -1.0
+        risk = atr * _ATR_MULT
         
         # Round to appropriate decimal places
-        pip_position = pair_config.pip_position if pair_config else 4
+        entry, stop_loss, tp1, tp2, tp3 = np.round(
+            current_price + (sign * risk) * _ENTRY_RISK_MULTIPLES, pip_position
+        ).tolist()
         
         return {
-            'entry': round(entry, pip_position),
-            'stop_loss': round(stop_loss, pip_position),
-            'tp1': round(tp1, pip_position),
-            'tp2': round(tp2, pip_position),
-            'tp3': round(tp3, pip_position),
+            'entry': entry,
+            'stop_loss': stop_loss,
+            'tp1': tp1,
+            'tp2': tp2,
+            'tp3': tp3,
             'rr1': 1.0,
             'rr2': 2.0,
             'rr3': 3.0,
-            'risk_pips': round(risk / pair_config.pip_value if pair_config else risk, 1)
+            'risk_pips': round(risk / pip_value, 1)
         }
 
 # Global instance
@@ -1,12 +1,15 @@
 
 import asyncio
+import inspect
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import pandas as pd
+from fastapi.responses import ORJSONResponse, Response
+import numpy as np
+import orjson
 import uvicorn
 import os
 import sys
@@ -26,7 +29,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Trading Signals API",
     description="Real-time trading signals with proximity filtering",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for frontend integration
@@ -38,29 +42,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global cache for performance
+# Global cache for performance (timestamps are event-loop monotonic time)
 cache = {
-    'signals': {'data': None, 'timestamp': 0, 'ttl': 30},
-    'market_data': {'data': None, 'timestamp': 0, 'ttl': 10},
-    'proximity_signals': {'data': None, 'timestamp': 0, 'ttl': 20}
+    'market_data': {'data': None, 'timestamp': float('-inf'), 'ttl': 10},
+    'proximity_signals': {'data': None, 'timestamp': float('-inf'), 'ttl': 20}
 }
 
+# Signal payloads rebuilt once per background refresh; 'pair', 'entry' and
+# 'pip_value' are parallel arrays over 'records' for the proximity filter
+signal_payload = {
+    'records': [],
+    'bytes': b'[]',
+    'pair': np.array([], dtype=object),
+    'entry': np.array([], dtype=np.float64),
+    'pip_value': np.array([], dtype=np.float64)
+}
+
+def _signal_record(signal) -> Dict:
+    """Convert a TradingSignal into its JSON-ready dictionary"""
+    return {
+        'id': signal.id,
+        'pair': signal.pair,
+        'timeframe': signal.timeframe,
+        'direction': signal.direction,
+        'strength': signal.strength,
+        'entry_price': signal.entry_price,
+        'current_price': signal.current_price,
+        'stop_loss': signal.stop_loss,
+        'take_profit_1': signal.take_profit_1,
+        'take_profit_2': signal.take_profit_2,
+        'take_profit_3': signal.take_profit_3,
+        'distance_pips': getattr(signal, 'distance_pips', 0),
+        'proximity_score': getattr(signal, 'proximity_score', 0),
+        'timestamp': signal.timestamp.isoformat(),
+        'reasons': signal.reasons,
+        'indicators': signal.indicators
+    }
+
+def refresh_signal_payload():
+    """Serialize active signals once so request handlers only copy bytes"""
+    records = [_signal_record(signal) for signal in signal_manager.get_active_signals()]
+    signal_payload['records'] = records
+    signal_payload['bytes'] = orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY)
+    signal_payload['pair'] = np.array([r['pair'] for r in records], dtype=object)
+    signal_payload['entry'] = np.array([r['entry_price'] for r in records], dtype=np.float64)
+    signal_payload['pip_value'] = np.array(
+        [proximity_filter.get_pip_value(r['pair']) for r in records], dtype=np.float64
+    )
+
+# One lock per cache key so concurrent misses share a single fetch
+_cache_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+def _is_stale(cache_entry: Dict) -> bool:
+    """Check whether a cache entry is empty or past its TTL"""
+    return (cache_entry['data'] is None or
+            asyncio.get_running_loop().time() - cache_entry['timestamp'] > cache_entry['ttl'])
+
 async def get_cached_or_fetch(cache_key: str, fetch_func, *args, **kwargs):
     """Generic caching function"""
-    current_time = datetime.now().timestamp()
-    cache_entry = cache.get(cache_key, {'data': None, 'timestamp': 0, 'ttl': 30})
+    cache_entry = cache.setdefault(cache_key, {'data': None, 'timestamp': float('-inf'), 'ttl': 30})
     
-    if (cache_entry['data'] is None or 
-        current_time - cache_entry['timestamp'] > cache_entry['ttl']):
-        
-        try:
-            cache_entry['data'] = await fetch_func(*args, **kwargs)
-            cache_entry['timestamp'] = current_time
-            cache[cache_key] = cache_entry
-        except Exception as e:
-            logger.error(f"Error fetching data for {cache_key}: {e}")
-            if cache_entry['data'] is None:
-                cache_entry['data'] = []
+    if _is_stale(cache_entry):
+        async with _cache_locks[cache_key]:
+            # Another request may have refreshed the entry while we waited
+            if _is_stale(cache_entry):
+                try:
+                    data = fetch_func(*args, **kwargs)
+                    if inspect.isawaitable(data):
+                        data = await data
+                    cache_entry['data'] = data
+                    cache_entry['timestamp'] = asyncio.get_running_loop().time()
+                except Exception as e:
+                    logger.error(f"Error fetching data for {cache_key}: {e}")
+                    if cache_entry['data'] is None:
+                        cache_entry['data'] = []
     
     return cache_entry['data']
 
@@ -73,6 +128,9 @@ async def startup_event():
         # Validate configuration
         TradingConfig.validate_config()
         
+        # Compile / load the indicator kernels off the event loop
+        await asyncio.to_thread(signal_manager.warm_up)
+        
         # Start background data fetching
         asyncio.create_task(background_data_update())
         
@@ -81,6 +139,12 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Error during startup: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release fetcher and analysis resources"""
+    await market_data_fetcher.aclose()
+    signal_manager.close()
+
 async def background_data_update():
     """Background task to update market data and signals"""
     while True:
@@ -90,10 +154,11 @@ async def background_data_update():
             
             # Generate new signals
             await signal_manager.generate_all_signals()
+            refresh_signal_payload()
             
             # Clear caches to force refresh
             for key in cache:
-                cache[key]['timestamp'] = 0
+                cache[key]['timestamp'] = float('-inf')
             
             logger.info("Background data update completed")
             
@@ -129,95 +194,50 @@ async def root():
 @app.get("/signals")
 async def get_all_signals():
     """Get all active trading signals"""
-    try:
-        signals = await get_cached_or_fetch(
-            'signals',
-            lambda: signal_manager.get_active_signals()
-        )
-        
-        # Convert TradingSignal objects to dictionaries
-        signals_data = []
-        for signal in signals:
-            signal_dict = {
-                'id': signal.id,
-                'pair': signal.pair,
-                'timeframe': signal.timeframe,
-                'direction': signal.direction,
-                'strength': signal.strength,
-                'entry_price': signal.entry_price,
-                'current_price': signal.current_price,
-                'stop_loss': signal.stop_loss,
-                'take_profit_1': signal.take_profit_1,
-                'take_profit_2': signal.take_profit_2,
-                'take_profit_3': signal.take_profit_3,
-                'distance_pips': getattr(signal, 'distance_pips', 0),
-                'proximity_score': getattr(signal, 'proximity_score', 0),
-                'timestamp': signal.timestamp.isoformat(),
-                'reasons': signal.reasons,
-                'indicators': signal.indicators
-            }
-            signals_data.append(signal_dict)
-        
-        return JSONResponse(content=signals_data)
-        
-    except Exception as e:
-        logger.error(f"Error getting signals: {e}")
-        return JSONResponse(content=[], status_code=500)
+    return Response(content=signal_payload['bytes'], media_type="application/json")
 
 @app.get("/proximity-signals")
 async def get_proximity_signals(max_distance: float = Query(15.0, description="Maximum distance in pips")):
     """Get signals filtered by proximity to current price"""
     try:
         # Get current prices
-        current_prices = await market_data_fetcher.fetch_current_prices()
+        current_prices = await signal_manager.fetch_current_prices()
         
-        # Get all signals
-        all_signals = signal_manager.get_active_signals()
+        # Signals as prepared by the last background refresh
+        records = signal_payload['records']
         
-        # Convert to DataFrame for filtering
-        if all_signals:
-            signals_data = []
-            for signal in all_signals:
-                signals_data.append({
-                    'pair': signal.pair,
-                    'timeframe': signal.timeframe,
-                    'direction': signal.direction,
-                    'strength': signal.strength,
-                    'entry_price': signal.entry_price,
-                    'current_price': signal.current_price,
-                    'stop_loss': signal.stop_loss,
-                    'take_profit_1': signal.take_profit_1,
-                    'take_profit_2': signal.take_profit_2,
-                    'take_profit_3': signal.take_profit_3,
-                    'timestamp': signal.timestamp.isoformat(),
-                    'reasons': signal.reasons,
-                    'indicators': signal.indicators
-                })
-            
-            signals_df = pd.DataFrame(signals_data)
-            
-            # Apply proximity filter
-            filtered_signals_df = proximity_filter.filter_signals_by_proximity(
-                signals_df, current_prices, max_distance
+        if records:
+            prices = np.array(
+                [current_prices.get(pair, 0.0) for pair in signal_payload['pair']], dtype=np.float64
             )
+            for pair in set(signal_payload['pair'][prices == 0]):
+                logger.warning(f"No current price available for {pair}")
             
-            # Rank by proximity
-            filtered_signals_df = proximity_filter.rank_signals_by_proximity(filtered_signals_df)
+            # Filter and rank by proximity on the parallel arrays
+            order, distance, score = proximity_filter.rank_arrays_by_proximity(
+                signal_payload['entry'], prices, signal_payload['pip_value'], max_distance
+            )
             
-            # Convert back to list of dictionaries
+            stamp = int(datetime.now().timestamp())
             result = []
-            for _, row in filtered_signals_df.iterrows():
-                signal_dict = row.to_dict()
-                signal_dict['id'] = f"{row['pair']}_{row['timeframe']}_{int(datetime.now().timestamp())}"
+            for i, distance_pips, proximity_score in zip(order.tolist(), distance.tolist(), score.tolist()):
+                signal_dict = dict(records[i])
+                signal_dict['distance_pips'] = round(distance_pips, 1)
+                signal_dict['current_price'] = float(prices[i])
+                signal_dict['proximity_score'] = proximity_score
+                signal_dict['id'] = f"{signal_dict['pair']}_{signal_dict['timeframe']}_{stamp}"
                 result.append(signal_dict)
             
-            return JSONResponse(content=result)
+            return Response(
+                content=orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY),
+                media_type="application/json"
+            )
         
-        return JSONResponse(content=[])
+        return []
         
     except Exception as e:
         logger.error(f"Error getting proximity signals: {e}")
-        return JSONResponse(content=[], status_code=500)
+        return ORJSONResponse(content=[], status_code=500)
 
 @app.get("/signal")
 async def get_latest_signal():
@@ -227,32 +247,15 @@ async def get_latest_signal():
         if signals:
             latest_signal = max(signals, key=lambda s: s.timestamp)
             
-            signal_data = {
-                'id': latest_signal.id,
-                'pair': latest_signal.pair,
-                'timeframe': latest_signal.timeframe,
-                'direction': latest_signal.direction,
-                'strength': latest_signal.strength,
-                'entry_price': latest_signal.entry_price,
-                'current_price': latest_signal.current_price,
-                'stop_loss': latest_signal.stop_loss,
-                'take_profit_1': latest_signal.take_profit_1,
-                'take_profit_2': latest_signal.take_profit_2,
-                'take_profit_3': latest_signal.take_profit_3,
-                'distance_pips': getattr(latest_signal, 'distance_pips', 0),
-                'proximity_score': getattr(latest_signal, 'proximity_score', 0),
-                'timestamp': latest_signal.timestamp.isoformat(),
-                'reasons': latest_signal.reasons,
-                'indicators': latest_signal.indicators
-            }
+            signal_data = _signal_record(latest_signal)
             
-            return JSONResponse(content={'signal': signal_data})
+            return {'signal': signal_data}
         
-        return JSONResponse(content={'signal': None})
+        return {'signal': None}
         
     except Exception as e:
         logger.error(f"Error getting latest signal: {e}")
-        return JSONResponse(content={'signal': None}, status_code=500)
+        return ORJSONResponse(content={'signal': None}, status_code=500)
 
 @app.get("/market-data")
 async def get_market_data():
@@ -263,19 +266,28 @@ async def get_market_data():
             lambda: fetch_current_market_data()
         )
         
-        return JSONResponse(content=market_data)
+        return market_data
         
     except Exception as e:
         logger.error(f"Error getting market data: {e}")
-        return JSONResponse(content=[], status_code=500)
+        return ORJSONResponse(content=[], status_code=500)
+
+# Mock volume per pair, fixed for the life of the process
+_MOCK_VOLUME = {pair: 100000 + hash(pair) % 50000 for pair in TradingConfig.PAIRS}
+
+# Pairs shown in the market data panel (the first 6 configured)
+_HOT_PAIRS = TradingConfig.PAIR_ORDER[:6]
 
 async def fetch_current_market_data():
     """Fetch current market data for all pairs"""
     market_data = []
     
-    for pair_symbol in list(TradingConfig.PAIRS.keys())[:6]:  # Limit to first 6 pairs
+    # All pairs in a single pricing request
+    prices = await market_data_fetcher.get_current_prices(_HOT_PAIRS)
+    
+    for pair_symbol in _HOT_PAIRS:
         try:
-            price_data = await market_data_fetcher.get_current_price(pair_symbol)
+            price_data = prices.get(pair_symbol)
             if price_data:
                 # Calculate 24h change (simplified)
                 change_24h = (price_data['mid'] - price_data.get('previous_close', price_data['mid'])) / price_data['mid'] * 100
@@ -284,7 +296,7 @@ async def fetch_current_market_data():
                     'pair': pair_symbol,
                     'price': price_data['mid'],
                     'change_24h': round(change_24h, 2),
-                    'volume': 100000 + hash(pair_symbol) % 50000,  # Mock volume
+                    'volume': _MOCK_VOLUME[pair_symbol],
                     'timestamp': price_data['timestamp'].isoformat()
                 })
         except Exception as e:
@@ -309,17 +321,17 @@ async def health_check():
         
         status = "healthy" if data_available and (latest_data_age is None or latest_data_age < 60) else "degraded"
         
-        return JSONResponse(content={
+        return {
             "status": status,
             "data_available": data_available,
             "latest_data_age_minutes": latest_data_age,
             "active_signals_count": len(signals),
             "timestamp": datetime.now().timestamp()
-        })
+        }
         
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "unhealthy",
             "error": str(e),
             "timestamp": datetime.now().timestamp()
@@ -331,5 +343,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",
+        http="httptools"
     )
@@ -0,0 +1,19 @@
+
+import os
+from dotenv import dotenv_values
+
+# Set once .env has been merged into os.environ. Settings modules import this
+# module as src.config.env only, so the flag is shared by config.py and both
+# import names of trading_config; child processes inherit the merged
+# environment rather than a flag.
+_loaded = False
+
+def load_env():
+    """Merge .env into os.environ once per process; variables already set win"""
+    global _loaded
+    if _loaded:
+        return
+    for key, value in dotenv_values().items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    _loaded = True
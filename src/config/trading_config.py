@@ -1,12 +1,25 @@
 
 import os
-from typing import Dict, List
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from types import MappingProxyType
+from src.config.env import load_env
 
-load_dotenv()
+# .env is parsed once per process, shared with the top-level config.py
+load_env()
 
-@dataclass
+# Environment snapshot read by the settings below
+_ENV = os.environ.copy()
+
+def _get(key: str, default: Any = None, cast: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Read a setting from the environment snapshot, casting it when present"""
+    value = _ENV.get(key, default)
+    return cast(value) if cast is not None and value is not None else value
+
+@dataclass(frozen=True, slots=True)
 class TradingPair:
     symbol: str
     name: str
@@ -16,7 +29,7 @@ class TradingPair:
     session_preference: str  # 'london', 'newyork', 'tokyo', 'all'
     min_spread: float = 0.0
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeframeConfig:
     code: str
     name: str
@@ -24,7 +37,7 @@ class TimeframeConfig:
     oanda_granularity: str
     confirmation_weight: float = 1.0
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SessionConfig:
     name: str
     start_hour: int
@@ -34,7 +47,8 @@ class SessionConfig:
 
 class TradingConfig:
     # Expanded asset list - 30+ pairs
-    PAIRS = {
+    # Lookup tables are read-only views; entries are frozen dataclasses
+    PAIRS = MappingProxyType({
         # Major Forex Pairs
         'EUR_USD': TradingPair('EUR_USD', 'EUR/USD', 0.0001, 4, 'forex', 'all', 1.5),
         'GBP_USD': TradingPair('GBP_USD', 'GBP/USD', 0.0001, 4, 'forex', 'london', 2.0),
@@ -77,50 +91,54 @@ class TradingConfig:
         'XRP_USD': TradingPair('XRP_USD', 'Ripple/USD', 0.0001, 4, 'crypto', 'all', 0.001),
         'ADA_USD': TradingPair('ADA_USD', 'Cardano/USD', 0.0001, 4, 'crypto', 'all', 0.005),
         'DOT_USD': TradingPair('DOT_USD', 'Polkadot/USD', 0.01, 2, 'crypto', 'all', 0.10),
-    }
+    })
+    
+    # Fixed pair ordering for array layouts indexed by pair (symbols interned,
+    # so lookups with them hit the identity fast path)
+    PAIR_ORDER = tuple(sys.intern(symbol) for symbol in PAIRS)
     
     # Enhanced timeframes with confirmation weights
-    TIMEFRAMES = {
+    TIMEFRAMES = MappingProxyType({
         'M15': TimeframeConfig('M15', '15 Minutes', 15, 'M15', 0.5),
         'M30': TimeframeConfig('M30', '30 Minutes', 30, 'M30', 0.7),
         'H1': TimeframeConfig('H1', '1 Hour', 60, 'H1', 1.0),
         'H4': TimeframeConfig('H4', '4 Hours', 240, 'H4', 1.5),
         'D1': TimeframeConfig('D1', 'Daily', 1440, 'D', 2.0),
         'W1': TimeframeConfig('W1', 'Weekly', 10080, 'W', 3.0),
-    }
+    })
     
     # Trading sessions
-    SESSIONS = {
+    SESSIONS = MappingProxyType({
         'tokyo': SessionConfig('Tokyo', 0, 9, 'Asia/Tokyo'),
         'london': SessionConfig('London', 8, 17, 'Europe/London'),
         'newyork': SessionConfig('New York', 13, 22, 'America/New_York'),
         'sydney': SessionConfig('Sydney', 22, 7, 'Australia/Sydney'),
-    }
+    })
     
     # API Configuration
-    OANDA_API_KEY = os.getenv('OANDA_API_KEY')
-    OANDA_ACCOUNT_ID = os.getenv('OANDA_ACCOUNT_ID')
-    OANDA_ENVIRONMENT = os.getenv('OANDA_ENVIRONMENT', 'practice')
+    OANDA_API_KEY = _get('OANDA_API_KEY')
+    OANDA_ACCOUNT_ID = _get('OANDA_ACCOUNT_ID')
+    OANDA_ENVIRONMENT = _get('OANDA_ENVIRONMENT', 'practice')
     
     # Alternative API Keys
-    TWELVE_DATA_API_KEY = os.getenv('TWELVE_DATA_API_KEY')
-    ALPHA_VANTAGE_API_KEY = os.getenv('ALPHA_VANTAGE_API_KEY')
-    BINANCE_API_KEY = os.getenv('BINANCE_API_KEY')
-    POLYGON_API_KEY = os.getenv('POLYGON_API_KEY')
+    TWELVE_DATA_API_KEY = _get('TWELVE_DATA_API_KEY')
+    ALPHA_VANTAGE_API_KEY = _get('ALPHA_VANTAGE_API_KEY')
+    BINANCE_API_KEY = _get('BINANCE_API_KEY')
+    POLYGON_API_KEY = _get('POLYGON_API_KEY')
     
     # Telegram Configuration
-    TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-    TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+    TELEGRAM_BOT_TOKEN = _get('TELEGRAM_BOT_TOKEN')
+    TELEGRAM_CHAT_ID = _get('TELEGRAM_CHAT_ID')
     
     # Discord Configuration
-    DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL')
+    DISCORD_WEBHOOK_URL = _get('DISCORD_WEBHOOK_URL')
     
     # Email Configuration
-    EMAIL_SMTP_HOST = os.getenv('EMAIL_SMTP_HOST')
-    EMAIL_SMTP_PORT = int(os.getenv('EMAIL_SMTP_PORT', 587))
-    EMAIL_USERNAME = os.getenv('EMAIL_USERNAME')
-    EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
-    EMAIL_RECIPIENTS = os.getenv('EMAIL_RECIPIENTS', '').split(',')
+    EMAIL_SMTP_HOST = _get('EMAIL_SMTP_HOST')
+    EMAIL_SMTP_PORT = _get('EMAIL_SMTP_PORT', 587, int)
+    EMAIL_USERNAME = _get('EMAIL_USERNAME')
+    EMAIL_PASSWORD = _get('EMAIL_PASSWORD')
+    EMAIL_RECIPIENTS = _get('EMAIL_RECIPIENTS', '').split(',')
     
     # Enhanced Technical Analysis Parameters
     RSI_PERIOD = 14
@@ -143,44 +161,48 @@ class TradingConfig:
     VWAP_PERIOD = 20
     
     # Multi-timeframe confirmation
-    MTF_CONFIRMATION_ENABLED = os.getenv('MTF_CONFIRMATION_ENABLED', 'true').lower() == 'true'
-    MTF_HIGHER_TIMEFRAMES = ['H4', 'D1']  # Confirm signals with these timeframes
+    MTF_CONFIRMATION_ENABLED = _get('MTF_CONFIRMATION_ENABLED', 'true').lower() == 'true'
+    MTF_HIGHER_TIMEFRAMES = frozenset({'H4', 'D1'})  # Confirm signals with these timeframes
     
     # Session filtering
-    SESSION_FILTERING_ENABLED = os.getenv('SESSION_FILTERING_ENABLED', 'true').lower() == 'true'
-    ACTIVE_SESSIONS = os.getenv('ACTIVE_SESSIONS', 'london,newyork,tokyo').split(',')
+    SESSION_FILTERING_ENABLED = _get('SESSION_FILTERING_ENABLED', 'true').lower() == 'true'
+    # In configured order, which is also the priority when sessions overlap
+    ACTIVE_SESSIONS = tuple(dict.fromkeys(
+        session.strip() for session in _get('ACTIVE_SESSIONS', 'london,newyork,tokyo').split(',')
+    ))
+    ACTIVE_SESSION_SET = frozenset(ACTIVE_SESSIONS)  # For membership checks
     
     # Risk Management
-    DEFAULT_RISK_PERCENT = float(os.getenv('DEFAULT_RISK_PERCENT', 1.0))
-    MAX_RISK_PERCENT = float(os.getenv('MAX_RISK_PERCENT', 5.0))
-    MIN_RISK_PERCENT = float(os.getenv('MIN_RISK_PERCENT', 0.1))
+    DEFAULT_RISK_PERCENT = _get('DEFAULT_RISK_PERCENT', 1.0, float)
+    MAX_RISK_PERCENT = _get('MAX_RISK_PERCENT', 5.0, float)
+    MIN_RISK_PERCENT = _get('MIN_RISK_PERCENT', 0.1, float)
     
     # Position sizing modes
-    POSITION_SIZING_MODE = os.getenv('POSITION_SIZING_MODE', 'risk_percent')  # 'risk_percent' or 'fixed_lot'
-    FIXED_LOT_SIZE = float(os.getenv('FIXED_LOT_SIZE', 0.01))
+    POSITION_SIZING_MODE = _get('POSITION_SIZING_MODE', 'risk_percent')  # 'risk_percent' or 'fixed_lot'
+    FIXED_LOT_SIZE = _get('FIXED_LOT_SIZE', 0.01, float)
     
     # Signal filtering
-    MIN_SIGNAL_STRENGTH = float(os.getenv('MIN_SIGNAL_STRENGTH', 0.6))
-    MAX_SIGNALS_PER_PAIR_PER_DAY = int(os.getenv('MAX_SIGNALS_PER_PAIR_PER_DAY', 3))
+    MIN_SIGNAL_STRENGTH = _get('MIN_SIGNAL_STRENGTH', 0.6, float)
+    MAX_SIGNALS_PER_PAIR_PER_DAY = _get('MAX_SIGNALS_PER_PAIR_PER_DAY', 3, int)
     
     # Economic calendar integration
-    ECONOMIC_CALENDAR_ENABLED = os.getenv('ECONOMIC_CALENDAR_ENABLED', 'false').lower() == 'true'
-    ECONOMIC_CALENDAR_API_KEY = os.getenv('ECONOMIC_CALENDAR_API_KEY')
+    ECONOMIC_CALENDAR_ENABLED = _get('ECONOMIC_CALENDAR_ENABLED', 'false').lower() == 'true'
+    ECONOMIC_CALENDAR_API_KEY = _get('ECONOMIC_CALENDAR_API_KEY')
     
     # News impact filtering
-    HIGH_IMPACT_NEWS_BUFFER_MINUTES = int(os.getenv('HIGH_IMPACT_NEWS_BUFFER_MINUTES', 30))
+    HIGH_IMPACT_NEWS_BUFFER_MINUTES = _get('HIGH_IMPACT_NEWS_BUFFER_MINUTES', 30, int)
     
     # Database
-    DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///trading_signals.db')
+    DATABASE_URL = _get('DATABASE_URL', 'sqlite:///trading_signals.db')
     
     # API Settings
-    API_HOST = os.getenv('API_HOST', '0.0.0.0')
-    API_PORT = int(os.getenv('API_PORT', 8000))
-    API_KEY = os.getenv('API_KEY', 'your_api_key_here')
+    API_HOST = _get('API_HOST', '0.0.0.0')
+    API_PORT = _get('API_PORT', 8000, int)
+    API_KEY = _get('API_KEY', 'your_api_key_here')
     
     # Performance tracking
-    PERFORMANCE_TRACKING_ENABLED = os.getenv('PERFORMANCE_TRACKING_ENABLED', 'true').lower() == 'true'
-    BACKTEST_ENABLED = os.getenv('BACKTEST_ENABLED', 'true').lower() == 'true'
+    PERFORMANCE_TRACKING_ENABLED = _get('PERFORMANCE_TRACKING_ENABLED', 'true').lower() == 'true'
+    BACKTEST_ENABLED = _get('BACKTEST_ENABLED', 'true').lower() == 'true'
     
     @classmethod
     def validate_config(cls):
@@ -206,6 +228,11 @@ class TradingConfig:
         
         return True
     
+    @classmethod
+    def get_setting(cls, key: str, default: Any = None) -> Any:
+        """Get a setting not modelled above from the environment (default when unset)"""
+        return _get(key, default)
+    
     @classmethod
     def get_pair_config(cls, symbol: str) -> TradingPair:
         """Get configuration for a trading pair"""
@@ -227,12 +254,36 @@ class TradingConfig:
         return list(cls.PAIRS.keys())
     
     @classmethod
-    def get_pairs_by_category(cls, category: str) -> List[str]:
+    @lru_cache(maxsize=1)
+    def _build_indexes(cls) -> Tuple[Dict[str, Tuple[str, ...]], Dict[str, Tuple[str, ...]]]:
+        """
+        Build category and session inverted indexes over PAIRS (once)
+        
+        Returns:
+            Tuple of ({category: symbols}, {session: symbols}); each session
+            bucket also holds the 'all'-session pairs, in PAIRS order
+        """
+        by_category = defaultdict(list)
+        by_session = defaultdict(list)
+        sessions = set(cls.SESSIONS) | {pair.session_preference for pair in cls.PAIRS.values()}
+        for symbol, pair in cls.PAIRS.items():
+            by_category[pair.category].append(symbol)
+            for session in sessions:
+                if pair.session_preference in (session, 'all'):
+                    by_session[session].append(symbol)
+        return (
+            {category: tuple(symbols) for category, symbols in by_category.items()},
+            {session: tuple(symbols) for session, symbols in by_session.items()}
+        )
+    
+    @classmethod
+    def get_pairs_by_category(cls, category: str) -> Tuple[str, ...]:
         """Get pairs filtered by category"""
-        return [symbol for symbol, pair in cls.PAIRS.items() if pair.category == category]
+        return cls._build_indexes()[0].get(category, ())
     
     @classmethod
-    def get_pairs_by_session(cls, session: str) -> List[str]:
+    def get_pairs_by_session(cls, session: str) -> Tuple[str, ...]:
         """Get pairs that are active during a specific session"""
-        return [symbol for symbol, pair in cls.PAIRS.items() 
-                if pair.session_preference == session or pair.session_preference == 'all']
+        by_session = cls._build_indexes()[1]
+        # Unknown sessions still match the pairs traded in every session
+        return by_session.get(session, by_session.get('all', ()))
@@ -1,29 +1,58 @@
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
-import oandapyV20
-import oandapyV20.endpoints.instruments as instruments
+import httpx
+import orjson
 from src.config.trading_config import TradingConfig
 
 logger = logging.getLogger(__name__)
 
+# Connection pool for the Oanda REST API (one fetch cycle issues pairs x timeframes requests)
+OANDA_MAX_CONNECTIONS = 64
+OANDA_KEEPALIVE_SECONDS = 30
+# Candle requests allowed in flight at once (Oanda rate-limits bursts)
+OANDA_MAX_CONCURRENT_REQUESTS = 32
+
+# Storage dtypes for candle columns
+CANDLE_DTYPES = {
+    'open': np.float32, 'high': np.float32, 'low': np.float32, 'close': np.float32,
+    'volume': np.int32
+}
+
+# Oanda v20 REST hosts per environment
+OANDA_REST_URLS = {
+    'practice': 'https://api-fxpractice.oanda.com',
+    'live': 'https://api-fxtrade.oanda.com'
+}
+
 class MarketDataFetcher:
     """Enhanced market data fetcher for multiple pairs and timeframes"""
     
     def __init__(self):
-        self.api = oandapyV20.API(
-            access_token=TradingConfig.OANDA_API_KEY,
-            environment=TradingConfig.OANDA_ENVIRONMENT
+        # Shared keep-alive client; candle and price requests run on the event loop.
+        # Times come back as UNIX seconds, which parse far faster than RFC 3339
+        self._client = httpx.AsyncClient(
+            base_url=OANDA_REST_URLS.get(TradingConfig.OANDA_ENVIRONMENT, OANDA_REST_URLS['practice']),
+            headers={
+                "Authorization": f"Bearer {TradingConfig.OANDA_API_KEY}",
+                "Accept-Datetime-Format": "UNIX"
+            },
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(
+                max_connections=OANDA_MAX_CONNECTIONS, keepalive_expiry=OANDA_KEEPALIVE_SECONDS
+            )
         )
-        self.data_cache: Dict[str, pd.DataFrame] = {}
-        self.last_update: Dict[str, datetime] = {}
-    
-    def _get_cache_key(self, pair: str, timeframe: str) -> str:
-        """Generate cache key for pair-timeframe combination"""
-        return f"{pair}_{timeframe}"
+        self._sem = asyncio.Semaphore(OANDA_MAX_CONCURRENT_REQUESTS)
+        # Caches keyed by (pair, timeframe)
+        self.data_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+        # Monotonic time of the last fetch per cache key
+        self.last_update: Dict[Tuple[str, str], float] = {}
     
     async def fetch_ohlcv_data(self, pair: str, timeframe: str, count: int = 500) -> Optional[pd.DataFrame]:
         """
@@ -43,49 +72,59 @@ class MarketDataFetcher:
                 logger.error(f"Invalid timeframe: {timeframe}")
                 return None
             
+            # No new candle completes before the next close; reuse the last fetch until then
+            cache_key = (pair, timeframe)
+            if self._candles_current(cache_key, timeframe_config.minutes):
+                logger.debug("Using cached candles for %s %s", pair, timeframe)
+                return self.data_cache[cache_key]
+            
             params = {
                 "count": count,
                 "granularity": timeframe_config.oanda_granularity,
                 "price": "M"  # Mid prices
             }
             
-            request = instruments.InstrumentsCandles(
-                instrument=pair,
-                params=params
-            )
+            async with self._sem:
+                r = await self._client.get(f"/v3/instruments/{pair}/candles", params=params)
+            r.raise_for_status()
+            response = orjson.loads(r.content)
             
-            # Execute request asynchronously
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.api.request(request)
-            )
-            
-            # Process candles data
-            candles_data = []
+            # Process candles data into columns in one pass
+            ts, o, h, l, c, v = [], [], [], [], [], []
             for candle in response['candles']:
                 if candle['complete']:
-                    candles_data.append({
-                        'timestamp': pd.to_datetime(candle['time']),
-                        'open': float(candle['mid']['o']),
-                        'high': float(candle['mid']['h']),
-                        'low': float(candle['mid']['l']),
-                        'close': float(candle['mid']['c']),
-                        'volume': int(candle['volume'])
-                    })
-            
-            if not candles_data:
+                    mid = candle['mid']
+                    ts.append(candle['time'])
+                    o.append(mid['o'])
+                    h.append(mid['h'])
+                    l.append(mid['l'])
+                    c.append(mid['c'])
+                    v.append(candle['volume'])
+            
+            if not ts:
                 logger.warning(f"No candle data received for {pair} {timeframe}")
                 return None
             
-            df = pd.DataFrame(candles_data)
-            df.set_index('timestamp', inplace=True)
-            df.sort_index(inplace=True)
+            # float32 / int32 are ample for quotes and tick volume and halve memory traffic
+            df = pd.DataFrame(
+                {
+                    'open': np.asarray(o, dtype=CANDLE_DTYPES['open']),
+                    'high': np.asarray(h, dtype=CANDLE_DTYPES['high']),
+                    'low': np.asarray(l, dtype=CANDLE_DTYPES['low']),
+                    'close': np.asarray(c, dtype=CANDLE_DTYPES['close']),
+                    'volume': np.asarray(v, dtype=CANDLE_DTYPES['volume'])
+                },
+                index=pd.DatetimeIndex(
+                    pd.to_datetime(np.asarray(ts, dtype=np.float64), unit='s', utc=True), name='timestamp'
+                )
+            )
+            # Candles normally arrive ordered; only sort when they don't
+            if not df.index.is_monotonic_increasing:
+                df.sort_index(inplace=True)
             
             # Cache the data
-            cache_key = self._get_cache_key(pair, timeframe)
             self.data_cache[cache_key] = df
-            self.last_update[cache_key] = datetime.now()
+            self.last_update[cache_key] = time.monotonic()
             
             logger.info(f"Fetched {len(df)} candles for {pair} {timeframe}")
             return df
@@ -105,7 +144,7 @@ class MarketDataFetcher:
         
         # Create tasks for all pair-timeframe combinations
         tasks = []
-        for pair_symbol in TradingConfig.PAIRS.keys():
+        for pair_symbol in TradingConfig.PAIR_ORDER:
             all_data[pair_symbol] = {}
             for timeframe_code in TradingConfig.TIMEFRAMES.keys():
                 task = self.fetch_ohlcv_data(pair_symbol, timeframe_code)
@@ -127,50 +166,102 @@ class MarketDataFetcher:
     
     def get_cached_data(self, pair: str, timeframe: str) -> Optional[pd.DataFrame]:
         """Get cached data for a pair-timeframe combination"""
-        cache_key = self._get_cache_key(pair, timeframe)
-        return self.data_cache.get(cache_key)
+        return self.data_cache.get((pair, timeframe))
     
-    def is_data_fresh(self, pair: str, timeframe: str, max_age_minutes: int = 5) -> bool:
-        """Check if cached data is fresh enough"""
-        cache_key = self._get_cache_key(pair, timeframe)
-        last_update = self.last_update.get(cache_key)
+    def _candles_current(self, cache_key: Tuple[str, str], granularity_minutes: float) -> bool:
+        """
+        Check whether the cached candles still end with the latest completed one
         
-        if not last_update:
-            return False
+        The last cached candle opened at t and closed at t + granularity; the next one
+        completes at t + 2 * granularity, so the cache goes stale from then on.
         
-        age = datetime.now() - last_update
-        return age.total_seconds() < (max_age_minutes * 60)
+        Args:
+            cache_key: (pair, timeframe) cache key
+            granularity_minutes: Candle length in minutes
+            
+        Returns:
+            True if no newer candle can have completed yet
+        """
+        df = self.data_cache.get(cache_key)
+        if df is None or df.empty:
+            return False
+        next_close = df.index[-1].timestamp() + 2 * granularity_minutes * 60
+        return time.time() < next_close
+    
+    def is_data_fresh(self, pair: str, timeframe: str, max_age_minutes: float = 5) -> bool:
+        """Check if cached data is fresh enough"""
+        age = time.monotonic() - self.last_update.get((pair, timeframe), float('-inf'))
+        return age < max_age_minutes * 60
     
     async def get_current_price(self, pair: str) -> Optional[Dict]:
         """Get current bid/ask prices for a pair"""
         try:
-            request = instruments.InstrumentsPricing(
-                accountID=TradingConfig.OANDA_ACCOUNT_ID,
+            r = await self._client.get(
+                f"/v3/accounts/{TradingConfig.OANDA_ACCOUNT_ID}/pricing",
                 params={"instruments": pair}
             )
-            
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.api.request(request)
-            )
+            r.raise_for_status()
+            response = orjson.loads(r.content)
             
             if response['prices']:
                 price_data = response['prices'][0]
-                return {
-                    'instrument': price_data['instrument'],
-                    'bid': float(price_data['bids'][0]['price']),
-                    'ask': float(price_data['asks'][0]['price']),
-                    'mid': (float(price_data['bids'][0]['price']) + float(price_data['asks'][0]['price'])) / 2,
-                    'spread': float(price_data['asks'][0]['price']) - float(price_data['bids'][0]['price']),
-                    'timestamp': pd.to_datetime(price_data['time'])
-                }
+                return self._parse_price(price_data, pd.to_datetime(float(price_data['time']), unit='s', utc=True))
             
             return None
             
         except Exception as e:
             logger.error(f"Error fetching current price for {pair}: {e}")
             return None
+    
+    async def get_current_prices(self, pairs: Sequence[str]) -> Dict[str, Dict]:
+        """
+        Get current bid/ask prices for several pairs in one pricing request
+        
+        Args:
+            pairs: Trading pair symbols
+            
+        Returns:
+            Dictionary {pair: price data} for the pairs Oanda returned a price for
+        """
+        try:
+            r = await self._client.get(
+                f"/v3/accounts/{TradingConfig.OANDA_ACCOUNT_ID}/pricing",
+                params={"instruments": ",".join(pairs)}
+            )
+            r.raise_for_status()
+            response = orjson.loads(r.content)
+            
+            prices = response['prices']
+            # Parse every quote time in one vectorized call
+            times = pd.to_datetime(
+                np.asarray([price_data['time'] for price_data in prices], dtype=np.float64), unit='s', utc=True
+            )
+            return {
+                price_data['instrument']: self._parse_price(price_data, timestamp)
+                for price_data, timestamp in zip(prices, times)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error fetching current prices for {len(pairs)} pairs: {e}")
+            return {}
+    
+    @staticmethod
+    def _parse_price(price_data: Dict, timestamp: pd.Timestamp) -> Dict:
+        """Convert one Oanda pricing entry into bid/ask/mid/spread floats"""
+        bid = float(price_data['bids'][0]['price'])
+        ask = float(price_data['asks'][0]['price'])
+        return {
+            'instrument': price_data['instrument'],
+            'bid': bid,
+            'ask': ask,
+            'mid': (bid + ask) / 2,
+            'spread': ask - bid,
+            'timestamp': timestamp
+        }
+
+    async def aclose(self):
+        """Close the HTTP client"""
+        await self._client.aclose()
 
 # Global instance
 market_data_fetcher = MarketDataFetcher()
@@ -1,7 +1,8 @@
 
+import numpy as np
 import pandas as pd
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from src.config.trading_config import TradingConfig
 
 logger = logging.getLogger(__name__)
@@ -11,11 +12,16 @@ class ProximityFilter:
     
     def __init__(self, max_pips_distance: float = 10.0):
         self.max_pips_distance = max_pips_distance
+        # Pip values resolved so far, by pair
+        self._pip_cache: Dict[str, float] = {}
     
     def get_pip_value(self, pair: str) -> float:
         """Get pip value for a trading pair"""
-        pair_config = TradingConfig.get_pair_config(pair)
-        return pair_config.pip_value if pair_config else 0.0001
+        pip_value = self._pip_cache.get(pair)
+        if pip_value is None:
+            pair_config = TradingConfig.get_pair_config(pair)
+            pip_value = self._pip_cache[pair] = pair_config.pip_value if pair_config else 0.0001
+        return pip_value
     
     def calculate_distance_in_pips(self, entry_price: float, current_price: float, pair: str) -> float:
         """Calculate distance between entry and current price in pips"""
@@ -23,6 +29,14 @@ class ProximityFilter:
         distance = abs(entry_price - current_price) / pip_value
         return distance
     
+    @staticmethod
+    def _distance_in_pips(entry_prices: np.ndarray, current_prices: np.ndarray, pip_values: np.ndarray) -> np.ndarray:
+        """|entry - current| / pip_value, computed in place in a single output buffer"""
+        distance = np.subtract(entry_prices, current_prices, dtype=np.float64)
+        np.abs(distance, out=distance)
+        np.divide(distance, pip_values, out=distance)
+        return distance
+    
     def filter_signals_by_proximity(
         self, 
         signals_df: pd.DataFrame, 
@@ -44,37 +58,64 @@ class ProximityFilter:
             return signals_df
         
         threshold = threshold_pips or self.max_pips_distance
-        filtered_signals = []
+        pairs = signals_df['pair']
+        # Mapping a categorical pair column only touches its categories
+        pip_values = pairs.map(self.get_pip_value).astype(np.float64).to_numpy()
+        prices = pairs.map(current_prices).astype(np.float64).fillna(0).to_numpy()
         
-        for idx, signal in signals_df.iterrows():
-            pair = signal.get('pair', '')
-            entry_price = signal.get('entry_price', 0)
-            current_price = current_prices.get(pair, 0)
-            
-            if current_price == 0:
-                logger.warning(f"No current price available for {pair}")
-                continue
-            
-            # Calculate distance in pips
-            distance_pips = self.calculate_distance_in_pips(entry_price, current_price, pair)
-            
-            # Keep signal if within threshold
-            if distance_pips <= threshold:
-                # Add proximity info to signal
-                signal_dict = signal.to_dict()
-                signal_dict['distance_pips'] = round(distance_pips, 1)
-                signal_dict['current_price'] = current_price
-                signal_dict['proximity_score'] = max(0, (threshold - distance_pips) / threshold)
-                filtered_signals.append(signal_dict)
-                
-                logger.info(f"Signal kept: {pair} - Distance: {distance_pips:.1f} pips")
-            else:
-                logger.debug(f"Signal filtered out: {pair} - Distance: {distance_pips:.1f} pips (threshold: {threshold})")
+        priced = prices != 0
+        for pair in pairs[~priced].unique():
+            logger.warning(f"No current price available for {pair}")
         
-        if filtered_signals:
-            return pd.DataFrame(filtered_signals)
-        else:
+        # Distance in pips for every signal at once
+        distance = self._distance_in_pips(signals_df['entry_price'].to_numpy(dtype=np.float64), prices, pip_values)
+        keep = priced & (distance <= threshold)
+        
+        # One summary record per call; per-signal detail only when debugging
+        logger.info("Proximity filter kept %d/%d signals (threshold: %.1f)", keep.sum(), len(keep), threshold)
+        if logger.isEnabledFor(logging.DEBUG):
+            for pair, distance_pips, kept in zip(pairs.tolist(), distance.tolist(), keep.tolist()):
+                logger.debug("Signal %s: %s - Distance: %.1f pips", "kept" if kept else "filtered out", pair, distance_pips)
+        
+        if not keep.any():
             return pd.DataFrame()
+        
+        distance = distance[keep]
+        # Add proximity info to the kept signals
+        return signals_df.loc[keep].assign(
+            distance_pips=np.round(distance, 1),
+            current_price=prices[keep],
+            proximity_score=np.maximum(0.0, (threshold - distance) / threshold)
+        ).reset_index(drop=True)
+    
+    def rank_arrays_by_proximity(
+        self,
+        entry_prices: np.ndarray,
+        current_prices: np.ndarray,
+        pip_values: np.ndarray,
+        threshold_pips: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Filter and rank signals held as parallel arrays
+        
+        Args:
+            entry_prices: Entry price per signal
+            current_prices: Current price of each signal's pair (0 when unknown)
+            pip_values: Pip value of each signal's pair
+            threshold_pips: Maximum distance in pips (uses default if None)
+            
+        Returns:
+            Tuple of (indices of kept signals, closest first; their distance in
+            pips; their proximity score)
+        """
+        threshold = threshold_pips or self.max_pips_distance
+        distance = self._distance_in_pips(entry_prices, current_prices, pip_values)
+        keep = np.flatnonzero((current_prices != 0) & (distance <= threshold))
+        # Closer = better; stable so equal distances keep signal order
+        order = keep[np.argsort(distance[keep], kind='stable')]
+        distance = distance[order]
+        score = np.maximum(0.0, (threshold - distance) / threshold)
+        return order, distance, score
     
     def rank_signals_by_proximity(self, signals_df: pd.DataFrame) -> pd.DataFrame:
         """Rank signals by proximity score (closer = better)"""
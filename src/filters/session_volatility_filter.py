@@ -3,22 +3,96 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
-from datetime import datetime, timedelta
-import pytz
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 from src.config.trading_config import TradingConfig
 
 logger = logging.getLogger(__name__)
 
+# Valid ATR values the volatility percentile is ranked against
+ATR_PERCENTILE_WINDOW = 100
+MINUTES_PER_DAY = 24 * 60
+# High-impact news windows as (weekdays, start (h, m), end (h, m) inclusive, reason), in precedence order
+NEWS_WINDOWS = (
+    # London open: 8:00 UTC
+    (range(7), (7, 30), (8, 30), 'London session opening volatility'),
+    # New York open: 13:00 UTC
+    (range(7), (12, 30), (13, 30), 'New York session opening volatility'),
+    # Friday during NFP time (usually 13:30 UTC)
+    ((4,), (13, 30), (13, 45), 'Potential NFP release time'),
+)
+
+@dataclass(frozen=True, slots=True)
+class VolatilityInfo:
+    sufficient_volatility: bool
+    atr_value: float
+    atr_threshold: float
+    atr_percentile: float
+    reason: str
+
+@dataclass(frozen=True, slots=True)
+class SpreadInfo:
+    acceptable_spread: bool
+    current_spread: float
+    max_spread: float
+    spread_ratio: float
+    reason: str
+
+@dataclass(frozen=True, slots=True)
+class SessionInfo:
+    active_session: Optional[str]
+    session_active: bool
+
+# Shared results for the early-out checks
+_INSUFFICIENT_VOLATILITY_DATA = VolatilityInfo(False, 0, 0, 0, 'Insufficient data for volatility analysis')
+_NO_PRICE_DATA = SpreadInfo(False, 0, 0, 0, 'No current price data available')
+
 class SessionVolatilityFilter:
     """Filter signals based on trading sessions, volatility, and market conditions"""
     
     def __init__(self):
         self.session_timezones = {
-            'tokyo': pytz.timezone('Asia/Tokyo'),
-            'london': pytz.timezone('Europe/London'),
-            'newyork': pytz.timezone('America/New_York'),
-            'sydney': pytz.timezone('Australia/Sydney')
+            'tokyo': ZoneInfo('Asia/Tokyo'),
+            'london': ZoneInfo('Europe/London'),
+            'newyork': ZoneInfo('America/New_York'),
+            'sydney': ZoneInfo('Australia/Sydney')
+        }
+        # {session: (timezone, start_hour, end_hour, active)} for active sessions with a known timezone
+        self._session_cache = {
+            name: (self.session_timezones[name], config.start_hour, config.end_hour, config.active)
+            for name in TradingConfig.ACTIVE_SESSIONS
+            if (config := TradingConfig.get_session_config(name)) and name in self.session_timezones
         }
+        # Bit i of a session mask is self._session_names[i] (ACTIVE_SESSIONS priority order)
+        self._session_names = tuple(self._session_cache)
+        all_sessions = (1 << len(self._session_names)) - 1
+        self._pair_session_mask = {
+            symbol: all_sessions if pair.session_preference == 'all' else (
+                1 << self._session_names.index(pair.session_preference)
+                if pair.session_preference in self._session_names else 0
+            )
+            for symbol, pair in TradingConfig.PAIRS.items()
+        }
+        # UTC hour -> active session bits, rebuilt per UTC date (DST shifts the hours)
+        self._hour_session_mask = np.zeros(24, dtype=np.uint8)
+        self._mask_date = None
+        # {(pair, timeframe): (last bar time, sorted ATR window, ATR window in bar order)}
+        self._atr_sorted_cache: Dict[Tuple[str, str], Tuple[pd.Timestamp, np.ndarray, deque]] = {}
+        # {pair: (atr_threshold, max_spread, min_spread)}; TradingConfig tables are immutable
+        self._pair_thresholds = {
+            symbol: (
+                # Minimum spread scaled by the ATR multiplier, floored at the global minimum
+                max(pair.min_spread * TradingConfig.ATR_MULTIPLIER, TradingConfig.ATR_MIN_THRESHOLD),
+                # Maximum acceptable spread (3x normal spread)
+                pair.min_spread * 3,
+                pair.min_spread
+            )
+            for symbol, pair in TradingConfig.PAIRS.items()
+        }
+        # Minute-of-week news lookup: index weekday * MINUTES_PER_DAY + hour * 60 + minute
+        self._news_minute_mask, self._news_reasons = self._build_news_minutes()
     
     def is_session_active(self, pair: str, current_time: datetime = None) -> Tuple[bool, str]:
         """
@@ -35,45 +109,51 @@ class SessionVolatilityFilter:
             return True, 'all'
         
         if current_time is None:
-            current_time = datetime.utcnow()
-        
-        pair_config = TradingConfig.get_pair_config(pair)
-        if not pair_config:
-            return False, 'none'
+            current_time = datetime.now(timezone.utc)
+        elif current_time.tzinfo is None:
+            current_time = current_time.replace(tzinfo=timezone.utc)
+        else:
+            current_time = current_time.astimezone(timezone.utc)
         
-        # If pair prefers all sessions, check if any session is active
-        if pair_config.session_preference == 'all':
-            for session_name in TradingConfig.ACTIVE_SESSIONS:
-                if self._is_specific_session_active(session_name, current_time):
-                    return True, session_name
+        # Active sessions this hour that the pair trades in ('all' pairs take every session)
+        active_bits = (
+            int(self._hour_masks(current_time)[current_time.hour])
+            & self._pair_session_mask.get(pair, 0)
+        )
+        if not active_bits:
             return False, 'none'
         
-        # Check specific session preference
-        if pair_config.session_preference in TradingConfig.ACTIVE_SESSIONS:
-            is_active = self._is_specific_session_active(
-                pair_config.session_preference, current_time
-            )
-            return is_active, pair_config.session_preference if is_active else 'none'
-        
-        return False, 'none'
+        # Lowest set bit = first session in ACTIVE_SESSIONS order
+        return True, self._session_names[(active_bits & -active_bits).bit_length() - 1]
+    
+    def _hour_masks(self, current_time: datetime) -> np.ndarray:
+        """Hour-of-day session bitmap for the UTC date of current_time"""
+        day = current_time.date()
+        if day != self._mask_date:
+            midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+            mask = np.zeros(24, dtype=np.uint8)
+            for hour in range(24):
+                hour_time = midnight + timedelta(hours=hour)
+                for bit, session_name in enumerate(self._session_names):
+                    if self._is_specific_session_active(session_name, hour_time):
+                        mask[hour] |= 1 << bit
+            self._hour_session_mask = mask
+            self._mask_date = day
+        return self._hour_session_mask
     
     def _is_specific_session_active(self, session_name: str, current_time: datetime) -> bool:
         """Check if a specific session is currently active"""
-        session_config = TradingConfig.get_session_config(session_name)
-        if not session_config or not session_config.active:
+        session = self._session_cache.get(session_name)
+        if session is None:
             return False
-        
-        # Convert UTC time to session timezone
-        session_tz = self.session_timezones.get(session_name)
-        if not session_tz:
+        session_tz, start_hour, end_hour, active = session
+        if not active:
             return False
         
-        utc_time = current_time.replace(tzinfo=pytz.UTC)
-        session_time = utc_time.astimezone(session_tz)
-        current_hour = session_time.hour
-        
-        start_hour = session_config.start_hour
-        end_hour = session_config.end_hour
+        # Convert UTC time to session timezone (naive times are taken as UTC)
+        if current_time.tzinfo is None:
+            current_time = current_time.replace(tzinfo=timezone.utc)
+        current_hour = current_time.astimezone(session_tz).hour
         
         # Handle sessions that cross midnight
         if start_hour <= end_hour:
@@ -81,42 +161,93 @@ class SessionVolatilityFilter:
         else:
             return current_hour >= start_hour or current_hour < end_hour
     
-    def check_volatility_conditions(self, df: pd.DataFrame, pair: str) -> Dict:
+    def check_volatility_conditions(self, df: pd.DataFrame, pair: str, timeframe: Optional[str] = None) -> VolatilityInfo:
         """
         Check volatility conditions for signal generation
         
         Args:
             df: OHLCV DataFrame with indicators
             pair: Trading pair symbol
+            timeframe: Timeframe of df; when given, the ATR window is cached and
+                updated bar by bar for this pair/timeframe
             
         Returns:
-            Dictionary with volatility analysis results
+            VolatilityInfo with volatility analysis results
         """
         if len(df) < 20:
-            return {
-                'sufficient_volatility': False,
-                'atr_value': 0,
-                'atr_threshold': 0,
-                'volatility_percentile': 0,
-                'reason': 'Insufficient data for volatility analysis'
-            }
+            return _INSUFFICIENT_VOLATILITY_DATA
         
-        latest = df.iloc[-1]
-        atr_current = latest.get('atr', 0)
+        atr_values = df['atr'].to_numpy(dtype=np.float64)
+        atr_current = float(atr_values[-1])
+        atr_threshold = self._atr_threshold(pair)
         
-        # Calculate ATR percentiles over last 100 periods
-        atr_series = df['atr'].dropna().tail(100)
-        atr_percentile = (atr_series <= atr_current).mean() * 100
+        # Below the absolute threshold the percentile cannot change the outcome
+        if atr_current < atr_threshold:
+            return self._volatility_info(atr_current, atr_threshold, 0.0)
         
-        # Get pair-specific ATR threshold
-        pair_config = TradingConfig.get_pair_config(pair)
-        if pair_config:
-            # Use minimum spread as base threshold, scaled by ATR multiplier
-            base_threshold = pair_config.min_spread * TradingConfig.ATR_MULTIPLIER
-            atr_threshold = max(base_threshold, TradingConfig.ATR_MIN_THRESHOLD)
-        else:
-            atr_threshold = TradingConfig.ATR_MIN_THRESHOLD
+        # Calculate ATR percentiles over the last 100 valid periods
+        sorted_atr = self._sorted_atr_window(df, atr_values, pair, timeframe)
+        atr_percentile = (
+            int(np.searchsorted(sorted_atr, atr_current, side='right')) * 100.0 / sorted_atr.size
+            if sorted_atr.size and not np.isnan(atr_current) else 0.0
+        )
         
+        return self._volatility_info(atr_current, atr_threshold, atr_percentile)
+    
+    def check_volatility_batch(self, frames: List[Tuple[str, str, pd.DataFrame]]) -> List[VolatilityInfo]:
+        """
+        Check volatility conditions for many pair/timeframe frames at once
+        
+        The cached ATR windows are stacked into one NaN-padded array so the
+        percentile ranks and threshold checks run as single numpy passes.
+        
+        Args:
+            frames: (pair, timeframe, DataFrame) triples
+            
+        Returns:
+            VolatilityInfo per frame, in input order
+        """
+        results = [_INSUFFICIENT_VOLATILITY_DATA] * len(frames)
+        rows = [i for i, (_, _, df) in enumerate(frames) if len(df) >= 20]
+        if not rows:
+            return results
+        
+        windows = np.full((len(rows), ATR_PERCENTILE_WINDOW), np.nan)
+        sizes = np.empty(len(rows), dtype=np.int64)
+        currents = np.empty(len(rows), dtype=np.float64)
+        thresholds = np.empty(len(rows), dtype=np.float64)
+        for row, i in enumerate(rows):
+            pair, timeframe, df = frames[i]
+            atr_values = df['atr'].to_numpy(dtype=np.float64)
+            currents[row] = atr_values[-1]
+            thresholds[row] = self._atr_threshold(pair)
+            # Rows below the absolute threshold are rejected without a percentile
+            if currents[row] < thresholds[row]:
+                sizes[row] = 0
+                continue
+            sorted_atr = self._sorted_atr_window(df, atr_values, pair, timeframe)
+            windows[row, :sorted_atr.size] = sorted_atr
+            sizes[row] = sorted_atr.size
+        
+        # NaN padding never compares <=, so the counts cover the valid values only
+        counts = np.count_nonzero(windows <= currents[:, None], axis=1)
+        valid = (sizes > 0) & ~np.isnan(currents)
+        percentiles = np.divide(counts * 100.0, sizes, out=np.zeros(len(rows)), where=valid)
+        
+        for row, i in enumerate(rows):
+            results[i] = self._volatility_info(
+                float(currents[row]), float(thresholds[row]), float(percentiles[row])
+            )
+        return results
+    
+    def _atr_threshold(self, pair: str) -> float:
+        """Pair-specific ATR threshold, or the global minimum for unknown pairs"""
+        thresholds = self._pair_thresholds.get(pair)
+        return thresholds[0] if thresholds else TradingConfig.ATR_MIN_THRESHOLD
+    
+    @staticmethod
+    def _volatility_info(atr_current: float, atr_threshold: float, atr_percentile: float) -> VolatilityInfo:
+        """Apply the ATR threshold and percentile rules to one frame's values"""
         # Check conditions
         sufficient_volatility = (
             atr_current >= atr_threshold and 
@@ -131,15 +262,49 @@ class SessionVolatilityFilter:
         else:
             reason = f"Sufficient volatility: ATR {atr_current:.5f} ({atr_percentile:.1f}th percentile)"
         
-        return {
-            'sufficient_volatility': sufficient_volatility,
-            'atr_value': atr_current,
-            'atr_threshold': atr_threshold,
-            'atr_percentile': atr_percentile,
-            'reason': reason
-        }
+        return VolatilityInfo(sufficient_volatility, atr_current, atr_threshold, atr_percentile, reason)
+    
+    def _sorted_atr_window(
+        self,
+        df: pd.DataFrame,
+        atr_values: np.ndarray,
+        pair: str,
+        timeframe: Optional[str]
+    ) -> np.ndarray:
+        """
+        Sorted last ATR_PERCENTILE_WINDOW valid ATR values of df
+        
+        With a timeframe, the window is cached per (pair, timeframe): the same
+        bar reuses it, and a single new bar swaps the oldest value for the
+        newest with searchsorted instead of re-sorting.
+        """
+        last_time = df.index[-1]
+        cached = self._atr_sorted_cache.get((pair, timeframe)) if timeframe else None
+        
+        if cached is not None:
+            cached_time, sorted_atr, window = cached
+            if cached_time == last_time:
+                return sorted_atr
+            new_atr = atr_values[-1]
+            if len(df) > 1 and df.index[-2] == cached_time and not np.isnan(new_atr):
+                if len(window) == ATR_PERCENTILE_WINDOW:
+                    oldest = window.popleft()
+                    sorted_atr = np.delete(sorted_atr, np.searchsorted(sorted_atr, oldest))
+                window.append(new_atr)
+                sorted_atr = np.insert(sorted_atr, np.searchsorted(sorted_atr, new_atr), new_atr)
+                self._atr_sorted_cache[(pair, timeframe)] = (last_time, sorted_atr, window)
+                return sorted_atr
+        
+        # Cold start, gap or NaN: rebuild from the column
+        atr_tail = atr_values[~np.isnan(atr_values)][-ATR_PERCENTILE_WINDOW:]
+        sorted_atr = np.sort(atr_tail)
+        if timeframe:
+            self._atr_sorted_cache[(pair, timeframe)] = (
+                last_time, sorted_atr, deque(atr_tail.tolist(), maxlen=ATR_PERCENTILE_WINDOW)
+            )
+        return sorted_atr
     
-    def check_spread_conditions(self, current_price_data: Dict, pair: str) -> Dict:
+    def check_spread_conditions(self, current_price_data: Dict, pair: str) -> SpreadInfo:
         """
         Check if spread conditions are acceptable for trading
         
@@ -148,32 +313,19 @@ class SessionVolatilityFilter:
             pair: Trading pair symbol
             
         Returns:
-            Dictionary with spread analysis results
+            SpreadInfo with spread analysis results
         """
         if not current_price_data:
-            return {
-                'acceptable_spread': False,
-                'current_spread': 0,
-                'max_spread': 0,
-                'spread_ratio': 0,
-                'reason': 'No current price data available'
-            }
+            return _NO_PRICE_DATA
         
         current_spread = current_price_data.get('spread', 0)
-        pair_config = TradingConfig.get_pair_config(pair)
+        thresholds = self._pair_thresholds.get(pair)
         
-        if not pair_config:
-            return {
-                'acceptable_spread': False,
-                'current_spread': current_spread,
-                'max_spread': 0,
-                'spread_ratio': 0,
-                'reason': 'Unknown pair configuration'
-            }
+        if thresholds is None:
+            return SpreadInfo(False, current_spread, 0, 0, 'Unknown pair configuration')
         
-        # Maximum acceptable spread (3x normal spread)
-        max_spread = pair_config.min_spread * 3
-        spread_ratio = current_spread / pair_config.min_spread if pair_config.min_spread > 0 else 0
+        _, max_spread, min_spread = thresholds
+        spread_ratio = current_spread / min_spread if min_spread > 0 else 0
         
         acceptable_spread = current_spread <= max_spread
         
@@ -183,13 +335,33 @@ class SessionVolatilityFilter:
             else f"Spread too wide: {current_spread:.5f} > {max_spread:.5f}"
         )
         
-        return {
-            'acceptable_spread': acceptable_spread,
-            'current_spread': current_spread,
-            'max_spread': max_spread,
-            'spread_ratio': spread_ratio,
-            'reason': reason
-        }
+        return SpreadInfo(acceptable_spread, current_spread, max_spread, spread_ratio, reason)
+    
+    def _spread_ok(self, current_price_data: Dict, pair: str) -> bool:
+        """Hot-path form of check_spread_conditions: only the acceptable_spread flag"""
+        thresholds = self._pair_thresholds.get(pair)
+        if not current_price_data or thresholds is None:
+            return False
+        return current_price_data.get('spread', 0) <= thresholds[1]
+    
+    @staticmethod
+    def _build_news_minutes() -> Tuple[np.ndarray, Dict[int, str]]:
+        """
+        Mark every minute of the week covered by NEWS_WINDOWS
+        
+        Returns:
+            Tuple of (boolean minute-of-week mask, {minute index: reason})
+        """
+        mask = np.zeros(7 * MINUTES_PER_DAY, dtype=bool)
+        reasons = {}
+        # Earlier windows take precedence where windows overlap
+        for weekdays, (start_hour, start_minute), (end_hour, end_minute), reason in reversed(NEWS_WINDOWS):
+            for weekday in weekdays:
+                day_start = weekday * MINUTES_PER_DAY
+                for idx in range(day_start + start_hour * 60 + start_minute, day_start + end_hour * 60 + end_minute + 1):
+                    mask[idx] = True
+                    reasons[idx] = reason
+        return mask, reasons
     
     def is_major_news_time(self, current_time: datetime = None) -> Dict:
         """
@@ -208,7 +380,7 @@ class SessionVolatilityFilter:
             }
         
         if current_time is None:
-            current_time = datetime.utcnow()
+            current_time = datetime.now(timezone.utc)
         
         # Check for common high-impact news times (simplified)
         # This would typically integrate with an economic calendar API
@@ -219,31 +391,13 @@ class SessionVolatilityFilter:
         # BOJ meetings
         # GDP releases
         
-        # For now, implement basic time-based filtering
+        # For now, implement basic time-based filtering (see NEWS_WINDOWS)
         # Avoid trading 30 minutes before and after major session opens
-        utc_hour = current_time.hour
-        utc_minute = current_time.minute
-        
-        # London open: 8:00 UTC
-        if (utc_hour == 7 and utc_minute >= 30) or (utc_hour == 8 and utc_minute <= 30):
-            return {
-                'is_news_time': True,
-                'reason': 'London session opening volatility'
-            }
-        
-        # New York open: 13:00 UTC
-        if (utc_hour == 12 and utc_minute >= 30) or (utc_hour == 13 and utc_minute <= 30):
-            return {
-                'is_news_time': True,
-                'reason': 'New York session opening volatility'
-            }
-        
-        # Check if it's Friday during NFP time (usually 13:30 UTC)
-        if (current_time.weekday() == 4 and  # Friday
-            utc_hour == 13 and 30 <= utc_minute <= 45):
+        idx = current_time.weekday() * MINUTES_PER_DAY + current_time.hour * 60 + current_time.minute
+        if self._news_minute_mask[idx]:
             return {
                 'is_news_time': True,
-                'reason': 'Potential NFP release time'
+                'reason': self._news_reasons[idx]
             }
         
         return {
@@ -251,6 +405,73 @@ class SessionVolatilityFilter:
             'reason': 'No major news events detected'
         }
     
+    def _filter_one_pair(
+        self,
+        pair: str,
+        timeframe_signals: Dict[str, Dict],
+        current_prices: Optional[Dict[str, Dict]],
+        current_time: datetime,
+        volatility: Dict[Tuple[str, str], VolatilityInfo]
+    ) -> Optional[Dict[str, Dict]]:
+        """Apply the session, volatility and spread filters to one pair's signals"""
+        # Per-signal messages are only formatted when INFO is enabled
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        
+        # Check session activity
+        session_active, active_session = self.is_session_active(pair, current_time)
+        if not session_active:
+            if info_enabled:
+                logger.info("Skipping %s - session not active", pair)
+            return None
+        
+        # (timeframe, signal_data) for signals that pass; the dict is only built if any do
+        passed = []
+        # Shared by every timeframe of this pair
+        session_info = SessionInfo(active_session, session_active)
+        # Spread is per pair: decide it once, build the SpreadInfo only when it is attached or logged
+        price_data = current_prices.get(pair) if current_prices else None
+        has_price = current_prices is not None and pair in current_prices
+        spread_ok = has_price and self._spread_ok(price_data, pair)
+        spread_check = None
+        
+        for timeframe, signal_data in timeframe_signals.items():
+            # Volatility conditions, checked in filter_signals for every frame with market data
+            volatility_check = volatility.get((pair, timeframe))
+            if volatility_check is None:
+                continue
+            if not volatility_check.sufficient_volatility:
+                if info_enabled:
+                    logger.info("Skipping %s %s signal - %s", pair, timeframe, volatility_check.reason)
+                continue
+            
+            # Check spread conditions if current prices available
+            if has_price:
+                if not spread_ok:
+                    if info_enabled:
+                        logger.info(
+                            "Skipping %s %s signal - %s",
+                            pair, timeframe, self.check_spread_conditions(price_data, pair).reason
+                        )
+                    continue
+                
+                # Add spread info to signal
+                if spread_check is None:
+                    spread_check = self.check_spread_conditions(price_data, pair)
+                signal_data['spread_info'] = spread_check
+            
+            # Add session and volatility info to signal
+            signal_data['session_info'] = session_info
+            signal_data['volatility_info'] = volatility_check
+            
+            passed.append((timeframe, signal_data))
+            if info_enabled:
+                logger.info(
+                    "Signal passed filters: %s %s %s (Session: %s, ATR: %.1f%%)",
+                    pair, timeframe, signal_data['direction'], active_session, volatility_check.atr_percentile
+                )
+        
+        return dict(passed) if passed else None
+    
     def filter_signals(
         self, 
         signals: Dict[str, Dict[str, Dict]], 
@@ -269,64 +490,32 @@ class SessionVolatilityFilter:
             Filtered signals
         """
         filtered_signals = {}
-        current_time = datetime.utcnow()
+        # One UTC-aware "now" shared by every news and session check below
+        current_time = datetime.now(timezone.utc)
         
         # Check for major news time
         news_check = self.is_major_news_time(current_time)
         if news_check['is_news_time']:
-            logger.warning(f"Major news time detected: {news_check['reason']} - No signals will be generated")
+            logger.warning("Major news time detected: %s - No signals will be generated", news_check['reason'])
             return {}
         
+        # Check volatility for every signalled pair/timeframe in one batch
+        frames = []
         for pair, timeframe_signals in signals.items():
-            # Check session activity
-            session_active, active_session = self.is_session_active(pair, current_time)
-            if not session_active:
-                logger.info(f"Skipping {pair} - session not active")
-                continue
-            
-            filtered_pair_signals = {}
-            
-            for timeframe, signal_data in timeframe_signals.items():
-                # Get market data for this pair and timeframe
-                pair_data = market_data.get(pair, {})
+            pair_data = market_data.get(pair, {})
+            for timeframe in timeframe_signals:
                 df = pair_data.get(timeframe)
-                
-                if df is None or len(df) == 0:
-                    continue
-                
-                # Check volatility conditions
-                volatility_check = self.check_volatility_conditions(df, pair)
-                if not volatility_check['sufficient_volatility']:
-                    logger.info(
-                        f"Skipping {pair} {timeframe} signal - {volatility_check['reason']}"
-                    )
-                    continue
-                
-                # Check spread conditions if current prices available
-                if current_prices and pair in current_prices:
-                    spread_check = self.check_spread_conditions(current_prices[pair], pair)
-                    if not spread_check['acceptable_spread']:
-                        logger.info(
-                            f"Skipping {pair} {timeframe} signal - {spread_check['reason']}"
-                        )
-                        continue
-                    
-                    # Add spread info to signal
-                    signal_data['spread_info'] = spread_check
-                
-                # Add session and volatility info to signal
-                signal_data['session_info'] = {
-                    'active_session': active_session,
-                    'session_active': session_active
-                }
-                signal_data['volatility_info'] = volatility_check
-                
-                filtered_pair_signals[timeframe] = signal_data
-                logger.info(
-                    f"Signal passed filters: {pair} {timeframe} {signal_data['direction']} "
-                    f"(Session: {active_session}, ATR: {volatility_check['atr_percentile']:.1f}%)"
-                )
-            
+                if df is not None and df.shape[0] > 0:
+                    frames.append((pair, timeframe, df))
+        volatility = dict(zip(
+            ((pair, timeframe) for pair, timeframe, _ in frames),
+            self.check_volatility_batch(frames)
+        ))
+        
+        for pair, timeframe_signals in signals.items():
+            filtered_pair_signals = self._filter_one_pair(
+                pair, timeframe_signals, current_prices, current_time, volatility
+            )
             if filtered_pair_signals:
                 filtered_signals[pair] = filtered_pair_signals
         
@@ -0,0 +1,28 @@
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True, fastmath=True, nogil=True)
+def drawdown_kernel(results, start_equity, start_peak):
+    """
+    Walk an equity curve once from per-trade dollar results
+    
+    Returns (max_drawdown, max_drawdown_percent, final_equity, peak_equity),
+    starting from start_equity with a running peak of start_peak.
+    """
+    equity = start_equity
+    peak = start_peak
+    max_drawdown = 0.0
+    max_drawdown_percent = 0.0
+    for i in range(results.shape[0]):
+        equity += results[i]
+        if equity > peak:
+            peak = equity
+        drawdown = peak - equity
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+        if peak > 0:
+            drawdown_percent = drawdown / peak * 100.0
+            if drawdown_percent > max_drawdown_percent:
+                max_drawdown_percent = drawdown_percent
+    return max_drawdown, max_drawdown_percent, equity, peak
@@ -1,15 +1,40 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 import logging
+import math
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
 import json
 from dataclasses import dataclass, asdict
 from src.config.trading_config import TradingConfig
+from src.performance._kernels import drawdown_kernel
 
 logger = logging.getLogger(__name__)
 
+# Equity curve points kept (and reported by get_performance_summary)
+EQUITY_CURVE_POINTS = 100
+
+# Initial row capacity of the trade column buffers (doubled when full)
+TRADE_BUFFER_CAPACITY = 64
+
+# TradeResult fields mirrored as parallel arrays: {field: dtype}
+TRADE_COLUMNS = {
+    'dollar_result': np.float64,
+    'pips_result': np.float64,
+    'signal_strength': np.float64,
+    'duration_minutes': np.float64,
+    'mtf_confirmation': np.bool_,
+    'pair': object,
+    'timeframe': object,
+    'session': object,
+    'exit_type': object,
+    'direction': object,
+    'entry_time': object,
+    'exit_time': object,
+}
+
 @dataclass
 class TradeResult:
     """Data class for individual trade results"""
@@ -54,19 +79,193 @@ class PerformanceMetrics:
     recovery_factor: float
     expectancy: float
 
+@dataclass(slots=True)
+class _RunningStats:
+    """Running totals for one group of trades, updated in O(1) per trade"""
+    count: int = 0
+    total_pips: float = 0.0
+    total_profit: float = 0.0
+    # Welford mean and sum of squared deviations of dollar results
+    mean: float = 0.0
+    m2: float = 0.0
+    win_count: int = 0
+    loss_count: int = 0
+    gross_profit: float = 0.0
+    gross_loss: float = 0.0
+    largest_win: float = 0.0
+    largest_loss: float = 0.0
+    equity: float = 10000.0  # Starting equity
+    peak_equity: float = 10000.0
+    max_drawdown: float = 0.0
+    max_drawdown_percent: float = 0.0
+    first_entry: Optional[datetime] = None
+    last_exit: Optional[datetime] = None
+    
+    def add(self, trade: TradeResult):
+        """Fold one trade into the totals"""
+        result = trade.dollar_result
+        self.count += 1
+        self.total_pips += trade.pips_result
+        self.total_profit += result
+        
+        delta = result - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (result - self.mean)
+        
+        if result > 0:
+            self.win_count += 1
+            self.gross_profit += result
+            self.largest_win = max(self.largest_win, result)
+        elif result < 0:
+            self.loss_count += 1
+            self.gross_loss -= result
+            self.largest_loss = max(self.largest_loss, -result)
+        
+        # Drawdown against the running equity peak
+        self.equity += result
+        self.peak_equity = max(self.peak_equity, self.equity)
+        drawdown = self.peak_equity - self.equity
+        self.max_drawdown = max(self.max_drawdown, drawdown)
+        if self.peak_equity > 0:
+            self.max_drawdown_percent = max(self.max_drawdown_percent, drawdown / self.peak_equity * 100)
+        
+        if self.first_entry is None or trade.entry_time < self.first_entry:
+            self.first_entry = trade.entry_time
+        if self.last_exit is None or trade.exit_time > self.last_exit:
+            self.last_exit = trade.exit_time
+    
+    def add_batch(self, results: np.ndarray, pips: np.ndarray, entry_times: np.ndarray, exit_times: np.ndarray):
+        """Fold a run of trades (parallel arrays in trade order) into the totals"""
+        batch_count = len(results)
+        if not batch_count:
+            return
+        previous_count = self.count
+        self.count += batch_count
+        self.total_pips += float(pips.sum())
+        self.total_profit += float(results.sum())
+        
+        # Merge the batch's mean and squared deviations into the running ones
+        batch_mean = float(results.mean())
+        batch_m2 = float(((results - batch_mean) ** 2).sum())
+        delta = batch_mean - self.mean
+        self.mean += delta * batch_count / self.count
+        self.m2 += batch_m2 + delta * delta * previous_count * batch_count / self.count
+        
+        wins = results[results > 0]
+        losses = -results[results < 0]
+        self.win_count += len(wins)
+        self.loss_count += len(losses)
+        self.gross_profit += float(wins.sum())
+        self.gross_loss += float(losses.sum())
+        if wins.size:
+            self.largest_win = max(self.largest_win, float(wins.max()))
+        if losses.size:
+            self.largest_loss = max(self.largest_loss, float(losses.max()))
+        
+        # Continue the equity curve from the running equity and peak
+        max_drawdown, max_drawdown_percent, self.equity, self.peak_equity = drawdown_kernel(
+            results, self.equity, self.peak_equity
+        )
+        self.max_drawdown = max(self.max_drawdown, max_drawdown)
+        self.max_drawdown_percent = max(self.max_drawdown_percent, max_drawdown_percent)
+        
+        first_entry = min(entry_times)
+        last_exit = max(exit_times)
+        if self.first_entry is None or first_entry < self.first_entry:
+            self.first_entry = first_entry
+        if self.last_exit is None or last_exit > self.last_exit:
+            self.last_exit = last_exit
+
 class PerformanceTracker:
     """Track and analyze trading performance"""
     
     def __init__(self):
         self.trades: List[TradeResult] = []
-        self.equity_curve: List[Dict] = []
+        self.equity_curve: Deque[Dict] = deque(maxlen=EQUITY_CURVE_POINTS)
+        self._cumulative_pips = 0.0
         self.daily_results: Dict[str, float] = {}
-        self.pair_performance: Dict[str, PerformanceMetrics] = {}
-        self.timeframe_performance: Dict[str, PerformanceMetrics] = {}
+        # Monthly/weekly P&L, keyed like daily_results and updated per trade
+        self._monthly_results: Dict[str, float] = defaultdict(float)
+        self._weekly_results: Dict[str, float] = defaultdict(float)
+        # Running totals behind the performance metrics, overall and per pair/timeframe
+        self._overall_stats = _RunningStats()
+        self._pair_stats: Dict[str, _RunningStats] = defaultdict(_RunningStats)
+        self._timeframe_stats: Dict[str, _RunningStats] = defaultdict(_RunningStats)
+        # Column view of self.trades; only the first self._count rows are filled
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(TRADE_BUFFER_CAPACITY, dtype=dtype) for name, dtype in TRADE_COLUMNS.items()
+        }
+        self._count = 0
+        # Last get_performance_summary result; cleared whenever a trade is recorded
+        self._summary_cache: Optional[Dict] = None
+        
+    def _append_columns(self, trade_result: TradeResult):
+        """Append one trade to the column buffers, doubling them when full"""
+        if self._count == len(self._columns['dollar_result']):
+            self._columns = {
+                name: np.concatenate([column, np.empty(len(column), dtype=column.dtype)])
+                for name, column in self._columns.items()
+            }
+        for name, column in self._columns.items():
+            column[self._count] = getattr(trade_result, name)
+        self._count += 1
+    
+    def _column(self, name: str) -> np.ndarray:
+        """Filled part of a trade column buffer"""
+        return self._columns[name][:self._count]
         
     def add_trade_result(self, trade_result: TradeResult):
         """Add a completed trade result"""
+        self._record_trade(trade_result)
+        
+        # Update performance metrics
+        self._update_performance_metrics(trade_result)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Trade completed: %s %s %s %+.1f pips $%+.2f",
+                trade_result.pair, trade_result.direction, trade_result.exit_type.upper(),
+                trade_result.pips_result, trade_result.dollar_result
+            )
+    
+    def add_trade_results(self, trade_results: List[TradeResult]):
+        """
+        Add many completed trade results at once, e.g. a backtest replay
+        
+        The performance totals are folded in per group from the column
+        buffers instead of trade by trade.
+        """
+        if not trade_results:
+            return
+        
+        start = self._count
+        for trade_result in trade_results:
+            self._record_trade(trade_result)
+        rows = np.arange(start, self._count)
+        
+        # Update performance metrics
+        self._fold_rows(self._overall_stats, rows)
+        for column, stats_by_key in (('pair', self._pair_stats), ('timeframe', self._timeframe_stats)):
+            keys = self._column(column)[start:]
+            for key in dict.fromkeys(keys):
+                self._fold_rows(stats_by_key[key], rows[keys == key])
+        
+        logger.info("Added %d trade results", len(trade_results))
+    
+    def _fold_rows(self, stats: _RunningStats, rows: np.ndarray):
+        """Fold the trades at rows of the column buffers into stats"""
+        stats.add_batch(
+            self._column('dollar_result')[rows],
+            self._column('pips_result')[rows],
+            self._column('entry_time')[rows],
+            self._column('exit_time')[rows]
+        )
+    
+    def _record_trade(self, trade_result: TradeResult):
+        """Store a trade and extend the equity curve and daily results"""
+        self._summary_cache = None
         self.trades.append(trade_result)
+        self._append_columns(trade_result)
         
         # Update equity curve
         current_equity = (
@@ -75,11 +274,12 @@ class PerformanceTracker:
             else 10000 + trade_result.dollar_result  # Start with $10,000
         )
         
+        self._cumulative_pips += trade_result.pips_result
         self.equity_curve.append({
             'timestamp': trade_result.exit_time,
             'equity': current_equity,
             'trade_result': trade_result.dollar_result,
-            'cumulative_pips': sum(t.pips_result for t in self.trades)
+            'cumulative_pips': self._cumulative_pips
         })
         
         # Update daily results
@@ -88,40 +288,44 @@ class PerformanceTracker:
             self.daily_results[date_str] = 0
         self.daily_results[date_str] += trade_result.dollar_result
         
-        # Update performance metrics
-        self._update_performance_metrics()
-        
-        logger.info(
-            f"Trade completed: {trade_result.pair} {trade_result.direction} "
-            f"{trade_result.exit_type.upper()} {trade_result.pips_result:+.1f} pips "
-            f"${trade_result.dollar_result:+.2f}"
-        )
+        # Update monthly and weekly results (weeks start on Monday)
+        exit_time = trade_result.exit_time
+        self._monthly_results[exit_time.strftime('%Y-%m')] += trade_result.dollar_result
+        week_start = exit_time - timedelta(days=exit_time.weekday())
+        self._weekly_results[week_start.strftime('%Y-W%U')] += trade_result.dollar_result
     
-    def _update_performance_metrics(self):
-        """Update all performance metrics"""
-        if not self.trades:
-            return
-        
-        # Update overall performance
-        self.overall_performance = self._calculate_performance_metrics(self.trades)
-        
-        # Update per-pair performance
-        self.pair_performance = {}
-        for pair in set(t.pair for t in self.trades):
-            pair_trades = [t for t in self.trades if t.pair == pair]
-            if len(pair_trades) >= 5:  # Minimum trades for meaningful statistics
-                self.pair_performance[pair] = self._calculate_performance_metrics(pair_trades)
-        
-        # Update per-timeframe performance
-        self.timeframe_performance = {}
-        for timeframe in set(t.timeframe for t in self.trades):
-            tf_trades = [t for t in self.trades if t.timeframe == timeframe]
-            if len(tf_trades) >= 5:
-                self.timeframe_performance[timeframe] = self._calculate_performance_metrics(tf_trades)
+    def _update_performance_metrics(self, trade_result: TradeResult):
+        """Fold a new trade into the overall, per-pair and per-timeframe totals"""
+        self._overall_stats.add(trade_result)
+        self._pair_stats[trade_result.pair].add(trade_result)
+        self._timeframe_stats[trade_result.timeframe].add(trade_result)
+    
+    @property
+    def overall_performance(self) -> PerformanceMetrics:
+        """Performance metrics over all trades"""
+        return self._calculate_performance_metrics(self._overall_stats)
+    
+    @property
+    def pair_performance(self) -> Dict[str, PerformanceMetrics]:
+        """Performance metrics per pair"""
+        return {
+            pair: self._calculate_performance_metrics(stats)
+            for pair, stats in self._pair_stats.items()
+            if stats.count >= 5  # Minimum trades for meaningful statistics
+        }
+    
+    @property
+    def timeframe_performance(self) -> Dict[str, PerformanceMetrics]:
+        """Performance metrics per timeframe"""
+        return {
+            timeframe: self._calculate_performance_metrics(stats)
+            for timeframe, stats in self._timeframe_stats.items()
+            if stats.count >= 5
+        }
     
-    def _calculate_performance_metrics(self, trades: List[TradeResult]) -> PerformanceMetrics:
-        """Calculate performance metrics for a list of trades"""
-        if not trades:
+    def _calculate_performance_metrics(self, stats: _RunningStats) -> PerformanceMetrics:
+        """Calculate performance metrics from a group's running totals"""
+        if not stats.count:
             return PerformanceMetrics(
                 total_trades=0, winning_trades=0, losing_trades=0, win_rate=0,
                 total_pips=0, total_profit=0, average_win=0, average_loss=0,
@@ -131,45 +335,38 @@ class PerformanceTracker:
             )
         
         # Basic metrics
-        total_trades = len(trades)
-        winning_trades = len([t for t in trades if t.dollar_result > 0])
-        losing_trades = len([t for t in trades if t.dollar_result < 0])
+        total_trades = stats.count
+        winning_trades = stats.win_count
+        losing_trades = stats.loss_count
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
         
         # Profit/Loss metrics
-        total_pips = sum(t.pips_result for t in trades)
-        total_profit = sum(t.dollar_result for t in trades)
+        total_pips = stats.total_pips
+        total_profit = stats.total_profit
         
-        winning_amounts = [t.dollar_result for t in trades if t.dollar_result > 0]
-        losing_amounts = [abs(t.dollar_result) for t in trades if t.dollar_result < 0]
-        
-        average_win = np.mean(winning_amounts) if winning_amounts else 0
-        average_loss = np.mean(losing_amounts) if losing_amounts else 0
-        largest_win = max(winning_amounts) if winning_amounts else 0
-        largest_loss = max(losing_amounts) if losing_amounts else 0
+        average_win = stats.gross_profit / winning_trades if winning_trades else 0
+        average_loss = stats.gross_loss / losing_trades if losing_trades else 0
+        largest_win = stats.largest_win
+        largest_loss = stats.largest_loss
         
         # Profit factor
-        gross_profit = sum(winning_amounts)
-        gross_loss = sum(losing_amounts)
-        profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else 0
+        profit_factor = (stats.gross_profit / stats.gross_loss) if stats.gross_loss > 0 else 0
         
         # Risk-reward ratio
         risk_reward_ratio = (average_win / average_loss) if average_loss > 0 else 0
         
         # Drawdown calculation
-        max_drawdown, max_drawdown_percent = self._calculate_drawdown(trades)
+        max_drawdown, max_drawdown_percent = stats.max_drawdown, stats.max_drawdown_percent
         
         # Sharpe ratio (simplified)
-        returns = [t.dollar_result for t in trades]
-        if len(returns) > 1:
-            avg_return = np.mean(returns)
-            std_return = np.std(returns)
-            sharpe_ratio = (avg_return / std_return) if std_return > 0 else 0
+        if total_trades > 1:
+            std_return = math.sqrt(stats.m2 / total_trades)
+            sharpe_ratio = (stats.mean / std_return) if std_return > 0 else 0
         else:
             sharpe_ratio = 0
         
         # Calmar ratio
-        annual_return = self._calculate_annual_return(trades)
+        annual_return = self._calculate_annual_return(stats)
         calmar_ratio = (annual_return / max_drawdown_percent) if max_drawdown_percent > 0 else 0
         
         # Recovery factor
@@ -199,47 +396,17 @@ class PerformanceTracker:
             expectancy=expectancy
         )
     
-    def _calculate_drawdown(self, trades: List[TradeResult]) -> Tuple[float, float]:
-        """Calculate maximum drawdown"""
-        if not trades:
-            return 0, 0
-        
-        # Create equity curve
-        equity = 10000  # Starting equity
-        peak_equity = equity
-        max_drawdown_dollar = 0
-        max_drawdown_percent = 0
-        
-        for trade in trades:
-            equity += trade.dollar_result
-            
-            if equity > peak_equity:
-                peak_equity = equity
-            
-            drawdown_dollar = peak_equity - equity
-            drawdown_percent = (drawdown_dollar / peak_equity * 100) if peak_equity > 0 else 0
-            
-            if drawdown_dollar > max_drawdown_dollar:
-                max_drawdown_dollar = drawdown_dollar
-            
-            if drawdown_percent > max_drawdown_percent:
-                max_drawdown_percent = drawdown_percent
-        
-        return max_drawdown_dollar, max_drawdown_percent
-    
-    def _calculate_annual_return(self, trades: List[TradeResult]) -> float:
+    def _calculate_annual_return(self, stats: _RunningStats) -> float:
         """Calculate annualized return percentage"""
-        if not trades or len(trades) < 2:
+        if stats.count < 2:
             return 0
         
-        start_date = min(t.entry_time for t in trades)
-        end_date = max(t.exit_time for t in trades)
-        days = (end_date - start_date).days
+        days = (stats.last_exit - stats.first_entry).days
         
         if days == 0:
             return 0
         
-        total_return = sum(t.dollar_result for t in trades)
+        total_return = stats.total_profit
         initial_equity = 10000
         
         years = days / 365.25
@@ -248,10 +415,18 @@ class PerformanceTracker:
         return annual_return
     
     def get_performance_summary(self) -> Dict:
-        """Get comprehensive performance summary"""
+        """
+        Get comprehensive performance summary
+        
+        The summary is built once per batch of new trades; callers share the
+        returned dictionary and should not modify it.
+        """
         if not self.trades:
             return {'message': 'No trades recorded yet'}
         
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
         summary = {
             'overall': asdict(self.overall_performance),
             'by_pair': {pair: asdict(metrics) for pair, metrics in self.pair_performance.items()},
@@ -259,54 +434,76 @@ class PerformanceTracker:
             'recent_trades': [asdict(t) for t in self.trades[-10:]],  # Last 10 trades
             'monthly_results': self._get_monthly_results(),
             'weekly_results': self._get_weekly_results(),
-            'equity_curve': self.equity_curve[-100:],  # Last 100 equity points
+            'equity_curve': list(self.equity_curve),  # Last EQUITY_CURVE_POINTS equity points
         }
         
+        self._summary_cache = summary
         return summary
     
     def _get_monthly_results(self) -> Dict[str, float]:
         """Get monthly profit/loss results"""
-        monthly_results = {}
-        
-        for trade in self.trades:
-            month_key = trade.exit_time.strftime('%Y-%m')
-            if month_key not in monthly_results:
-                monthly_results[month_key] = 0
-            monthly_results[month_key] += trade.dollar_result
-        
-        return monthly_results
+        return dict(self._monthly_results)
     
     def _get_weekly_results(self) -> Dict[str, float]:
         """Get weekly profit/loss results"""
-        weekly_results = {}
-        
-        for trade in self.trades:
-            # Get start of week (Monday)
-            week_start = trade.exit_time - timedelta(days=trade.exit_time.weekday())
-            week_key = week_start.strftime('%Y-W%U')
-            
-            if week_key not in weekly_results:
-                weekly_results[week_key] = 0
-            weekly_results[week_key] += trade.dollar_result
-        
-        return weekly_results
+        return dict(self._weekly_results)
     
     def get_signal_analysis(self) -> Dict:
         """Analyze signal performance patterns"""
         if not self.trades:
             return {}
         
+        # One frame over the trade columns shared by every breakdown
+        trades = pd.DataFrame({
+            name: self._column(name)
+            for name in ('dollar_result', 'pips_result', 'duration_minutes', 'signal_strength',
+                         'mtf_confirmation', 'session', 'exit_type', 'direction')
+        })
+        trades['win'] = trades['dollar_result'] > 0
+        
         analysis = {
-            'by_signal_strength': self._analyze_by_signal_strength(),
-            'by_mtf_confirmation': self._analyze_by_mtf_confirmation(),
-            'by_session': self._analyze_by_session(),
-            'by_exit_type': self._analyze_by_exit_type(),
-            'by_direction': self._analyze_by_direction(),
+            'by_signal_strength': self._analyze_by_signal_strength(trades),
+            'by_mtf_confirmation': self._analyze_by_mtf_confirmation(trades),
+            'by_session': self._analyze_by_session(trades),
+            'by_exit_type': self._analyze_by_exit_type(trades),
+            'by_direction': self._analyze_by_direction(trades),
         }
         
         return analysis
     
-    def _analyze_by_signal_strength(self) -> Dict:
+    @staticmethod
+    def _group_results(
+        trades: pd.DataFrame,
+        keys: pd.Series,
+        metrics: Tuple[str, ...] = ('count', 'win_rate', 'avg_result', 'total_pips')
+    ) -> Dict[str, Dict]:
+        """
+        Aggregate trade results per key with a single groupby
+        
+        Args:
+            trades: Trade frame built by get_signal_analysis
+            keys: Group key per trade row; missing keys are grouped under None
+            metrics: Statistics to report per group, from count, win_rate,
+                avg_result, total_pips and avg_duration
+            
+        Returns:
+            {key: {metric: value}} in order of each key's first trade
+        """
+        grouped = trades.groupby(keys, sort=False, observed=True, dropna=False).agg(
+            count=('dollar_result', 'size'),
+            win_rate=('win', 'mean'),
+            avg_result=('dollar_result', 'mean'),
+            total_pips=('pips_result', 'sum'),
+            avg_duration=('duration_minutes', 'mean')
+        )
+        grouped['win_rate'] *= 100
+        # groupby reports missing keys as NaN; report them as None (null in JSON)
+        return {
+            None if pd.isna(key) else key: values
+            for key, values in grouped[list(metrics)].to_dict('index').items()
+        }
+    
+    def _analyze_by_signal_strength(self, trades: pd.DataFrame) -> Dict:
         """Analyze performance by signal strength ranges"""
         ranges = {
             'weak': (0, 0.6),
@@ -314,115 +511,38 @@ class PerformanceTracker:
             'strong': (0.8, 1.0)
         }
         
-        results = {}
-        for range_name, (min_val, max_val) in ranges.items():
-            range_trades = [
-                t for t in self.trades 
-                if min_val <= t.signal_strength < max_val
-            ]
-            if range_trades:
-                results[range_name] = {
-                    'count': len(range_trades),
-                    'win_rate': len([t for t in range_trades if t.dollar_result > 0]) / len(range_trades) * 100,
-                    'avg_result': np.mean([t.dollar_result for t in range_trades]),
-                    'total_pips': sum(t.pips_result for t in range_trades)
-                }
-        
-        return results
+        labels = pd.cut(
+            trades['signal_strength'],
+            bins=[0, 0.6, 0.8, 1.0],
+            labels=list(ranges),
+            right=False
+        )
+        
+        grouped = self._group_results(trades, labels)
+        return {range_name: grouped[range_name] for range_name in ranges if range_name in grouped}
     
-    def _analyze_by_mtf_confirmation(self) -> Dict:
+    def _analyze_by_mtf_confirmation(self, trades: pd.DataFrame) -> Dict:
         """Analyze performance by multi-timeframe confirmation"""
-        confirmed_trades = [t for t in self.trades if t.mtf_confirmation]
-        unconfirmed_trades = [t for t in self.trades if not t.mtf_confirmation]
+        labels = trades['mtf_confirmation'].map({True: 'confirmed', False: 'unconfirmed'})
         
-        results = {}
-        
-        if confirmed_trades:
-            results['confirmed'] = {
-                'count': len(confirmed_trades),
-                'win_rate': len([t for t in confirmed_trades if t.dollar_result > 0]) / len(confirmed_trades) * 100,
-                'avg_result': np.mean([t.dollar_result for t in confirmed_trades]),
-                'total_pips': sum(t.pips_result for t in confirmed_trades)
-            }
-        
-        if unconfirmed_trades:
-            results['unconfirmed'] = {
-                'count': len(unconfirmed_trades),
-                'win_rate': len([t for t in unconfirmed_trades if t.dollar_result > 0]) / len(unconfirmed_trades) * 100,
-                'avg_result': np.mean([t.dollar_result for t in unconfirmed_trades]),
-                'total_pips': sum(t.pips_result for t in unconfirmed_trades)
-            }
-        
-        return results
+        grouped = self._group_results(trades, labels)
+        return {label: grouped[label] for label in ('confirmed', 'unconfirmed') if label in grouped}
     
-    def _analyze_by_session(self) -> Dict:
+    def _analyze_by_session(self, trades: pd.DataFrame) -> Dict:
         """Analyze performance by trading session"""
-        sessions = {}
-        
-        for trade in self.trades:
-            session = trade.session
-            if session not in sessions:
-                sessions[session] = []
-            sessions[session].append(trade)
-        
-        results = {}
-        for session, trades in sessions.items():
-            if trades:
-                results[session] = {
-                    'count': len(trades),
-                    'win_rate': len([t for t in trades if t.dollar_result > 0]) / len(trades) * 100,
-                    'avg_result': np.mean([t.dollar_result for t in trades]),
-                    'total_pips': sum(t.pips_result for t in trades)
-                }
-        
-        return results
+        return self._group_results(trades, trades['session'])
     
-    def _analyze_by_exit_type(self) -> Dict:
+    def _analyze_by_exit_type(self, trades: pd.DataFrame) -> Dict:
         """Analyze performance by exit type"""
-        exit_types = {}
-        
-        for trade in self.trades:
-            exit_type = trade.exit_type
-            if exit_type not in exit_types:
-                exit_types[exit_type] = []
-            exit_types[exit_type].append(trade)
-        
-        results = {}
-        for exit_type, trades in exit_types.items():
-            if trades:
-                results[exit_type] = {
-                    'count': len(trades),
-                    'avg_result': np.mean([t.dollar_result for t in trades]),
-                    'total_pips': sum(t.pips_result for t in trades),
-                    'avg_duration': np.mean([t.duration_minutes for t in trades])
-                }
-        
-        return results
+        return self._group_results(
+            trades, trades['exit_type'], ('count', 'avg_result', 'total_pips', 'avg_duration')
+        )
     
-    def _analyze_by_direction(self) -> Dict:
+    def _analyze_by_direction(self, trades: pd.DataFrame) -> Dict:
         """Analyze performance by trade direction"""
-        buy_trades = [t for t in self.trades if t.direction == 'BUY']
-        sell_trades = [t for t in self.trades if t.direction == 'SELL']
-        
-        results = {}
-        
-        if buy_trades:
-            results['BUY'] = {
-                'count': len(buy_trades),
-                'win_rate': len([t for t in buy_trades if t.dollar_result > 0]) / len(buy_trades) * 100,
-                'avg_result': np.mean([t.dollar_result for t in buy_trades]),
-                'total_pips': sum(t.pips_result for t in buy_trades)
-            }
-        
-        if sell_trades:
-            results['SELL'] = {
-                'count': len(sell_trades),
-                'win_rate': len([t for t in sell_trades if t.dollar_result > 0]) / len(sell_trades) * 100,
-                'avg_result': np.mean([t.dollar_result for t in sell_trades]),
-                'total_pips': sum(t.pips_result for t in sell_trades)
-            }
-        
-        return results
+        grouped = self._group_results(trades, trades['direction'])
+        # Only BUY and SELL trades are reported
+        return {direction: grouped[direction] for direction in ('BUY', 'SELL') if direction in grouped}
     
     def export_performance_report(self, format: str = 'json') -> str:
         """Export comprehensive performance report"""
@@ -434,7 +554,7 @@ class PerformanceTracker:
                 'risk_percent': TradingConfig.DEFAULT_RISK_PERCENT,
                 'mtf_enabled': TradingConfig.MTF_CONFIRMATION_ENABLED,
                 'session_filtering': TradingConfig.SESSION_FILTERING_ENABLED,
-                'active_sessions': TradingConfig.ACTIVE_SESSIONS,
+                'active_sessions': list(TradingConfig.ACTIVE_SESSIONS),
                 'min_signal_strength': TradingConfig.MIN_SIGNAL_STRENGTH
             }
         }
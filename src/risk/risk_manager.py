@@ -11,6 +11,8 @@ class RiskManager:
     def __init__(self):
         self.default_risk_percent = TradingConfig.DEFAULT_RISK_PERCENT
         self.max_risk_percent = TradingConfig.MAX_RISK_PERCENT
+        # Pip value per standard lot for every configured pair; TradingConfig.PAIRS is immutable
+        self._pip_values_per_lot = {symbol: self._pip_value_for(symbol) for symbol in TradingConfig.PAIRS}
     
     def calculate_position_size(
         self,
@@ -133,8 +135,12 @@ class RiskManager:
         For most major pairs against USD, 1 pip = $10 per standard lot
         For JPY pairs, 1 pip = $10 per standard lot (adjusted for pip size)
         """
-        pair_config = TradingConfig.get_pair_config(pair)
-        
+        pip_value = self._pip_values_per_lot.get(pair)
+        return pip_value if pip_value is not None else self._pip_value_for(pair)
+    
+    @staticmethod
+    def _pip_value_for(pair: str) -> float:
+        """Pip value per standard lot by pair symbol"""
         if 'JPY' in pair:
             # JPY pairs have different pip calculation
             return 10.0  # $10 per lot for 0.01 movement
@@ -1,13 +1,16 @@
 
 import asyncio
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 import json
 import pandas as pd
 from src.data.market_data_fetcher import market_data_fetcher
-from src.analysis.technical_analysis import technical_analysis
+from src.analysis.technical_analysis import technical_analysis, IndicatorState
 from src.risk.risk_manager import risk_manager
 from src.filters.proximity_filter import proximity_filter
 from src.config.trading_config import TradingConfig
@@ -54,20 +57,86 @@ class SignalManager:
         self.last_signal_time: Dict[str, datetime] = {}
         self.min_signal_interval = timedelta(minutes=15)
         self.max_pips_distance = float(TradingConfig.get_setting('MAX_PIPS_DISTANCE', 15.0))
+        # Indicator frames and running state per pair_timeframe for incremental updates
+        self.indicator_frames: Dict[str, pd.DataFrame] = {}
+        self.indicator_states: Dict[str, IndicatorState] = {}
+        # One lock per pair_timeframe so overlapping passes never advance the same state together
+        self._indicator_locks: Dict[str, threading.Lock] = {}
+        # Worker threads for the per pair/timeframe analysis (Numba kernels release the GIL)
+        self._cpu_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="indicators"
+        )
     
     async def fetch_current_prices(self) -> Dict[str, float]:
         """Fetch current prices for all monitored pairs"""
-        current_prices = {}
+        # One pricing request covers every pair
+        prices = await market_data_fetcher.get_current_prices(TradingConfig.PAIR_ORDER)
+        return {pair_symbol: price_data['mid'] for pair_symbol, price_data in prices.items()}
+    
+    def _get_indicators(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Get indicator frame for a pair/timeframe, updating only the new bars
+        
+        Args:
+            key: Pair/timeframe key
+            df: Latest OHLCV DataFrame
+            
+        Returns:
+            DataFrame with technical indicators, aligned to df
+        """
+        # setdefault is atomic, so concurrent callers always share one lock per key
+        with self._indicator_locks.setdefault(key, threading.Lock()):
+            return self._update_indicators(key, df)
+    
+    @staticmethod
+    def _state_matches(state: IndicatorState, df: pd.DataFrame) -> bool:
+        """Check that df still holds the state's last bar with the same close (no gap or revision)"""
+        position = df.index.get_indexer([state.last_time])[0]
+        return position >= 0 and float(df['close'].iat[position]) == state.prev_close
+    
+    def _update_indicators(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Body of _get_indicators; the caller holds the key's lock"""
+        state = self.indicator_states.get(key)
+        frame = self.indicator_frames.get(key)
         
-        for pair_symbol in TradingConfig.PAIRS.keys():
-            try:
-                price_data = await market_data_fetcher.get_current_price(pair_symbol)
-                if price_data:
-                    current_prices[pair_symbol] = price_data['mid']
-            except Exception as e:
-                logger.error(f"Error fetching current price for {pair_symbol}: {e}")
+        if state is not None and frame is not None and self._state_matches(state, df):
+            new_bars = df[df.index > state.last_time]
+            if new_bars.empty:
+                return frame
+            
+            rows = [
+                {**bar.to_dict(), **technical_analysis.update(state, bar)}
+                for _, bar in new_bars.iterrows()
+            ]
+            new_rows = pd.DataFrame(rows, index=new_bars.index).astype(frame.dtypes.to_dict())
+            frame = pd.concat([frame, new_rows]).iloc[-len(df):]
+        else:
+            # Cold start, a gap in history or a revised last bar: full calculation
+            frame = technical_analysis.calculate_indicators(df)
+            if 'rsi' not in frame.columns:
+                self.indicator_states.pop(key, None)
+                self.indicator_frames.pop(key, None)
+                return frame
+            self.indicator_states[key] = technical_analysis.init_state(frame)
         
-        return current_prices
+        self.indicator_frames[key] = frame
+        return frame
+    
+    def _analyze(self, pair: str, timeframe: str, df: pd.DataFrame) -> Optional[Dict]:
+        """Calculate indicators and generate the signal for one pair/timeframe"""
+        # Add technical indicators (incrementally after the first pass)
+        df_with_indicators = self._get_indicators(f"{pair}_{timeframe}", df)
+        
+        # Generate signal
+        return technical_analysis.generate_signal(df_with_indicators, pair, timeframe)
+    
+    def warm_up(self):
+        """Load the indicator kernels so the first signal pass doesn't pay for it"""
+        technical_analysis.warm_up()
+    
+    def close(self):
+        """Shut down the analysis worker threads"""
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
     
     async def generate_all_signals(self) -> Dict[str, List[TradingSignal]]:
         """
@@ -85,26 +154,22 @@ class SignalManager:
             
             all_signals = {}
             new_signals = []
-            raw_signals_data = []
             
-            # Generate signals for each pair and timeframe
-            for pair_symbol, timeframe_data in all_data.items():
-                for timeframe, df in timeframe_data.items():
-                    if df is not None and len(df) > 0:
-                        # Add technical indicators
-                        df_with_indicators = technical_analysis.calculate_indicators(df)
-                        
-                        # Generate signal
-                        signal_data = technical_analysis.generate_signal(
-                            df_with_indicators, pair_symbol, timeframe
-                        )
-                        
-                        if signal_data:
-                            raw_signals_data.append(signal_data)
+            # Generate signals for each pair and timeframe in parallel
+            loop = asyncio.get_running_loop()
+            results = await asyncio.gather(*[
+                loop.run_in_executor(self._cpu_pool, self._analyze, pair_symbol, timeframe, df)
+                for pair_symbol, timeframe_data in all_data.items()
+                for timeframe, df in timeframe_data.items()
+                if df is not None and len(df) > 0
+            ])
+            raw_signals_data = [signal_data for signal_data in results if signal_data]
             
             # Convert to DataFrame for filtering
             if raw_signals_data:
                 signals_df = pd.DataFrame(raw_signals_data)
+                # Few distinct pairs: per-pair lookups map categories, not rows
+                signals_df['pair'] = signals_df['pair'].astype('category')
                 
                 # Apply proximity filter
                 filtered_signals_df = proximity_filter.filter_signals_by_proximity(
@@ -114,15 +179,15 @@ class SignalManager:
                 # Rank by proximity
                 filtered_signals_df = proximity_filter.rank_signals_by_proximity(filtered_signals_df)
                 
-                # Convert back to TradingSignal objects
-                for _, signal_row in filtered_signals_df.iterrows():
-                    signal_key = f"{signal_row['pair']}_{signal_row['timeframe']}"
+                # Convert back to TradingSignal objects (one columnar pass to row dicts)
+                for signal_dict in filtered_signals_df.to_dict('records'):
+                    signal_key = f"{signal_dict['pair']}_{signal_dict['timeframe']}"
                     
-                    if self._is_new_signal(signal_key, signal_row.to_dict()):
+                    if self._is_new_signal(signal_key, signal_dict):
                         # Create TradingSignal object
                         signal = TradingSignal(
-                            id=f"{signal_row['pair']}_{signal_row['timeframe']}_{int(datetime.now().timestamp())}",
-                            **signal_row.to_dict()
+                            id=f"{signal_key}_{int(datetime.now().timestamp())}",
+                            **signal_dict
                         )
                         
                         # Group by pair
@@ -27,7 +27,7 @@ def print_banner():
 def check_requirements():
     """Check if required packages are installed"""
     required_packages = [
-        'fastapi', 'uvicorn', 'pandas', 'numpy', 'oandapyV20', 
+        'fastapi', 'uvicorn', 'pandas', 'numpy', 'httpx', 
         'pandas_ta', 'python-dotenv', 'asyncio'
     ]
     
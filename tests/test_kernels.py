@@ -0,0 +1,195 @@
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis import _kernels
+from src.analysis.technical_analysis import SCORE_COLUMNS, technical_analysis
+
+WINDOW = 14
+LEADING_NANS = 5
+RSI_OVERSOLD = 30.0
+RSI_OVERBOUGHT = 70.0
+
+def smoothed_reference(series, n, alpha):
+    """pandas EMA-style recurrence seeded with the SMA of the first n valid values"""
+    valid = series.iloc[series.first_valid_index():] if series.notna().any() else series.iloc[:0]
+    if len(valid) < n:
+        return pd.Series(np.nan, index=series.index)
+    seeded = valid.iloc[n - 1:].copy()
+    seeded.iloc[0] = valid.iloc[:n].mean()
+    return seeded.ewm(alpha=alpha, adjust=False).mean().reindex(series.index)
+
+def rsi_reference(close, n):
+    """Wilder RSI from pandas diff / clip / smoothed averages"""
+    change = close.diff()
+    avg_gain = smoothed_reference(change.clip(lower=0), n, 1.0 / n)
+    avg_loss = smoothed_reference((-change).clip(lower=0), n, 1.0 / n)
+    total = avg_gain + avg_loss
+    return (100.0 * avg_gain / total).where(total > 0)
+
+def atr_reference(high, low, close, n):
+    """Wilder ATR from the pandas true range"""
+    prev_close = close.shift()
+    true_range = pd.concat(
+        [high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1
+    ).max(axis=1, skipna=False)
+    return smoothed_reference(true_range, n, 1.0 / n)
+
+def make_prices(size, leading_nans=0, seed=3):
+    """Random-walk high / low / close series, optionally with leading NaNs"""
+    rng = np.random.default_rng(seed)
+    close = 1.1000 + np.cumsum(rng.normal(0, 0.001, size))
+    high = close + np.abs(rng.normal(0, 0.0005, size))
+    low = close - np.abs(rng.normal(0, 0.0005, size))
+    for values in (high, low, close):
+        values[:leading_nans] = np.nan
+    return pd.Series(high), pd.Series(low), pd.Series(close)
+
+# (size, leading NaNs): plain input, NaN-leading input, window longer than the data
+CASES = [(200, 0), (200, LEADING_NANS), (WINDOW - 1, 0), (WINDOW + 2, LEADING_NANS)]
+
+class TestKernels:
+    """Numba kernels must match their pandas equivalents"""
+    
+    @pytest.fixture(params=CASES, ids=lambda case: f"size{case[0]}-nan{case[1]}")
+    def prices(self, request):
+        """High / low / close series for each input shape"""
+        size, leading_nans = request.param
+        return make_prices(size, leading_nans)
+    
+    def test_rolling_mean(self, prices):
+        """Rolling mean matches Series.rolling().mean()"""
+        _, _, close = prices
+        expected = close.rolling(WINDOW).mean()
+        np.testing.assert_allclose(_kernels.rolling_mean(close.to_numpy(), WINDOW), expected, rtol=1e-10)
+    
+    def test_rolling_mean_interior_nan(self):
+        """A NaN inside the data only blanks the windows that contain it"""
+        values = pd.Series([1.0, 2.0, np.nan, 4.0, 5.0, 6.0, 7.0, 8.0])
+        expected = values.rolling(3).mean()
+        result = _kernels.rolling_mean(values.to_numpy(), 3)
+        
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        np.testing.assert_allclose(result[-3:], [5.0, 6.0, 7.0])
+    
+    def test_rolling_std(self, prices):
+        """Rolling std matches the population Series.rolling().std()"""
+        _, _, close = prices
+        expected = close.rolling(WINDOW).std(ddof=0)
+        np.testing.assert_allclose(_kernels.rolling_std(close.to_numpy(), WINDOW), expected, rtol=1e-8)
+    
+    def test_rolling_max(self, prices):
+        """Rolling max matches Series.rolling().max()"""
+        high, _, _ = prices
+        expected = high.rolling(WINDOW).max()
+        np.testing.assert_array_equal(_kernels.rolling_max(high.to_numpy(), WINDOW), expected)
+    
+    def test_rolling_min(self, prices):
+        """Rolling min matches Series.rolling().min()"""
+        _, low, _ = prices
+        expected = low.rolling(WINDOW).min()
+        np.testing.assert_array_equal(_kernels.rolling_min(low.to_numpy(), WINDOW), expected)
+    
+    def test_ema(self, prices):
+        """EMA matches the SMA-seeded Series.ewm() recurrence"""
+        _, _, close = prices
+        expected = smoothed_reference(close, WINDOW, 2.0 / (WINDOW + 1))
+        np.testing.assert_allclose(_kernels.ema(close.to_numpy(), WINDOW), expected, rtol=1e-10)
+    
+    def test_rma(self, prices):
+        """Wilder's average matches the SMA-seeded Series.ewm() recurrence"""
+        _, _, close = prices
+        expected = smoothed_reference(close, WINDOW, 1.0 / WINDOW)
+        np.testing.assert_allclose(_kernels.rma(close.to_numpy(), WINDOW), expected, rtol=1e-10)
+    
+    def test_rsi_wilder(self, prices):
+        """RSI matches Wilder-smoothed pandas gains / losses"""
+        _, _, close = prices
+        expected = rsi_reference(close, WINDOW)
+        np.testing.assert_allclose(_kernels.rsi_wilder(close.to_numpy(), WINDOW), expected, rtol=1e-8)
+    
+    def test_atr_wilder(self, prices):
+        """ATR matches the Wilder-smoothed pandas true range"""
+        high, low, close = prices
+        expected = atr_reference(high, low, close, WINDOW)
+        result = _kernels.atr_wilder(high.to_numpy(), low.to_numpy(), close.to_numpy(), WINDOW)
+        np.testing.assert_allclose(result, expected, rtol=1e-10)
+    
+    def test_signal_score_kernel(self):
+        """Scores and reason bits match the same conditions evaluated with pandas"""
+        rng = np.random.default_rng(11)
+        size = 5000
+        
+        def frame():
+            # Coarse values so crossovers and ties actually occur
+            data = pd.DataFrame({
+                'rsi': rng.integers(10, 91, size).astype(float),
+                'macd_hist': rng.integers(-2, 3, size).astype(float),
+                'close': rng.integers(95, 106, size).astype(float),
+                'sma_fast': rng.integers(95, 106, size).astype(float),
+                'sma_slow': rng.integers(95, 106, size).astype(float),
+                'bb_lower': rng.integers(90, 101, size).astype(float),
+                'bb_upper': rng.integers(100, 111, size).astype(float),
+                'stoch_k': rng.integers(0, 101, size).astype(float),
+                'stoch_d': rng.integers(0, 101, size).astype(float)
+            })[list(SCORE_COLUMNS)]
+            # Indicators are NaN until their warm-up completes
+            data.iloc[:LEADING_NANS] = np.nan
+            return data
+        
+        cur, prev = frame(), frame()
+        conditions = [
+            (cur.rsi < RSI_OVERSOLD) & (cur.rsi > prev.rsi),
+            (cur.rsi > RSI_OVERBOUGHT) & (cur.rsi < prev.rsi),
+            (cur.macd_hist > 0) & (prev.macd_hist <= 0),
+            (cur.macd_hist < 0) & (prev.macd_hist >= 0),
+            (cur.close > cur.sma_fast) & (cur.sma_fast > cur.sma_slow) & (prev.sma_fast <= prev.sma_slow),
+            (cur.close < cur.sma_fast) & (cur.sma_fast < cur.sma_slow) & (prev.sma_fast >= prev.sma_slow),
+            (cur.close <= cur.bb_lower) & (cur.close > prev.close),
+            (cur.close >= cur.bb_upper) & (cur.close < prev.close),
+            (cur.stoch_k < 20) & (cur.stoch_k > cur.stoch_d),
+            (cur.stoch_k > 80) & (cur.stoch_k < cur.stoch_d)
+        ]
+        weights = [2, 2, 2, 2, 3, 3, 1, 1, 1, 1]
+        expected_bullish = sum(conditions[bit].astype(int) * weights[bit] for bit in range(0, 10, 2))
+        expected_bearish = sum(conditions[bit].astype(int) * weights[bit] for bit in range(1, 10, 2))
+        expected_bits = sum(conditions[bit].astype(int) * (1 << bit) for bit in range(10))
+        
+        bullish, bearish, bits = _kernels.signal_score_kernel(
+            np.ascontiguousarray(cur.to_numpy()), np.ascontiguousarray(prev.to_numpy()),
+            RSI_OVERSOLD, RSI_OVERBOUGHT
+        )
+        
+        np.testing.assert_array_equal(bullish, expected_bullish)
+        np.testing.assert_array_equal(bearish, expected_bearish)
+        np.testing.assert_array_equal(bits, expected_bits)
+        assert not bits[:LEADING_NANS].any()
+
+class TestWarmUp:
+    """warm_up must cover the signatures the analysis actually calls"""
+    
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    def test_generate_signal_needs_no_new_compile(self, dtype):
+        """Scoring real frame rows reuses a warmed-up signal_score_kernel signature"""
+        _kernels.warm_up()
+        compiled = len(_kernels.signal_score_kernel.signatures)
+        
+        high, low, close = make_prices(400)
+        df = pd.DataFrame(
+            {'open': close, 'high': high, 'low': low, 'close': close, 'volume': 1000},
+            index=pd.date_range(start='2024-01-01', periods=400, freq='h', tz='UTC')
+        ).astype({'open': dtype, 'high': dtype, 'low': dtype, 'close': dtype})
+        data = technical_analysis.calculate_indicators(df)
+        for end in range(technical_analysis.required_periods, len(data)):
+            technical_analysis.generate_signal(data.iloc[:end], 'EUR_USD', 'H1')
+        
+        assert len(_kernels.signal_score_kernel.signatures) == compiled
+
+if __name__ == "__main__":
+    pytest.main([__file__])
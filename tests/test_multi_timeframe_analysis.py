@@ -0,0 +1,65 @@
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config.trading_config import TradingConfig
+from src.analysis.multi_timeframe_analysis import MultiTimeframeAnalysis
+
+def make_signals(rng, count):
+    """Random signals with strength quantized to 1/8, so quality scores tie often"""
+    pairs = list(TradingConfig.PAIRS)[:10]
+    timeframes = list(TradingConfig.TIMEFRAMES)
+    signals = {}
+    for i in range(count):
+        pair = pairs[i % len(pairs)]
+        timeframe = timeframes[(i // len(pairs)) % len(timeframes)]
+        signals.setdefault(pair, {})[timeframe] = {
+            'id': i,
+            'strength': int(rng.integers(3, 9)) / 8.0,
+            'mtf_confirmation_percentage': float(rng.choice([0.0, 50.0, 100.0])),
+            'risk_reward_3': 3.0
+        }
+    return signals
+
+class TestBestSignals:
+    """get_best_signals must pick the same signals as a stable descending sort"""
+    
+    @pytest.fixture
+    def analysis(self):
+        """Multi-timeframe analysis instance"""
+        return MultiTimeframeAnalysis()
+    
+    def test_ties_at_cutoff_keep_insertion_order(self, analysis):
+        """Equal scores straddling max_signals resolve to the earliest signals"""
+        signals = {
+            'EUR_USD': {'H1': {'id': 0, 'strength': 0.5}},
+            'GBP_USD': {'H1': {'id': 1, 'strength': 0.75}},
+            'USD_JPY': {'H1': {'id': 2, 'strength': 0.5}},
+            'AUD_USD': {'H1': {'id': 3, 'strength': 0.5}}
+        }
+        
+        best = analysis.get_best_signals(signals, max_signals=2)
+        
+        assert [signal['id'] for signal in best] == [1, 0]
+    
+    def test_matches_stable_sort(self, analysis):
+        """Random tied inputs select and order signals exactly like sorted(...)[:k]"""
+        rng = np.random.default_rng(9)
+        
+        for _ in range(200):
+            signals = make_signals(rng, int(rng.integers(1, 40)))
+            max_signals = int(rng.integers(1, 15))
+            
+            best = analysis.get_best_signals(signals, max_signals=max_signals)
+            flattened = [signal for timeframe_signals in signals.values() for signal in timeframe_signals.values()]
+            expected = sorted(flattened, key=lambda signal: signal['quality_score'], reverse=True)[:max_signals]
+            
+            assert [signal['id'] for signal in best] == [signal['id'] for signal in expected]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
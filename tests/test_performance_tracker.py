@@ -0,0 +1,118 @@
+
+import pytest
+import numpy as np
+from dataclasses import asdict
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.performance.performance_tracker import PerformanceTracker, TradeResult
+
+STARTING_EQUITY = 10000.0
+
+def make_trades(count, seed=5):
+    """Create a random sequence of completed trades across a few pairs"""
+    rng = np.random.default_rng(seed)
+    pairs = ['EUR_USD', 'GBP_USD', 'USD_JPY']
+    start = datetime(2024, 1, 1)
+    trades = []
+    
+    for i in range(count):
+        # Occasional scratch trades exercise the neither-win-nor-loss branch
+        dollar_result = 0.0 if i % 17 == 0 else round(float(rng.normal(5, 120)), 2)
+        entry_time = start + timedelta(hours=6 * i)
+        trades.append(TradeResult(
+            signal_id=f"signal_{i}",
+            pair=pairs[i % len(pairs)],
+            timeframe='H1' if i % 2 else 'H4',
+            direction='BUY' if rng.random() < 0.5 else 'SELL',
+            entry_price=1.1,
+            exit_price=1.1,
+            exit_type='tp1' if dollar_result > 0 else 'sl',
+            pips_result=dollar_result / 10,
+            dollar_result=dollar_result,
+            risk_reward_ratio=1.0,
+            entry_time=entry_time,
+            exit_time=entry_time + timedelta(hours=3),
+            duration_minutes=180,
+            lot_size=0.1,
+            signal_strength=float(rng.random()),
+            mtf_confirmation=bool(rng.random() < 0.5),
+            session='london',
+            volatility_percentile=50.0
+        ))
+    
+    return trades
+
+def expected_metrics(trades):
+    """Recompute the running metrics from scratch with numpy"""
+    results = np.array([trade.dollar_result for trade in trades])
+    wins = results[results > 0]
+    losses = -results[results < 0]
+    equity = STARTING_EQUITY + np.cumsum(results)
+    peak = np.maximum.accumulate(np.maximum(equity, STARTING_EQUITY))
+    drawdown = peak - equity
+    
+    return {
+        'winning_trades': len(wins),
+        'losing_trades': len(losses),
+        'profit_factor': wins.sum() / losses.sum(),
+        'sharpe_ratio': results.mean() / results.std(),
+        'max_drawdown': drawdown.max(),
+        'max_drawdown_percent': (drawdown / peak * 100).max()
+    }
+
+def assert_matches(metrics, trades):
+    """Compare a PerformanceMetrics to the from-scratch recomputation"""
+    for name, value in expected_metrics(trades).items():
+        assert getattr(metrics, name) == pytest.approx(value, rel=1e-9), f"{name} mismatch"
+
+class TestPerformanceTracker:
+    """Running performance totals must match a full recomputation"""
+    
+    @pytest.fixture
+    def trades(self):
+        """Trade history long enough for every pair/timeframe group"""
+        return make_trades(300)
+    
+    def test_single_trades_match_recomputation(self, trades):
+        """add_trade_result one by one matches the from-scratch metrics"""
+        tracker = PerformanceTracker()
+        for trade in trades:
+            tracker.add_trade_result(trade)
+        
+        assert_matches(tracker.overall_performance, trades)
+        for pair, metrics in tracker.pair_performance.items():
+            assert_matches(metrics, [trade for trade in trades if trade.pair == pair])
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 300])
+    def test_bulk_trades_match_recomputation(self, trades, chunk_size):
+        """add_trade_results in chunks matches the from-scratch metrics"""
+        tracker = PerformanceTracker()
+        for start in range(0, len(trades), chunk_size):
+            tracker.add_trade_results(trades[start:start + chunk_size])
+        
+        assert_matches(tracker.overall_performance, trades)
+        for timeframe, metrics in tracker.timeframe_performance.items():
+            assert_matches(metrics, [trade for trade in trades if trade.timeframe == timeframe])
+    
+    def test_single_and_bulk_agree(self, trades):
+        """Both ingestion paths produce the same metrics, per group too"""
+        single = PerformanceTracker()
+        for trade in trades:
+            single.add_trade_result(trade)
+        
+        bulk = PerformanceTracker()
+        for start in range(0, len(trades), 50):
+            bulk.add_trade_results(trades[start:start + 50])
+        
+        assert asdict(bulk.overall_performance) == pytest.approx(asdict(single.overall_performance), rel=1e-9)
+        assert bulk.pair_performance.keys() == single.pair_performance.keys()
+        for pair, metrics in single.pair_performance.items():
+            assert asdict(bulk.pair_performance[pair]) == pytest.approx(asdict(metrics), rel=1e-9), pair
+
+if __name__ == "__main__":
+    pytest.main([__file__])
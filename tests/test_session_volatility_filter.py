@@ -0,0 +1,85 @@
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config.trading_config import TradingConfig
+from src.filters.session_volatility_filter import SessionVolatilityFilter
+
+# 2024 DST transitions (UTC dates): New York spring / fall, London spring / fall
+DST_TRANSITIONS = [
+    datetime(2024, 3, 10, tzinfo=timezone.utc),
+    datetime(2024, 3, 31, tzinfo=timezone.utc),
+    datetime(2024, 10, 27, tzinfo=timezone.utc),
+    datetime(2024, 11, 3, tzinfo=timezone.utc),
+]
+
+def per_call_session(pair, current_time):
+    """Session lookup converting current_time into each session's timezone on every call"""
+    pair_config = TradingConfig.get_pair_config(pair)
+    if not pair_config:
+        return False, 'none'
+    
+    for session_name in TradingConfig.ACTIVE_SESSIONS:
+        if pair_config.session_preference not in (session_name, 'all'):
+            continue
+        session = TradingConfig.get_session_config(session_name)
+        if session is None or not session.active:
+            continue
+        local_hour = current_time.astimezone(ZoneInfo(session.timezone)).hour
+        if session.start_hour <= session.end_hour:
+            active = session.start_hour <= local_hour < session.end_hour
+        else:
+            active = local_hour >= session.start_hour or local_hour < session.end_hour
+        if active:
+            return True, session_name
+    
+    return False, 'none'
+
+@pytest.mark.skipif(not TradingConfig.SESSION_FILTERING_ENABLED, reason="Session filtering disabled")
+class TestSessionActivity:
+    """Hour-of-day session bitmaps must match the per-call timezone checks"""
+    
+    @pytest.fixture
+    def session_filter(self):
+        """Filter with no cached hour bitmap"""
+        return SessionVolatilityFilter()
+    
+    @pytest.mark.parametrize("transition", DST_TRANSITIONS, ids=lambda day: day.strftime('%Y-%m-%d'))
+    def test_dst_transitions(self, session_filter, transition):
+        """Every pair matches the per-call checks across a DST change"""
+        current_time = transition - timedelta(days=1)
+        end = transition + timedelta(days=2)
+        
+        while current_time < end:
+            for pair in TradingConfig.PAIRS:
+                assert session_filter.is_session_active(pair, current_time) == per_call_session(pair, current_time), \
+                    f"{pair} at {current_time}"
+            current_time += timedelta(minutes=15)
+    
+    def test_full_year(self, session_filter):
+        """Every pair matches the per-call checks hourly through 2024"""
+        current_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        
+        while current_time.year == 2024:
+            for pair in TradingConfig.PAIRS:
+                assert session_filter.is_session_active(pair, current_time) == per_call_session(pair, current_time), \
+                    f"{pair} at {current_time}"
+            current_time += timedelta(hours=1)
+    
+    def test_naive_and_local_times(self, session_filter):
+        """Naive times are taken as UTC and aware times are converted to UTC"""
+        current_time = datetime(2024, 3, 31, 7, 30, tzinfo=timezone.utc)
+        expected = {pair: per_call_session(pair, current_time) for pair in TradingConfig.PAIRS}
+        
+        for variant in (current_time.replace(tzinfo=None), current_time.astimezone(ZoneInfo('America/New_York'))):
+            for pair, result in expected.items():
+                assert session_filter.is_session_active(pair, variant) == result, f"{pair} at {variant!r}"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,156 @@
+
+import pytest
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analysis.technical_analysis import technical_analysis
+from src.signals.signal_manager import SignalManager
+
+INCREMENTAL_COLUMNS = [
+    'rsi', 'macd', 'macd_signal', 'macd_hist', 'sma_fast', 'sma_slow',
+    'bb_upper', 'bb_middle', 'bb_lower', 'atr', 'stoch_k', 'stoch_d',
+    'resistance', 'support', 'trend'
+]
+
+def make_ohlcv(periods, start='2024-01-01', seed=42):
+    """Create a random-walk OHLCV frame on an hourly UTC index"""
+    rng = np.random.default_rng(seed)
+    close = 1.1000 + np.cumsum(rng.normal(0, 0.001, periods))
+    open_price = np.concatenate(([close[0]], close[:-1]))
+    high = np.maximum(open_price, close) + np.abs(rng.normal(0, 0.0005, periods))
+    low = np.minimum(open_price, close) - np.abs(rng.normal(0, 0.0005, periods))
+    
+    return pd.DataFrame(
+        {
+            'open': open_price,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': rng.integers(1000, 10000, periods)
+        },
+        index=pd.date_range(start=start, periods=periods, freq='h', tz='UTC')
+    )
+
+class TestIncrementalIndicators:
+    """Incremental indicator updates must match a full recalculation"""
+    
+    @pytest.fixture
+    def sample_data(self):
+        """OHLCV history long enough for every indicator"""
+        return make_ohlcv(400)
+    
+    @pytest.fixture
+    def manager(self):
+        """Signal manager with no cached indicator state"""
+        manager = SignalManager()
+        yield manager
+        manager.close()
+    
+    def test_update_matches_full_calculation(self, sample_data):
+        """init_state followed by update per bar equals calculate_indicators on the extended frame"""
+        split = 300
+        state = technical_analysis.init_state(
+            technical_analysis.calculate_indicators(sample_data.iloc[:split])
+        )
+        full = technical_analysis.calculate_indicators(sample_data)
+        
+        for timestamp, bar in sample_data.iloc[split:].iterrows():
+            values = technical_analysis.update(state, bar)
+            
+            for column in INCREMENTAL_COLUMNS:
+                assert values[column] == pytest.approx(full.at[timestamp, column], rel=1e-6, nan_ok=True), \
+                    f"{column} diverged at {timestamp}"
+        
+        assert state.last_time == sample_data.index[-1]
+    
+    def test_flat_window_recovers(self):
+        """A flat price window leaves the stochastic NaN only while it lasts"""
+        flat = make_ohlcv(500)
+        flat.iloc[300:330, :4] = flat['close'].iloc[300]
+        split = 280
+        state = technical_analysis.init_state(
+            technical_analysis.calculate_indicators(flat.iloc[:split])
+        )
+        full = technical_analysis.calculate_indicators(flat)
+        
+        # %K is undefined once its 14-bar window is flat and recovers a few bars after
+        stoch_k = full['stoch_k'].iloc[split:]
+        assert stoch_k.iloc[:20].notna().all()
+        assert stoch_k.iloc[60:].notna().all()
+        assert full['stoch_d'].iloc[split + 60:].notna().all()
+        
+        for timestamp, bar in flat.iloc[split:].iterrows():
+            values = technical_analysis.update(state, bar)
+            for column in ('stoch_k', 'stoch_d'):
+                assert values[column] == pytest.approx(full.at[timestamp, column], rel=1e-6, nan_ok=True), \
+                    f"{column} diverged at {timestamp}"
+    
+    def test_get_indicators_updates_new_bars(self, manager, sample_data):
+        """A frame extending the cached one is updated incrementally"""
+        manager._get_indicators('EUR_USD_H1', sample_data.iloc[:300])
+        result = manager._get_indicators('EUR_USD_H1', sample_data)
+        expected = technical_analysis.calculate_indicators(sample_data)
+        
+        assert result.index.equals(expected.index)
+        for column in INCREMENTAL_COLUMNS:
+            np.testing.assert_allclose(result[column], expected[column], rtol=1e-6, err_msg=column)
+        assert manager.indicator_states['EUR_USD_H1'].last_time == sample_data.index[-1]
+    
+    def test_cold_start_without_indicators(self, manager, sample_data):
+        """Too little history for indicators drops any cached state"""
+        manager._get_indicators('EUR_USD_H1', sample_data)
+        
+        short = sample_data.iloc[:technical_analysis.required_periods - 1]
+        result = manager._get_indicators('EUR_USD_H1', short)
+        
+        assert 'rsi' not in result.columns
+        assert 'EUR_USD_H1' not in manager.indicator_states
+        assert 'EUR_USD_H1' not in manager.indicator_frames
+    
+    def test_gap_recalculates(self, manager, sample_data):
+        """A frame that no longer contains the last processed bar is recalculated in full"""
+        manager._get_indicators('EUR_USD_H1', sample_data.iloc[:250])
+        
+        # History resumes after bar 250, so the cached last_time is missing
+        later = make_ohlcv(300, start=sample_data.index[260], seed=7)
+        assert manager.indicator_states['EUR_USD_H1'].last_time not in later.index
+        
+        result = manager._get_indicators('EUR_USD_H1', later)
+        expected = technical_analysis.calculate_indicators(later)
+        
+        pd.testing.assert_frame_equal(result, expected)
+        assert manager.indicator_states['EUR_USD_H1'].last_time == later.index[-1]
+    
+    def test_revised_last_bar_recalculates(self, manager, sample_data):
+        """A changed close on the last processed bar rebuilds the state from scratch"""
+        manager._get_indicators('EUR_USD_H1', sample_data.iloc[:300])
+        
+        revised = sample_data.copy()
+        revised.iloc[299, revised.columns.get_loc('close')] += 0.002
+        result = manager._get_indicators('EUR_USD_H1', revised)
+        expected = technical_analysis.calculate_indicators(revised)
+        
+        pd.testing.assert_frame_equal(result, expected)
+        assert manager.indicator_states['EUR_USD_H1'].last_time == revised.index[-1]
+    
+    def test_concurrent_updates_share_state_safely(self, manager, sample_data):
+        """Overlapping passes over the same key still match a full calculation"""
+        manager._get_indicators('EUR_USD_H1', sample_data.iloc[:300])
+        
+        frames = [sample_data.iloc[:end] for end in range(301, 401)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda df: manager._get_indicators('EUR_USD_H1', df), frames * 2))
+        
+        result = manager._get_indicators('EUR_USD_H1', sample_data)
+        expected = technical_analysis.calculate_indicators(sample_data)
+        for column in INCREMENTAL_COLUMNS:
+            np.testing.assert_allclose(result[column], expected[column], rtol=1e-6, err_msg=column)
+
+if __name__ == "__main__":
+    pytest.main([__file__])